@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+🦈 SHARK - Benchmark de latência por comando
+Mede prompt, banner, config e --help (frio e quente) e detalha cada fase
+prompt e banner passam pelo shark_fast.py, a entrada que o shell usa sem o daemon
+
+Uso:
+  python benchmarks/bench_cli.py                      Roda e imprime o resumo
+  python benchmarks/bench_cli.py -o results.json      Grava os resultados em JSON
+  python benchmarks/bench_cli.py --baseline base.json Compara com um baseline salvo
+  python benchmarks/bench_cli.py --save-baseline base.json
+"""
+
+import sys
+import json
+import time
+import shutil
+import argparse
+import subprocess
+from pathlib import Path
+
+import benchlib
+
+COMMANDS = ["prompt", "banner", "config", "--help"]
+FAST_SCRIPT = benchlib.ROOT_DIR / "shark_fast.py"
+PHASES = ["import", "enable_windows_ansi", "config_load", "authenticate", "render", "write"]
+
+# Orçamento de latência (ms, mediana do processo completo com caches quentes)
+BUDGETS = {"prompt": 25.0}
+
+# Executado em um processo novo: cronometra cada fase do caminho que main() percorre
+PROBE = r'''
+import sys, time, json
+clock = time.perf_counter
+cmd, root, out = sys.argv[1:4]
+sys.path.insert(0, root)
+phases = {}
+
+t = clock(); import shark; phases["import"] = clock() - t
+t = clock(); shark.enable_windows_ansi(); phases["enable_windows_ansi"] = clock() - t
+
+if cmd in shark.FAST_COMMANDS:
+    t = clock()
+    snapshot = shark.Config.snapshot()
+    config = snapshot["config"]
+    phases["config_load"] = clock() - t
+
+    t = clock()
+    locked = config.get("password_protected", False) and not shark.Security.has_valid_ticket()
+    phases["authenticate"] = clock() - t
+
+    t = clock(); data = shark.FAST_COMMANDS[cmd](snapshot); phases["render"] = clock() - t
+    t = clock(); shark.write_output(data); phases["write"] = clock() - t
+else:
+    t = clock()
+    app = shark.Shark()
+    config = app.config
+    phases["config_load"] = clock() - t
+
+    # Sem prompt interativo: mede a verificação do ticket que authenticate() faz primeiro
+    t = clock()
+    unlocked = not config.get("password_protected", False) or shark.Security.has_valid_ticket()
+    phases["authenticate"] = clock() - t
+
+    t = clock()
+    text = json.dumps(config, indent=2) if cmd == "config" else shark.help_text()
+    phases["render"] = clock() - t
+
+    t = clock(); print(text); sys.stdout.flush(); phases["write"] = clock() - t
+
+with open(out, "w") as f:
+    json.dump(phases, f)
+'''
+
+
+def cache_dirs(env):
+    """Diretórios que um início frio precisa apagar (cache do shark e bytecode)"""
+    output = subprocess.check_output(
+        [sys.executable, "-c", "import sys; sys.path.insert(0, sys.argv[1]); import shark; print(shark.CACHE_DIR)",
+         str(benchlib.ROOT_DIR)],
+        env=env, stdin=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    return [Path(output.decode().strip()), Path(env["PYTHONPYCACHEPREFIX"])]
+
+
+def make_cold(dirs):
+    """Remove caches: o próximo processo reconstrói snapshot, banner e bytecode"""
+    for path in dirs:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def command_line(cmd):
+    """Processo medido: prompt/banner pela entrada rápida, o resto pelo shark.py"""
+    if cmd in ("prompt", "banner"):
+        return [sys.executable, "-S", str(FAST_SCRIPT), cmd]
+    return [sys.executable, str(benchlib.SHARK_SCRIPT), cmd]
+
+
+def time_process(cmd, env, cwd):
+    """Tempo de parede (ms) de um processo completo do comando"""
+    start = time.perf_counter()
+    subprocess.run(
+        command_line(cmd),
+        env=env, cwd=cwd, stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def time_phases(cmd, env, cwd, out):
+    """Tempo de cada fase (ms) medido dentro do processo"""
+    subprocess.run(
+        [sys.executable, "-c", PROBE, cmd, str(benchlib.ROOT_DIR), str(out)],
+        env=env, cwd=cwd, stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True,
+    )
+    with open(out) as f:
+        return {name: value * 1000 for name, value in json.load(f).items()}
+
+
+def bench_command(cmd, runs, env, home, dirs):
+    """Roda um comando frio e quente, retornando resumo de parede e fases"""
+    out = home / "phases.json"
+    result = {}
+
+    for mode in ("cold", "warm"):
+        wall = []
+        phases = {name: [] for name in PHASES}
+
+        if mode == "warm":
+            # Aquecimento: popula caches antes de medir
+            time_process(cmd, env, home)
+
+        for _ in range(runs):
+            if mode == "cold":
+                make_cold(dirs)
+            wall.append(time_process(cmd, env, home))
+
+            if mode == "cold":
+                make_cold(dirs)
+            for name, value in time_phases(cmd, env, home, out).items():
+                phases[name].append(value)
+
+        result[mode] = {
+            "wall_ms": benchlib.summarize(wall),
+            "phases_ms": {name: benchlib.summarize(values) for name, values in phases.items()},
+        }
+
+    return result
+
+
+def print_summary(results):
+    """Tabela com medianas (ms)"""
+    header = f"{'comando':10} {'modo':5} {'parede':>8} " + " ".join(f"{name[:11]:>11}" for name in PHASES)
+    print(header)
+    print("─" * len(header))
+    for cmd in results["commands"]:
+        for mode, data in results["commands"][cmd].items():
+            cells = " ".join(f"{data['phases_ms'][name]['median']:11.3f}" for name in PHASES)
+            print(f"{cmd:10} {mode:5} {data['wall_ms']['median']:8.2f} {cells}")
+
+
+def check_budgets(results, budgets):
+    """Retorna os comandos que estouraram o orçamento (mediana quente)"""
+    failures = []
+    for cmd, limit in budgets.items():
+        if limit <= 0 or cmd not in results["commands"]:
+            continue
+        median = results["commands"][cmd]["warm"]["wall_ms"]["median"]
+        status = "ok" if median <= limit else "ESTOUROU"
+        print(f"orçamento {cmd}: {median:.2f} ms / {limit:.2f} ms  {status}")
+        if median > limit:
+            failures.append(cmd)
+    return failures
+
+
+def parse_budget(value):
+    """Converte 'prompt=25' em ('prompt', 25.0)"""
+    name, _, limit = value.partition("=")
+    try:
+        return name, float(limit)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"orçamento inválido: {value} (use comando=ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de latência dos comandos do shark.py")
+    parser.add_argument("-n", "--runs", type=int, default=20, help="execuções por comando e modo")
+    parser.add_argument("-c", "--commands", default=",".join(COMMANDS), help="lista separada por vírgulas")
+    parser.add_argument("-o", "--output", help="grava os resultados em JSON")
+    parser.add_argument("--baseline", help="compara com um JSON salvo anteriormente")
+    parser.add_argument("--save-baseline", metavar="PATH", help="grava os resultados como novo baseline")
+    parser.add_argument("--threshold", type=float, default=0.20, help="regressão tolerada (0.20 = 20%%)")
+    parser.add_argument("--min-delta", type=float, default=0.5, help="diferença mínima em ms para contar regressão")
+    parser.add_argument("--budget", type=parse_budget, action="append", default=[],
+                        help="orçamento comando=ms para a mediana quente (0 desativa)")
+    args = parser.parse_args()
+
+    commands = [cmd.strip() for cmd in args.commands.split(",") if cmd.strip()]
+    budgets = dict(BUDGETS)
+    budgets.update(dict(args.budget))
+
+    results = {"meta": benchlib.metadata(), "commands": {}}
+    results["meta"]["runs"] = args.runs
+
+    with benchlib.isolated_home() as (home, env):
+        env["PYTHONPYCACHEPREFIX"] = str(home / "pycache")
+        # Cria a configuração padrão uma vez; "frio" significa caches vazios, não instalação nova
+        time_process("config", env, home)
+        dirs = cache_dirs(env)
+
+        for cmd in commands:
+            print(f"⏱  {cmd} ({args.runs}x frio + {args.runs}x quente)...", file=sys.stderr)
+            results["commands"][cmd] = bench_command(cmd, args.runs, env, home, dirs)
+
+    print_summary(results)
+    failures = check_budgets(results, budgets)
+
+    if args.output:
+        benchlib.save_results(args.output, results)
+    if args.save_baseline:
+        benchlib.save_results(args.save_baseline, results)
+
+    regressions = []
+    if args.baseline:
+        rows, regressions = benchlib.compare(results, benchlib.load_results(args.baseline),
+                                               args.threshold, args.min_delta)
+        benchlib.print_comparison(rows, regressions)
+        if regressions:
+            print(f"\n{len(regressions)} métrica(s) acima de {args.threshold:.0%} do baseline")
+
+    return 1 if failures or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
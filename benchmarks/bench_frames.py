@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+🦈 SHARK - Benchmark do agendador de quadros
+Duração de parede e quadros desenhados de uma animação com render lento:
+laço com time.sleep fixo depois de cada quadro (implementação anterior)
+contra o FrameScheduler com prazos monotônicos, e a CPU gasta pela thread
+do Animations.spinning enquanto o trabalho roda
+
+Uso:
+  python benchmarks/bench_frames.py [--duration 2] [--fps 20] [-o results.json] [--baseline base.json]
+"""
+
+import os
+import sys
+import time
+import argparse
+import contextlib
+
+import benchlib
+
+shark = benchlib.load_shark()
+FrameScheduler = shark.FrameScheduler
+
+# Custo de render+escrita por quadro, em frações do intervalo
+LOADS = {"leve": 0.1, "pesado": 0.6, "sobrecarga": 1.5}
+
+
+def legacy_loop(duration, fps, render):
+    """Como as animações faziam: desenha, dorme um intervalo fixo"""
+    frames = 0
+    start_time = time.time()
+    while time.time() - start_time < duration:
+        render()
+        frames += 1
+        time.sleep(1 / fps)
+    return frames
+
+
+def scheduled_loop(duration, fps, render):
+    for _ in FrameScheduler(fps=fps, duration=duration):
+        render()
+    return FrameScheduler.last.frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do agendador de quadros")
+    parser.add_argument("--duration", type=float, default=2, help="duração de cada animação (s)")
+    parser.add_argument("--fps", type=float, default=20, help="quadros por segundo alvo")
+    parser.add_argument("-o", "--output", help="grava os resultados em JSON")
+    parser.add_argument("--baseline", help="compara com um JSON salvo anteriormente")
+    parser.add_argument("--threshold", type=float, default=0.20, help="regressão tolerada (0.20 = 20%%)")
+    args = parser.parse_args()
+
+    results = {"meta": benchlib.metadata(), "loops": {}}
+    expected = int(args.duration * args.fps)
+
+    print(f"{'laço':10} {'carga':11} {'segundos':>9} {'excesso':>8} {'quadros':>8} {'pulados':>8} {'atrasados':>9}")
+    for load, fraction in LOADS.items():
+        cost = fraction / args.fps
+        render = lambda: time.sleep(cost)
+        for name, loop in (("sleep", legacy_loop), ("scheduler", scheduled_loop)):
+            start = time.monotonic()
+            frames = loop(args.duration, args.fps, render)
+            seconds = time.monotonic() - start
+
+            stats = FrameScheduler.last.stats() if name == "scheduler" else {"dropped": 0, "late": 0}
+            overrun = seconds - args.duration
+            results["loops"][f"{name}.{load}"] = {
+                "overrun_ms": {"median": max(overrun, 0) * 1000},
+                "frames": {"count": frames, "expected": expected, "dropped": stats["dropped"], "late": stats["late"]},
+            }
+            print(f"{name:10} {load:11} {seconds:9.3f} {overrun * 1000:7.0f}ms {frames:8} {stats['dropped']:8} {stats['late']:9}")
+
+    # Spinner em segundo plano: CPU da thread em relação ao tempo de parede
+    results["spinning"] = {}
+    print(f"\n{'spinning':10} {'fps':>5} {'CPU ms':>8} {'% de 1 núcleo':>14}")
+    for fps in (10, 30):
+        # Quadros vão para o devnull (escritas reais, sem bagunçar a tabela)
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            with shark.Animations.spinning("bench", fps=fps) as spinner:
+                time.sleep(args.duration)
+        share = spinner.cpu / args.duration * 100
+        results["spinning"][f"fps{fps}"] = {"cpu_ms": {"median": spinner.cpu * 1000}, "share": {"rate": share}}
+        print(f"{'':10} {fps:5} {spinner.cpu * 1000:8.2f} {share:13.3f}%")
+
+    if args.output:
+        benchlib.save_results(args.output, results)
+
+    if args.baseline:
+        rows, regressions = benchlib.compare(results, benchlib.load_results(args.baseline), args.threshold, min_delta=5)
+        benchlib.print_comparison(rows, regressions)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+🦈 SHARK - Benchmark do motor de gradientes
+Compara o gradiente por caractere (implementação anterior) com a rampa
+pré-calculada + sequências coalescidas: tempo de CPU e bytes gerados, o
+custo de Colors.rgb em cada profundidade de cor (truecolor, 256, 16), os
+modos 2D de banner (Colors.gradient_2d), as amostras de Palette e
+a roda de matizes (HueWheel)
+
+Uso:
+  python benchmarks/bench_gradient.py [-o results.json] [--baseline base.json]
+"""
+
+import sys
+import argparse
+
+import benchlib
+
+shark = benchlib.load_shark()
+Colors = shark.Colors
+
+RAINBOW = ["#FF0000", "#FF7F00", "#FFFF00", "#00FF00", "#0000FF", "#4B0082", "#9400D3"]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# IMPLEMENTAÇÃO ANTERIOR (referência)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def legacy_gradient(text, start_color, end_color, bold=False):
+    """Gradiente linear: um escape por caractere, concatenação com +="""
+    start_r, start_g, start_b = Colors.hex_to_rgb(start_color)
+    end_r, end_g, end_b = Colors.hex_to_rgb(end_color)
+    result = Colors.BOLD if bold else ""
+    length = len([c for c in text if c not in '\n\r\t'])
+    char_count = 0
+    for char in text:
+        if char in '\n\r\t':
+            result += char
+            continue
+        ratio = char_count / max(length - 1, 1)
+        r = int(start_r + (end_r - start_r) * ratio)
+        g = int(start_g + (end_g - start_g) * ratio)
+        b = int(start_b + (end_b - start_b) * ratio)
+        result += f"{Colors.rgb(r, g, b)}{char}"
+        char_count += 1
+    return result + Colors.RESET
+
+
+def legacy_multi_gradient(text, colors, bold=False):
+    """Multi-gradiente: reconverte os HEX dos extremos a cada caractere"""
+    result = Colors.BOLD if bold else ""
+    length = len([c for c in text if c not in '\n\r\t'])
+    segments = len(colors) - 1
+    chars_per_segment = length / segments
+    char_count = 0
+    for char in text:
+        if char in '\n\r\t':
+            result += char
+            continue
+        segment = min(int(char_count / chars_per_segment), segments - 1)
+        local_ratio = (char_count - segment * chars_per_segment) / chars_per_segment
+        start_r, start_g, start_b = Colors.hex_to_rgb(colors[segment])
+        end_r, end_g, end_b = Colors.hex_to_rgb(colors[segment + 1])
+        r = int(start_r + (end_r - start_r) * local_ratio)
+        g = int(start_g + (end_g - start_g) * local_ratio)
+        b = int(start_b + (end_b - start_b) * local_ratio)
+        result += f"{Colors.rgb(r, g, b)}{char}"
+        char_count += 1
+    return result + Colors.RESET
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CASOS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def cases():
+    """(nome, função anterior, função atual) para cada cenário medido"""
+    banners = "\n".join(shark.Banners.BUILTIN.values())
+    long_text = "The quick brown fox jumps over the lazy shark. " * 200
+    return [
+        ("banner_shark", lambda f: f(shark.Banners.BUILTIN["SHARK"], ["#00BFFF", "#0080FF"], True),
+         legacy_multi_gradient, Colors.multi_gradient),
+        ("banners_all_rainbow", lambda f: f(banners, RAINBOW, True),
+         legacy_multi_gradient, Colors.multi_gradient),
+        ("rainbow_text_10k", lambda f: f(long_text, RAINBOW),
+         legacy_multi_gradient, Colors.multi_gradient),
+        ("linear_text_10k", lambda f: f(long_text, "#FF0000", "#0000FF"),
+         legacy_gradient, Colors.gradient),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do motor de gradientes")
+    parser.add_argument("-o", "--output", help="grava os resultados em JSON")
+    parser.add_argument("--baseline", help="compara com um JSON salvo anteriormente")
+    parser.add_argument("--threshold", type=float, default=0.20, help="regressão tolerada (0.20 = 20%%)")
+    args = parser.parse_args()
+
+    results = {"meta": benchlib.metadata(), "cases": {}}
+
+    print(f"{'caso':22} {'antes µs':>10} {'agora µs':>10} {'ganho':>7} {'bytes antes':>12} {'bytes agora':>12} {'ganho':>7}")
+    for name, call, legacy, current in cases():
+        before = benchlib.timeit(lambda: call(legacy)) * 1e6
+        after = benchlib.timeit(lambda: call(current)) * 1e6
+        bytes_before = len(call(legacy).encode("utf-8"))
+        bytes_after = len(call(current).encode("utf-8"))
+
+        results["cases"][name] = {
+            "time_us": {"median": after, "legacy": before},
+            "bytes": {"median": bytes_after, "legacy": bytes_before},
+        }
+        print(f"{name:22} {before:10.1f} {after:10.1f} {before / after:6.1f}x "
+              f"{bytes_before:12} {bytes_after:12} {bytes_before / bytes_after:6.1f}x")
+
+    # Profundidade de cor: a quantização para 256/16 cores não pode ser mais lenta que truecolor
+    samples = [(i * 7 % 256, i * 13 % 256, i * 29 % 256) for i in range(256)]
+    banner = shark.Banners.BUILTIN["SHARK"]
+    results["depths"] = {}
+    print(f"\n{'profundidade':12} {'rgb() ns':>9} {'banner µs':>10} {'bytes':>7}")
+    for depth in Colors.DEPTHS:
+        Colors.set_depth(depth)
+        Colors.rgb(1, 2, 3)  # monta as tabelas fora da medição
+        per_call = benchlib.timeit(lambda: [Colors.rgb(r, g, b) for r, g, b in samples]) / len(samples) * 1e9
+        render = benchlib.timeit(lambda: Colors.multi_gradient(banner, RAINBOW, True)) * 1e6
+        size = len(Colors.multi_gradient(banner, RAINBOW, True).encode("utf-8"))
+
+        results["depths"][depth] = {
+            "rgb_ns": {"median": per_call},
+            "banner_us": {"median": render},
+            "bytes": {"median": size},
+        }
+        print(f"{depth:12} {per_call:9.0f} {render:10.1f} {size:7}")
+    Colors.set_depth("truecolor")
+
+    # Modos 2D: as cores saem de uma rampa por coluna/linha/raio, não por caractere
+    art = "\n".join(shark.Banners.BUILTIN.values())
+    results["modes"] = {}
+    print(f"\n{'modo':12} {'µs':>9} {'bytes':>7}")
+    for mode in Colors.GRADIENT_MODES:
+        render = benchlib.timeit(lambda: Colors.gradient_2d(art, RAINBOW, mode, True)) * 1e6
+        size = len(Colors.gradient_2d(art, RAINBOW, mode, True).encode("utf-8"))
+
+        results["modes"][mode] = {
+            "time_us": {"median": render},
+            "bytes": {"median": size},
+        }
+        print(f"{mode:12} {render:9.1f} {size:7}")
+
+    # Amostras do menu de temas: reinterpolando a cada desenho vs. escapes compilados
+    names = list(Colors.PALETTES)
+    for name in names:
+        shark.Palette.get(name).compile()  # só em memória: o benchmark não grava no THEMES_DIR real
+    per_draw = {
+        "multi_gradient": benchlib.timeit(lambda: [Colors.multi_gradient("█" * 10, Colors.PALETTES[name]) for name in names]),
+        "palette": benchlib.timeit(lambda: [shark.Palette.get(name).swatch(10) for name in names]),
+    }
+    results["palettes"] = {name: {"time_us": {"median": seconds * 1e6}} for name, seconds in per_draw.items()}
+    print(f"\n{'amostras (15)':16} {'µs':>9}")
+    for name, seconds in per_draw.items():
+        print(f"{name:16} {seconds * 1e6:9.1f}")
+
+    # Matizes: conversão HSV a cada quadro (color_cycle anterior) vs. consulta à HueWheel
+    hue_wheel = shark.HueWheel
+    per_frame = {
+        "hsv_to_rgb": benchlib.timeit(lambda: [Colors.rgb(*hue_wheel.hsv_to_rgb(hue)) for hue in range(0, 360, 10)]),
+        "hue_wheel": benchlib.timeit(lambda: [hue_wheel.escape(hue) for hue in range(0, 360, 10)]),
+        "rainbow_stops": benchlib.timeit(lambda: Colors.multi_gradient(art, RAINBOW, True)),
+        "rainbow_wheel": benchlib.timeit(lambda: Colors.rainbow(art, True)),
+    }
+    results["hues"] = {name: {"time_us": {"median": seconds * 1e6}} for name, seconds in per_frame.items()}
+    print(f"\n{'matizes':16} {'µs':>9}")
+    for name, seconds in per_frame.items():
+        print(f"{name:16} {seconds * 1e6:9.1f}")
+
+    if args.output:
+        benchlib.save_results(args.output, results)
+
+    if args.baseline:
+        rows, regressions = benchlib.compare(results, benchlib.load_results(args.baseline), args.threshold)
+        benchlib.print_comparison(rows, regressions)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
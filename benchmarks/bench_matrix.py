@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+🦈 SHARK - Benchmark da chuva Matrix
+Bytes e CPU por quadro: implementação anterior (uma linha nova por quadro,
+escape 24-bit por célula acesa, random por célula), a mesma simulação do
+MatrixRain redesenhando a tela inteira e o MatrixRain de verdade (a tela
+rola e só as células novas são escritas)
+
+Uso:
+  python benchmarks/bench_matrix.py [--frames 200] [-o results.json] [--baseline base.json]
+"""
+
+import sys
+import time
+import random
+import argparse
+
+import benchlib
+
+shark = benchlib.load_shark()
+Colors = shark.Colors
+MatrixRain = shark.MatrixRain
+
+SIZES = {"80x24": (80, 24), "160x50": (160, 50), "300x80": (300, 80)}
+
+
+def legacy_frames(width):
+    """Quadros do matrix_rain anterior (sem o sleep)"""
+    chars = "ｱｲｳｴｵｶｷｸｹｺｻｼｽｾｿﾀﾁﾂﾃﾄﾅﾆﾇﾈﾉﾊﾋﾌﾍﾎﾏﾐﾑﾒﾓﾔﾕﾖﾗﾘﾙﾚﾛﾜﾝ0123456789"
+    columns = [0] * width
+    while True:
+        line = ""
+        for i in range(width):
+            if random.random() < 0.1:
+                columns[i] = random.randint(5, 15)
+
+            if columns[i] > 0:
+                char = random.choice(chars)
+                brightness = min(255, columns[i] * 25)
+                line += f"{Colors.rgb(0, brightness, 0)}{char}"
+                columns[i] -= 1
+            else:
+                line += " "
+        yield line + Colors.RESET + "\n"
+
+
+def repaint_frames(rain):
+    """Simulação do MatrixRain, mas redesenhando todas as células a cada quadro"""
+    codes = rain.codes
+    while True:
+        rain.step()
+        rain.dirty = []
+        out = ["\033[H"]
+        for levels, chars in rain.rows:
+            for x, level in enumerate(levels):
+                out.append(codes[level] + chars[x] if level else " ")
+        yield "".join(out)
+
+
+def measure(frames, count):
+    """(µs de CPU, bytes) médios por quadro, depois de aquecer"""
+    for _ in range(20):
+        next(frames)
+    size = 0
+    start = time.process_time()
+    for _ in range(count):
+        size += len(next(frames).encode("utf-8"))
+    return (time.process_time() - start) / count * 1e6, size / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da chuva Matrix")
+    parser.add_argument("--frames", type=int, default=200, help="quadros medidos por caso")
+    parser.add_argument("-o", "--output", help="grava os resultados em JSON")
+    parser.add_argument("--baseline", help="compara com um JSON salvo anteriormente")
+    parser.add_argument("--threshold", type=float, default=0.20, help="regressão tolerada (0.20 = 20%%)")
+    args = parser.parse_args()
+
+    random.seed(1)
+    results = {"meta": benchlib.metadata(), "frames": {}}
+
+    print(f"{'tamanho':9} {'motor':8} {'µs CPU':>9} {'bytes':>8} {'KB/s a 20fps':>13}")
+    for name, (width, height) in SIZES.items():
+        rain = MatrixRain(width, height, seed=1)
+        engines = {
+            "anterior": legacy_frames(width),
+            "repaint": repaint_frames(MatrixRain(width, height, seed=1)),
+            "diff": iter(rain.frame, None),
+        }
+        for engine, frames in engines.items():
+            cpu, size = measure(frames, args.frames)
+            results["frames"][f"{name}.{engine}"] = {
+                "cpu_us": {"median": cpu},
+                "bytes": {"median": size},
+            }
+            print(f"{name:9} {engine:8} {cpu:9.0f} {size:8.0f} {size * 20 / 1024:13.1f}")
+
+    if args.output:
+        benchlib.save_results(args.output, results)
+
+    if args.baseline:
+        rows, regressions = benchlib.compare(results, benchlib.load_results(args.baseline), args.threshold)
+        benchlib.print_comparison(rows, regressions)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+🦈 SHARK - Benchmark do progresso
+Custo por chamada de ProgressTask.advance() numa thread e num pool de 32
+threads, com o MultiProgress redesenhando (saída descartada), a CPU da
+thread de render e o custo por item do shark.track() comparado com o laço puro
+
+Uso:
+  python benchmarks/bench_progress.py [--calls 1000000] [-o results.json] [--baseline base.json]
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+import benchlib
+
+shark = benchlib.load_shark()
+MultiProgress = shark.MultiProgress
+
+
+def run_pool(workers, calls):
+    """(ns por advance, ms de CPU do render) com `workers` threads somando `calls` no total"""
+    per_worker = calls // workers
+
+    def work(index):
+        with progress.add(f"tarefa {index}", total=per_worker) as task:
+            advance = task.advance
+            for _ in range(per_worker):
+                advance()
+
+    with MultiProgress(fps=10) as progress:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(workers) as pool:
+            list(pool.map(work, range(workers)))
+        seconds = time.perf_counter() - start
+    assert sum(task.count for task in progress.tasks) == per_worker * workers
+    return seconds / (per_worker * workers) * 1e9, progress.cpu * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do progresso")
+    parser.add_argument("--calls", type=int, default=1000000, help="chamadas de advance() por caso")
+    parser.add_argument("-o", "--output", help="grava os resultados em JSON")
+    parser.add_argument("--baseline", help="compara com um JSON salvo anteriormente")
+    parser.add_argument("--threshold", type=float, default=0.20, help="regressão tolerada (0.20 = 20%%)")
+    args = parser.parse_args()
+
+    results = {"meta": benchlib.metadata(), "advance": {}, "track": {}}
+
+    # Referência: o laço vazio com a mesma contagem
+    def empty():
+        for _ in range(args.calls):
+            pass
+    loop_ns = benchlib.timeit(empty, repeat=3, number=1) / args.calls * 1e9
+
+    stdout = sys.stdout
+    print(f"{'caso':16} {'ns/advance':>11} {'render CPU ms':>14}")
+    print(f"{'laço vazio':16} {loop_ns:11.1f} {'-':>14}")
+    for workers in (1, 32):
+        with open(os.devnull, "w", encoding="utf-8") as devnull:
+            sys.stdout = devnull
+            try:
+                per_call, render_ms = run_pool(workers, args.calls)
+            finally:
+                sys.stdout = stdout
+        results["advance"][f"threads{workers}"] = {
+            "ns_per_call": {"median": per_call},
+            "render_cpu_ms": {"median": render_ms},
+        }
+        print(f"{f'{workers} threads':16} {per_call:11.1f} {render_ms:14.2f}")
+
+    # track(): custo extra por item entre redesenhos (a saída vai para /dev/null)
+    items = range(args.calls)
+
+    def plain():
+        for _ in items:
+            pass
+
+    def tracked():
+        for _ in shark.track(items):
+            pass
+
+    print(f"\n{'track':16} {'ns/item':>11} {'extra ns':>9}")
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        sys.stdout = devnull
+        try:
+            per_item = {name: benchlib.timeit(func, repeat=3, number=1) / args.calls * 1e9
+                        for name, func in (("laço puro", plain), ("track", tracked))}
+        finally:
+            sys.stdout = stdout
+    overhead = per_item["track"] - per_item["laço puro"]
+    results["track"] = {"ns_per_item": {"median": per_item["track"]}, "overhead_ns": {"median": overhead}}
+    for name, nanoseconds in per_item.items():
+        print(f"{name:16} {nanoseconds:11.1f} {nanoseconds - per_item['laço puro']:9.1f}")
+
+    if args.output:
+        benchlib.save_results(args.output, results)
+
+    if args.baseline:
+        rows, regressions = benchlib.compare(results, benchlib.load_results(args.baseline), args.threshold)
+        benchlib.print_comparison(rows, regressions)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
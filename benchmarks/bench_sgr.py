@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+🦈 SHARK - Benchmark do otimizador de SGR
+Bytes economizados pelo SGROptimizer sobre os banners de Banners.BUILTIN,
+renderizados nos estilos que o shark e os scripts dos usuários produzem
+
+Uso:
+  python benchmarks/bench_sgr.py [-o results.json] [--baseline base.json]
+"""
+
+import sys
+import argparse
+
+import benchlib
+from bench_gradient import legacy_multi_gradient
+
+shark = benchlib.load_shark()
+Colors = shark.Colors
+SGROptimizer = shark.SGROptimizer
+
+BANNER_COLORS = ["#00BFFF", "#0080FF"]
+
+
+def typing_style(text):
+    """Como Animations.typing_effect: cor + caractere + reset a cada caractere"""
+    color = Colors.hex("#00FF88")
+    return "".join(f"{color}{char}{Colors.RESET}" for char in text)
+
+
+def menu_style(text):
+    """Como os menus: cada linha com negrito + cor e reset no fim"""
+    return "\n".join(f"{Colors.BOLD}{Colors.CYAN}{line}{Colors.RESET}" for line in text.split("\n"))
+
+
+STYLES = {
+    "legacy_gradient": lambda text: legacy_multi_gradient(text, BANNER_COLORS, True),
+    "gradient": lambda text: Colors.multi_gradient(text, BANNER_COLORS, True),
+    "rainbow": lambda text: Colors.rainbow(text, True),
+    "typing": typing_style,
+    "menu_lines": menu_style,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do otimizador de SGR")
+    parser.add_argument("-o", "--output", help="grava os resultados em JSON")
+    parser.add_argument("--baseline", help="compara com um JSON salvo anteriormente")
+    parser.add_argument("--threshold", type=float, default=0.20, help="regressão tolerada (0.20 = 20%%)")
+    args = parser.parse_args()
+
+    banners = list(shark.Banners.BUILTIN.values())
+    results = {"meta": benchlib.metadata(), "styles": {}}
+
+    print(f"{'estilo':16} {'modo':8} {'bytes antes':>12} {'bytes depois':>12} {'economia':>9} {'µs/KB':>8}")
+    for style, render in STYLES.items():
+        rendered = [render(banner) for banner in banners]
+        before = sum(len(text.encode("utf-8")) for text in rendered)
+
+        for mode, assume_reset in (("herdado", False), ("resetado", True)):
+            optimized = [SGROptimizer.optimize(text, assume_reset) for text in rendered]
+            after = sum(len(text.encode("utf-8")) for text in optimized)
+            seconds = benchlib.timeit(lambda: [SGROptimizer.optimize(text, assume_reset) for text in rendered])
+            per_kb = seconds * 1e6 / (before / 1024)
+
+            results["styles"][f"{style}.{mode}"] = {
+                "bytes": {"median": after, "before": before, "saved": before - after},
+                "us_per_kb": {"median": per_kb},
+            }
+            print(f"{style:16} {mode:8} {before:12} {after:12} {1 - after / before:8.1%} {per_kb:8.1f}")
+
+    if args.output:
+        benchlib.save_results(args.output, results)
+
+    if args.baseline:
+        rows, regressions = benchlib.compare(results, benchlib.load_results(args.baseline), args.threshold)
+        benchlib.print_comparison(rows, regressions)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+🦈 SHARK - Benchmark dos filtros de stdin
+Vazão (MB/s) do StreamColorizer e do Highlighter dentro do processo e do
+pipeline completo 'shark.py rainbow -' / 'gradient -' / 'highlight'
+comparado com um 'cat' do mesmo arquivo
+
+Uso:
+  python benchmarks/bench_stream.py [--size 32] [-o results.json] [--baseline base.json]
+  python benchmarks/bench_stream.py --size 2048 -n 1     Log de vários GB
+"""
+
+import sys
+import time
+import argparse
+import subprocess
+
+import benchlib
+
+shark = benchlib.load_shark()
+Colors = shark.Colors
+StreamColorizer = shark.StreamColorizer
+Highlighter = shark.Highlighter
+
+LINES = [
+    "2024-05-01 12:00:00,123 INFO  worker[42] processed request /api/v1/items in 12ms\n",
+    "2024-05-01 12:00:00,456 WARN  cache miss for key=user:1337 (fallback to db)\n",
+    "2024-05-01 12:00:01,002 ERROR upstream timeout after 3000ms: connection reset by peer\n",
+    "    at com.example.Service.call(Service.java:87)\n",
+    "\n",
+]
+
+PIPELINES = {
+    "rainbow": ["rainbow", "-"],
+    "rainbow_lines": ["rainbow", "-", "--lines"],
+    "gradient": ["gradient", "-", "#00BFFF", "#0080FF"],
+    "highlight": ["highlight"],
+}
+
+
+def make_log(path, megabytes):
+    """Arquivo de log sintético com o tamanho pedido"""
+    block = "".join(LINES * 200).encode("utf-8")
+    with open(path, "wb") as f:
+        for _ in range(int(megabytes * 1024 * 1024 / len(block)) + 1):
+            f.write(block)
+    return path.stat().st_size
+
+
+def time_pipeline(args, path, env):
+    """Segundos de parede para filtrar o arquivo inteiro para /dev/null"""
+    with open(path, "rb") as source:
+        start = time.perf_counter()
+        subprocess.run(args, stdin=source, stdout=subprocess.DEVNULL, env=env, check=True)
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dos filtros de stdin")
+    parser.add_argument("--size", type=float, default=32, help="tamanho do log de teste (MB)")
+    parser.add_argument("-n", "--runs", type=int, default=3, help="execuções por pipeline (melhor tempo)")
+    parser.add_argument("-o", "--output", help="grava os resultados em JSON")
+    parser.add_argument("--baseline", help="compara com um JSON salvo anteriormente")
+    parser.add_argument("--threshold", type=float, default=0.20, help="regressão tolerada (0.20 = 20%%)")
+    args = parser.parse_args()
+
+    results = {"meta": benchlib.metadata(), "feed": {}, "pipeline": {}}
+    results["meta"]["size_mb"] = args.size
+
+    # Dentro do processo: só o feed(), em blocos do tamanho que o pipe entrega
+    text = "".join(LINES * 2000)
+    chunks = [text[i:i + StreamColorizer.CHUNK_SIZE] for i in range(0, len(text), StreamColorizer.CHUNK_SIZE)]
+    print(f"{'feed':22} {'profundidade':12} {'MB/s':>8}")
+    for depth in ("truecolor", "256"):
+        Colors.set_depth(depth)
+        for name, per_line in (("periodic", False), ("lines", True)):
+            def run():
+                colorizer = StreamColorizer(Colors.RAINBOW, per_line=per_line, width=80)
+                for chunk in chunks:
+                    colorizer.feed(chunk)
+            rate = len(text.encode("utf-8")) / benchlib.timeit(run, repeat=3) / 1e6
+            # Comparação com baseline usa µs/MB (menor é melhor)
+            results["feed"][f"{name}.{depth}"] = {"us_per_mb": {"median": 1e6 / rate}, "mb_s": {"rate": rate}}
+            print(f"{name:22} {depth:12} {rate:8.1f}")
+    Colors.set_depth("truecolor")
+
+    # Highlighter com as regras padrão: com o pré-filtro de literais e sem ele
+    for name, prefilter in (("highlight", True), ("highlight_sem_filtro", False)):
+        def run():
+            highlighter = Highlighter()
+            if not prefilter:
+                highlighter.prefilter, highlighter.owners = highlighter.combined, None
+            for chunk in chunks:
+                highlighter.feed(chunk)
+            highlighter.finish()
+        rate = len(text.encode("utf-8")) / benchlib.timeit(run, repeat=3) / 1e6
+        results["feed"][name] = {"us_per_mb": {"median": 1e6 / rate}, "mb_s": {"rate": rate}}
+        print(f"{name:22} {'truecolor':12} {rate:8.1f}")
+
+    # Pipeline completo: leitura do pipe, decodificação, cor, escrita
+    with benchlib.isolated_home() as (home, env):
+        env["COLORTERM"] = "truecolor"
+        path = home / "sample.log"
+        size = make_log(path, args.size) / 1e6
+        subprocess.run([sys.executable, str(benchlib.SHARK_SCRIPT), "config"],
+                       env=env, stdout=subprocess.DEVNULL, check=True)
+
+        commands = {"cat": ["cat"]}
+        commands.update({name: [sys.executable, str(benchlib.SHARK_SCRIPT)] + argv
+                         for name, argv in PIPELINES.items()})
+
+        print(f"\n{'pipeline':22} {'segundos':>9} {'MB/s':>8} {'vs cat':>8}")
+        baseline = None
+        for name, argv in commands.items():
+            seconds = min(time_pipeline(argv, path, env) for _ in range(args.runs))
+            baseline = baseline or seconds
+            results["pipeline"][name] = {"seconds": {"median": seconds}, "mb_s": {"rate": size / seconds}}
+            print(f"{name:22} {seconds:9.2f} {size / seconds:8.1f} {seconds / baseline:7.1f}x")
+
+    if args.output:
+        benchlib.save_results(args.output, results)
+
+    if args.baseline:
+        rows, regressions = benchlib.compare(results, benchlib.load_results(args.baseline), args.threshold)
+        benchlib.print_comparison(rows, regressions)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+🦈 SHARK - Utilitários compartilhados dos benchmarks
+Estatísticas, ambiente isolado e comparação com baseline salvo em JSON
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import tempfile
+import contextlib
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SHARK_SCRIPT = ROOT_DIR / "shark.py"
+
+
+def load_shark():
+    """Importa o shark.py da raiz do repositório"""
+    if str(ROOT_DIR) not in sys.path:
+        sys.path.insert(0, str(ROOT_DIR))
+    import shark
+    return shark
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ESTATÍSTICAS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def percentile(samples, fraction):
+    """Percentil por interpolação linear"""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(samples):
+    """Resumo de uma série de tempos (mesma unidade da entrada)"""
+    return {
+        "runs": len(samples),
+        "min": min(samples),
+        "median": percentile(samples, 0.5),
+        "p90": percentile(samples, 0.9),
+        "max": max(samples),
+        "mean": sum(samples) / len(samples),
+    }
+
+
+def timeit(func, repeat=5, number=None, min_time=0.2):
+    """Mede func() e retorna o melhor tempo por chamada (segundos)"""
+    if number is None:
+        number = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            if time.perf_counter() - start >= min_time / 10 or number >= 1 << 20:
+                break
+            number *= 2
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# AMBIENTE ISOLADO
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@contextlib.contextmanager
+def isolated_home():
+    """HOME/XDG temporários: o benchmark nunca toca na configuração real do usuário"""
+    home = Path(tempfile.mkdtemp(prefix="shark-bench-"))
+    env = os.environ.copy()
+    env.update({
+        "HOME": str(home),
+        "USERPROFILE": str(home),
+        "APPDATA": str(home / "AppData"),
+        "XDG_CACHE_HOME": str(home / ".cache"),
+        "XDG_RUNTIME_DIR": str(home / "run"),
+    })
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    (home / "run").mkdir()
+    try:
+        yield home, env
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RESULTADOS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def metadata():
+    """Informações do ambiente, gravadas junto com os resultados"""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def save_results(path, results):
+    """Grava os resultados em JSON"""
+    Path(path).write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def load_results(path):
+    """Lê resultados (ou baseline) em JSON"""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def flatten(results, prefix=""):
+    """Achata {"a": {"b": {"median": x}}} em {"a.b": x} (apenas medianas)"""
+    flat = {}
+    for key, value in results.items():
+        if key == "meta" or not isinstance(value, dict):
+            continue
+        name = f"{prefix}{key}"
+        if "median" in value:
+            flat[name] = value["median"]
+        else:
+            flat.update(flatten(value, name + "."))
+    return flat
+
+
+def compare(results, baseline, threshold=0.20, min_delta=0.0):
+    """Compara medianas com o baseline. Retorna lista de (métrica, antes, depois, variação)
+
+    Diferenças absolutas abaixo de min_delta não contam como regressão (ruído).
+    """
+    current = flatten(results)
+    previous = flatten(baseline)
+    rows = []
+    for name, after in current.items():
+        before = previous.get(name)
+        if not before:
+            continue
+        rows.append((name, before, after, (after - before) / before))
+    regressions = [row for row in rows if row[3] > threshold and row[2] - row[1] >= min_delta]
+    return rows, regressions
+
+
+def print_comparison(rows, regressions):
+    """Tabela de comparação com o baseline"""
+    print(f"\n{'métrica':48} {'baseline':>10} {'atual':>10} {'variação':>9}")
+    for name, before, after, change in rows:
+        flag = "  <-- REGRESSÃO" if (name, before, after, change) in regressions else ""
+        print(f"{name:48} {before:10.3f} {after:10.3f} {change:+8.1%}{flag}")
@@ -7,14 +7,13 @@ Compatível com: Windows (CMD, PowerShell, VS Code), Linux, Mac, Termux
 
 import os
 import sys
-import json
 import time
-import random
-import hashlib
-import platform
-import threading
+import functools  # já carregado pelo pathlib
+from _thread import get_ident  # módulo embutido: não carrega o threading
 from pathlib import Path
-from datetime import datetime
+
+# Módulos pesados (json, random, hashlib, datetime, platform...) são importados sob
+# demanda: "prompt" e "banner" rodam a cada prompt/terminal e precisam ser rápidos
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # COMPATIBILIDADE WINDOWS - Habilita cores ANSI em todos os terminais
@@ -22,7 +21,7 @@ from datetime import datetime
 
 def enable_windows_ansi():
     """Habilita suporte a cores ANSI no Windows (CMD, PowerShell, VS Code)"""
-    if platform.system().lower() != 'windows':
+    if sys.platform != 'win32':
         return True
     
     try:
@@ -61,27 +60,41 @@ ANSI_ENABLED = enable_windows_ansi()
 # CONFIGURAÇÕES GLOBAIS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-SYSTEM = platform.system().lower()
+def detect_system():
+    """Detecta o sistema operacional (sys.platform evita importar platform)"""
+    if sys.platform == 'win32':
+        return "windows"
+    if sys.platform.startswith('linux'):
+        return "linux"
+    if sys.platform == 'darwin':
+        return "darwin"
+    import platform
+    return platform.system().lower()
+
+SYSTEM = detect_system()
 IS_TERMUX = os.environ.get('TERMUX_VERSION') is not None
 IS_VSCODE = os.environ.get('TERM_PROGRAM') == 'vscode' or 'VSCODE' in os.environ.get('TERM_PROGRAM', '')
 
 # Detecta terminal
-def detect_terminal():
-    """Detecta qual terminal está sendo usado"""
-    if IS_VSCODE:
+def detect_terminal(environ=None):
+    """Detecta qual terminal está sendo usado (environ: ambiente de outro processo, ex.: cliente do daemon)"""
+    if environ is None:
+        environ = os.environ
+    program = environ.get('TERM_PROGRAM', '')
+    if program == 'vscode' or 'VSCODE' in program:
         return "vscode"
-    if IS_TERMUX:
+    if environ.get('TERMUX_VERSION') is not None:
         return "termux"
     if SYSTEM == 'windows':
-        if os.environ.get('WT_SESSION'):
+        if environ.get('WT_SESSION'):
             return "windows-terminal"
-        if os.environ.get('ConEmuANSI'):
+        if environ.get('ConEmuANSI'):
             return "conemu"
-        parent = os.environ.get('PROMPT', '')
+        parent = environ.get('PROMPT', '')
         if '$P$G' in parent:
             return "cmd"
         return "powershell"
-    return os.environ.get('TERM', 'unknown')
+    return environ.get('TERM', 'unknown')
 
 TERMINAL = detect_terminal()
 
@@ -98,6 +111,74 @@ THEMES_DIR = CONFIG_DIR / "themes"
 BANNERS_DIR = CONFIG_DIR / "banners"
 ANIMATIONS_DIR = CONFIG_DIR / "animations"
 CREDENTIALS_FILE = CONFIG_DIR / ".credentials"
+CLIENT_SCRIPT = CONFIG_DIR / "shark_client.py"
+NATIVE_PROMPT_FILES = {
+    "bash": CONFIG_DIR / "prompt.bash",
+    "zsh": CONFIG_DIR / "prompt.zsh",
+}
+
+# Diretório de runtime (socket do daemon) - privado por usuário
+if os.environ.get('XDG_RUNTIME_DIR'):
+    RUNTIME_DIR = Path(os.environ['XDG_RUNTIME_DIR']) / "shark"
+elif hasattr(os, 'getuid'):
+    RUNTIME_DIR = Path("/tmp") / f"shark-{os.getuid()}"
+else:
+    RUNTIME_DIR = CONFIG_DIR / "run"
+
+DAEMON_SOCKET = RUNTIME_DIR / "shark.sock"
+
+
+def private_dir(directory, create=False):
+    """Diretório validado: real (não symlink), do usuário atual e com modo 0700
+    
+    Retorna o Path ou None se não existir ou se a verificação falhar (ex: /tmp/shark-<uid>
+    criado por outro usuário). Com create, cria com mkdir(mode=0o700); chmod só em diretório próprio.
+    """
+    import stat
+    
+    directory = Path(directory)
+    path = str(directory)
+    if create:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            os.mkdir(path, 0o700)
+        except FileExistsError:
+            pass
+    
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode):
+        return None
+    if not hasattr(os, 'getuid'):
+        return directory  # Windows: fica dentro do perfil do usuário
+    if st.st_uid != os.getuid():
+        return None
+    if stat.S_IMODE(st.st_mode) != 0o700:
+        if not create:
+            return None
+        os.chmod(path, 0o700)  # Dono conferido acima (ex: umask tirou bits no mkdir)
+    return directory
+
+# Diretório de cache (pode ser apagado a qualquer momento)
+if IS_TERMUX or SYSTEM == "windows":
+    CACHE_DIR = CONFIG_DIR / "cache"
+else:
+    CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / ".cache") / "shark"
+
+BANNER_CACHE_FILE = CACHE_DIR / "banner.bin"
+PALETTE_CACHE_FILE = THEMES_DIR / "palettes.bin"
+CONFIG_SNAPSHOT_FILE = CACHE_DIR / "config.snapshot"
+
+
+def file_signature(path):
+    """(mtime, tamanho) do arquivo ou None se não existir (validação de caches)"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -182,10 +263,146 @@ class Colors:
         "toxic": ["#00FF00", "#7FFF00", "#ADFF2F", "#DFFF00", "#FFFF00"],
     }
     
+    # Profundidade de cor da saída: "truecolor", "256" ou "16" (ver set_depth)
+    DEPTH = "truecolor"
+    DEPTHS = ("truecolor", "256", "16")
+    
+    # TERMs sem suporte a 256 cores (consoles antigos, seriais, tmux/screen sem -256color)
+    LOW_COLOR_TERMS = ("linux", "ansi", "cons25", "screen", "tmux", "rxvt", "sun", "cygwin", "vt100", "vt102", "vt220")
+    
+    # Paleta ANSI-16 de referência (valores do xterm)
+    ANSI16 = (
+        (0, 0, 0), (205, 0, 0), (0, 205, 0), (205, 205, 0), (0, 0, 238), (205, 0, 205), (0, 205, 205), (229, 229, 229),
+        (127, 127, 127), (255, 0, 0), (0, 255, 0), (255, 255, 0), (92, 92, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255),
+    )
+    CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+    
+    # Tabelas de quantização da profundidade atual (montadas por set_depth)
+    _lut = None
+    
+    # Paradas do arco-íris (rainbow -)
+    RAINBOW = ["#FF0000", "#FF7F00", "#FFFF00", "#00FF00", "#0000FF", "#4B0082", "#9400D3"]
+    
+    # Graus da roda de matizes que o rainbow percorre (vermelho -> violeta)
+    RAINBOW_SPAN = 280
+    
+    # Modos de gradiente para arte em várias linhas (Colors.gradient_2d)
+    GRADIENT_MODES = ("flow", "horizontal", "vertical", "diagonal", "radial")
+    
+    # Entradas por cache de hex/hex_bg/hex_to_rgb/ansi256 (LRU: cores aleatórias não crescem sem limite)
+    CACHE_SIZE = 512
+    
+    @staticmethod
+    def detect_depth(colorterm=None, term=None):
+        """Detecta a profundidade de cor pelo COLORTERM/TERM (padrão: truecolor)"""
+        colorterm = (os.environ.get('COLORTERM', '') if colorterm is None else colorterm).lower()
+        term = (os.environ.get('TERM', '') if term is None else term).lower()
+        
+        if colorterm in ("truecolor", "24bit") or term.endswith("-direct"):
+            return "truecolor"
+        if "256color" in term or term == "xterm":
+            return "256"
+        if term == "dumb" or term.split("-")[0] in Colors.LOW_COLOR_TERMS:
+            return "16"
+        # Sem informação (consoles do Windows, terminais desconhecidos): mantém 24 bits
+        return "truecolor"
+    
+    @staticmethod
+    def resolve_depth(setting=None, colorterm=None, term=None):
+        """Profundidade efetiva: valor da config ("auto" ou ausente = detecção)"""
+        setting = str(setting).lower() if setting else "auto"
+        if setting in Colors.DEPTHS:
+            return setting
+        return Colors.detect_depth(colorterm, term)
+    
+    @staticmethod
+    def set_depth(depth):
+        """Define a profundidade de cor usada por rgb/hex/ansi256/gradientes"""
+        depth = depth if depth in Colors.DEPTHS else "truecolor"
+        if depth != "truecolor" and (Colors._lut is None or Colors._lut[0] != depth):
+            Colors._lut = Colors.build_lut(depth)
+        if depth != Colors.DEPTH:
+            # Os escapes em cache dependem da profundidade
+            for cached in (Colors.hex, Colors.hex_bg, Colors.ansi256):
+                cached.cache_clear()
+        Colors.DEPTH = depth
+        return depth
+    
+    @staticmethod
+    def palette256(code):
+        """RGB de uma cor da paleta ANSI-256"""
+        if code < 16:
+            return Colors.ANSI16[code]
+        if code >= 232:
+            value = 8 + (code - 232) * 10
+            return (value, value, value)
+        code -= 16
+        levels = Colors.CUBE_LEVELS
+        return (levels[code // 36], levels[code // 6 % 6], levels[code % 6])
+    
+    @staticmethod
+    def build_lut(depth):
+        """Tabelas por canal para quantizar RGB em O(1) e escapes prontos por código 256
+        
+        Por canal: contribuição no código do cubo 6x6x6 e erro quadrático até o
+        nível mais próximo; índice do cinza (232-255) pela média. Em 16 cores o
+        escape de cada código 256 já aponta para a cor ANSI-16 mais próxima.
+        """
+        levels = Colors.CUBE_LEVELS
+        # Nível mais próximo do cubo (pontos médios entre 0, 95, 135, 175, 215, 255)
+        cube = [0 if v < 48 else 1 if v < 115 else (v - 35) // 40 for v in range(256)]
+        
+        if depth == "256":
+            fg = tuple(f"\033[38;5;{code}m" for code in range(256))
+            bg = tuple(f"\033[48;5;{code}m" for code in range(256))
+        else:
+            def nearest(color):
+                return min(range(16), key=lambda i: sum((a - b) ** 2 for a, b in zip(color, Colors.ANSI16[i])))
+            
+            to16 = [nearest(Colors.palette256(code)) for code in range(256)]
+            fg = tuple(f"\033[{30 + i if i < 8 else 82 + i}m" for i in to16)
+            bg = tuple(f"\033[{40 + i if i < 8 else 92 + i}m" for i in to16)
+        
+        return (
+            depth,
+            tuple(16 + 36 * i for i in cube),
+            tuple(6 * i for i in cube),
+            tuple(cube),
+            tuple((v - levels[cube[v]]) ** 2 for v in range(256)),
+            tuple(min(23, max(0, (v - 3) // 10)) for v in range(256)),
+            fg,
+            bg,
+        )
+    
+    @staticmethod
+    def to256(r, g, b):
+        """Código ANSI-256 mais próximo (cubo ou rampa de cinza)"""
+        _, cube_r, cube_g, cube_b, error, grey, _, _ = Colors._lut or Colors.build_lut("256")
+        code = cube_r[r] + cube_g[g] + cube_b[b]
+        distance = error[r] + error[g] + error[b]
+        if distance:
+            index = grey[(r + g + b) // 3]
+            value = 8 + 10 * index
+            if (r - value) ** 2 + (g - value) ** 2 + (b - value) ** 2 < distance:
+                code = 232 + index
+        return code
+    
     @staticmethod
     def rgb(r, g, b, bg=False):
         """Cor RGB customizada (16 milhões de cores!)"""
-        return f"\033[{'48' if bg else '38'};2;{r};{g};{b}m"
+        if Colors.DEPTH == "truecolor":
+            return f"\033[{'48' if bg else '38'};2;{r};{g};{b}m"
+        
+        # 256/16 cores: mesmo cálculo de to256, em linha (custo por caractere dos gradientes)
+        _, cube_r, cube_g, cube_b, error, grey, fg_codes, bg_codes = Colors._lut
+        code = cube_r[r] + cube_g[g] + cube_b[b]
+        distance = error[r] + error[g] + error[b]
+        if distance:
+            index = grey[(r + g + b) // 3]
+            value = 8 + 10 * index
+            if (r - value) ** 2 + (g - value) ** 2 + (b - value) ** 2 < distance:
+                code = 232 + index
+        return (bg_codes if bg else fg_codes)[code]
     
     @staticmethod
     def rgb_bg(r, g, b):
@@ -193,11 +410,15 @@ class Colors:
         return Colors.rgb(r, g, b, bg=True)
     
     @staticmethod
+    @functools.lru_cache(maxsize=CACHE_SIZE)
     def ansi256(code, bg=False):
         """Cor do padrão 256 cores"""
-        return f"\033[{'48' if bg else '38'};5;{code}m"
+        if Colors.DEPTH == "16":
+            return Colors._lut[7 if bg else 6][code]
+        return sys.intern(f"\033[{'48' if bg else '38'};5;{code}m")
     
     @staticmethod
+    @functools.lru_cache(maxsize=CACHE_SIZE)
     def hex_to_rgb(hex_color):
         """Converte HEX para RGB"""
         hex_color = hex_color.lstrip('#')
@@ -211,44 +432,138 @@ class Colors:
         return f"#{r:02x}{g:02x}{b:02x}"
     
     @staticmethod
+    @functools.lru_cache(maxsize=CACHE_SIZE)
     def hex(hex_color, bg=False):
         """Cor HEX customizada"""
         r, g, b = Colors.hex_to_rgb(hex_color)
-        return Colors.rgb(r, g, b, bg)
+        return sys.intern(Colors.rgb(r, g, b, bg))
     
     @staticmethod
+    @functools.lru_cache(maxsize=CACHE_SIZE)
     def hex_bg(hex_color):
         """Background HEX"""
         return Colors.hex(hex_color, bg=True)
     
     @staticmethod
-    def gradient(text, start_color, end_color, bold=False):
-        """Aplica gradiente linear de cores no texto"""
-        start_r, start_g, start_b = Colors.hex_to_rgb(start_color)
-        end_r, end_g, end_b = Colors.hex_to_rgb(end_color)
-        
-        result = ""
-        if bold:
-            result += Colors.BOLD
+    def cache_info():
+        """Acertos/falhas/tamanho dos caches de cor (para profiling)"""
+        return {
+            name: getattr(Colors, name).cache_info()._asdict()
+            for name in ("hex", "hex_bg", "hex_to_rgb", "ansi256")
+        }
+    
+    @staticmethod
+    def steps(func, lo, hi):
+        """Índices em [lo, hi) onde uma função escada monotônica muda de valor
+        
+        Busca binária: O(mudanças · log n) avaliações em vez de uma por posição.
+        """
+        steps = []
+        while lo < hi:
+            steps.append(lo)
+            value = func(lo)
+            first, last = lo + 1, hi
+            while first < last:
+                middle = (first + last) // 2
+                if func(middle) == value:
+                    first = middle + 1
+                else:
+                    last = middle
+            lo = first
+        return steps
+    
+    @staticmethod
+    def ramp(colors, length, closed=False):
+        """Pré-calcula a rampa de cores (tuplas RGB) para `length` posições
+        
+        As cores podem ser HEX ou tuplas RGB. closed=True termina exatamente na
+        última cor (gradiente linear); senão segue a divisão por segmentos do
+        multi_gradient. Dentro de um segmento cada canal é monotônico, então
+        rampas longas são montadas por trechos de cor repetida (mesma tupla).
+        """
+        stops = [Colors.hex_to_rgb(c) if isinstance(c, str) else tuple(c) for c in colors]
+        if length <= 0:
+            return []
+        if len(stops) == 1:
+            return [stops[0]] * length
+        
+        segments = len(stops) - 1
+        if closed:
+            span = max(length - 1, 1)
+            segment_of = lambda i: min(int(i / span * segments), segments - 1)
+            ratio_of = lambda i, segment: i / span * segments - segment
+        else:
+            chars_per_segment = length / segments
+            segment_of = lambda i: min(int(i / chars_per_segment), segments - 1)
+            ratio_of = lambda i, segment: (i - segment * chars_per_segment) / chars_per_segment
+        
+        ramp = []
+        bounds = Colors.steps(segment_of, 0, length) + [length]
+        for lo, hi in zip(bounds, bounds[1:]):
+            segment = segment_of(lo)
+            (start_r, start_g, start_b), (end_r, end_g, end_b) = stops[segment], stops[segment + 1]
+            
+            def color(i, segment=segment):
+                ratio = ratio_of(i, segment)
+                return (int(start_r + (end_r - start_r) * ratio),
+                        int(start_g + (end_g - start_g) * ratio),
+                        int(start_b + (end_b - start_b) * ratio))
             
-        visible_chars = [c for c in text if c not in '\n\r\t']
-        length = len(visible_chars)
-        char_count = 0
+            # Poucas cores distintas para muitas posições: busca os degraus; senão calcula direto
+            changes = abs(end_r - start_r) + abs(end_g - start_g) + abs(end_b - start_b)
+            if hi - lo > 8 * changes:
+                runs = Colors.steps(color, lo, hi) + [hi]
+                for first, last in zip(runs, runs[1:]):
+                    ramp.extend([color(first)] * (last - first))
+            else:
+                ramp.extend([color(i) for i in range(lo, hi)])
+        
+        return ramp
+    
+    @staticmethod
+    def paint(text, ramp, bold=False):
+        """Aplica uma rampa pré-calculada ao texto com uma única junção
+        
+        Caracteres seguidos com a mesma cor compartilham uma sequência SGR, e
+        espaços em branco não recebem escape (só avançam a posição na rampa).
+        A rampa pode ter tuplas RGB ou escapes já montados (Palette.escapes).
+        """
+        parts = [Colors.BOLD] if bold else []
+        append = parts.append
+        rgb = Colors.rgb
+        current = None
+        escape = None
+        index = 0
         
         for char in text:
             if char in '\n\r\t':
-                result += char
+                append(char)
                 continue
             
-            ratio = char_count / max(length - 1, 1)
-            r = int(start_r + (end_r - start_r) * ratio)
-            g = int(start_g + (end_g - start_g) * ratio)
-            b = int(start_b + (end_b - start_b) * ratio)
-            
-            result += f"{Colors.rgb(r, g, b)}{char}"
-            char_count += 1
-        
-        return result + Colors.RESET
+            color = ramp[index]
+            index += 1
+            if char != ' ' and color != current:
+                current = color
+                # Em 256/16 cores vizinhos diferentes podem cair no mesmo escape
+                code = color if color.__class__ is str else rgb(*color)
+                if code != escape:
+                    append(code)
+                    escape = code
+            append(char)
+        
+        append(Colors.RESET)
+        return "".join(parts)
+    
+    @staticmethod
+    def visible_length(text):
+        """Quantidade de posições da rampa (tudo exceto quebras de linha e tabs)"""
+        return len(text) - text.count('\n') - text.count('\r') - text.count('\t')
+    
+    @staticmethod
+    def gradient(text, start_color, end_color, bold=False):
+        """Aplica gradiente linear de cores no texto"""
+        ramp = Colors.ramp([start_color, end_color], Colors.visible_length(text), closed=True)
+        return Colors.paint(text, ramp, bold)
     
     @staticmethod
     def multi_gradient(text, colors, bold=False):
@@ -256,51 +571,1330 @@ class Colors:
         if len(colors) < 2:
             return text
         
-        result = ""
-        if bold:
-            result += Colors.BOLD
-        
-        visible_chars = [c for c in text if c not in '\n\r\t']
-        length = len(visible_chars)
-        segments = len(colors) - 1
-        chars_per_segment = length / segments
-        
-        char_count = 0
-        for char in text:
-            if char in '\n\r\t':
-                result += char
-                continue
-            
-            segment = min(int(char_count / chars_per_segment), segments - 1)
-            local_ratio = (char_count - segment * chars_per_segment) / chars_per_segment
-            
-            start_r, start_g, start_b = Colors.hex_to_rgb(colors[segment])
-            end_r, end_g, end_b = Colors.hex_to_rgb(colors[segment + 1])
-            
-            r = int(start_r + (end_r - start_r) * local_ratio)
-            g = int(start_g + (end_g - start_g) * local_ratio)
-            b = int(start_b + (end_b - start_b) * local_ratio)
-            
-            result += f"{Colors.rgb(r, g, b)}{char}"
-            char_count += 1
-        
-        return result + Colors.RESET
+        return Colors.paint(text, Colors.ramp(colors, Colors.visible_length(text)), bold)
+    
+    @staticmethod
+    def gradient_2d(text, colors, mode="horizontal", bold=False):
+        """Gradiente 2D para arte em várias linhas (banners)
+        
+        A cor depende da posição (coluna/linha), não da contagem de caracteres:
+        a rampa é calculada uma vez por coluna, linha, diagonal ou raio
+        (O(largura + altura) cores) e reaproveitada em todas as linhas.
+        "flow" mantém o multi_gradient contínuo sobre o texto.
+        """
+        if len(colors) < 2:
+            return text
+        if mode not in Colors.GRADIENT_MODES or mode == "flow":
+            return Colors.multi_gradient(text, colors, bold)
+        
+        lines = text.split("\n")
+        height = len(lines)
+        width = max(1, max(len(line) for line in lines))
+        
+        if mode == "horizontal":
+            ramp = Colors.ramp(colors, width, closed=True)
+            rows = [ramp[:len(line)] for line in lines]
+        elif mode == "vertical":
+            ramp = Colors.ramp(colors, height, closed=True)
+            rows = [[ramp[row]] * len(line) for row, line in enumerate(lines)]
+        elif mode == "diagonal":
+            # Linhas do terminal têm ~2x a altura de uma coluna: cada linha avança 2 posições
+            ramp = Colors.ramp(colors, width + 2 * (height - 1), closed=True)
+            rows = [ramp[2 * row:2 * row + len(line)] for row, line in enumerate(lines)]
+        else:
+            import math
+            center_x, center_y = (width - 1) / 2, (height - 1) / 2
+            radius = math.sqrt(center_x ** 2 + (2 * center_y) ** 2)
+            ramp = Colors.ramp(colors, int(radius) + 1, closed=True)
+            dx2 = [(column - center_x) ** 2 for column in range(width)]
+            rows = []
+            for row, line in enumerate(lines):
+                dy2 = (2 * (row - center_y)) ** 2
+                rows.append([ramp[int(math.sqrt(dx2[column] + dy2))] for column in range(len(line))])
+        
+        # paint() só avança a rampa nos caracteres visíveis (\r e \t ficam de fora)
+        flat = []
+        for line, row in zip(lines, rows):
+            if '\r' in line or '\t' in line:
+                row = [color for color, char in zip(row, line) if char not in '\r\t']
+            flat.extend(row)
+        return Colors.paint(text, flat, bold)
     
     @staticmethod
     def rainbow(text, bold=False):
-        """Aplica cores do arco-íris"""
-        rainbow_colors = ["#FF0000", "#FF7F00", "#FFFF00", "#00FF00", "#0000FF", "#4B0082", "#9400D3"]
-        return Colors.multi_gradient(text, rainbow_colors, bold)
+        """Aplica cores do arco-íris (matizes da HueWheel, sem interpolação)"""
+        ramp = HueWheel.ramp(Colors.visible_length(text), span=Colors.RAINBOW_SPAN)
+        return Colors.paint(text, ramp, bold)
     
     @staticmethod
     def random_color():
         """Gera uma cor aleatória"""
+        import random
         r = random.randint(0, 255)
         g = random.randint(0, 255)
         b = random.randint(0, 255)
         return Colors.rgb_to_hex(r, g, b)
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# PALETAS COMPILADAS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class Palette:
+    """Paleta compilada: rampas RGB e escapes prontos em resoluções padrão
+    
+    Uma paleta é interpolada uma vez por resolução (Colors.ramp) e os escapes
+    de cada profundidade de cor são montados uma vez; tudo fica em
+    THEMES_DIR/palettes.bin e volta do disco nas próximas execuções. Textos
+    com o tamanho de uma resolução padrão saem direto dos escapes prontos.
+    
+    O arquivo guarda as paletas de Colors.PALETTES e só as CUSTOM_LIMIT listas
+    personalizadas usadas por último, e só é gravado por save() (Config.save e
+    menus interativos): o uso como biblioteca não escreve nada no disco.
+    
+        Palette.get("ocean").swatch(16)
+        Palette.get(["#FF0000", "#0000FF"]).paint("texto")
+    """
+    
+    # Larguras das amostras dos menus (10, 16) e tamanhos comuns de gradiente
+    RESOLUTIONS = (10, 16, 32, 64, 128, 256)
+    VERSION = 1  # incrementar ao mudar Colors.ramp/rgb ou a estrutura do arquivo
+    CUSTOM_LIMIT = 8  # listas de cores fora de Colors.PALETTES guardadas (as usadas por último)
+    
+    _store = None  # {cores: {"ramps": {n: [rgb]}, "escapes": {profundidade: {n: [escape]}}}}, da mais antiga à mais recente
+    _dirty = False
+    _instances = {}
+    
+    def __init__(self, colors, name=None):
+        self.colors = tuple(colors)
+        self.name = name
+        
+        # Reinserida no fim: a ordem do dicionário é a ordem de uso (LRU)
+        store = Palette.store()
+        entry = store.pop(self.colors, None)
+        store[self.colors] = self.entry = entry or {"ramps": {}, "escapes": {}}
+        if entry is None:
+            Palette.evict()
+    
+    @staticmethod
+    def get(palette):
+        """Paleta compilada a partir do nome em Colors.PALETTES ou de uma lista de cores"""
+        name = palette if isinstance(palette, str) else None
+        colors = tuple(Colors.PALETTES[palette.lower()] if name else palette)
+        instance = Palette._instances.get(colors)
+        if instance is None:
+            instance = Palette._instances[colors] = Palette(colors, name)
+        return instance
+    
+    @staticmethod
+    def store():
+        """Cache de rampas (carregado do disco na primeira utilização)"""
+        if Palette._store is None:
+            import marshal
+            
+            Palette._store = {}
+            try:
+                with open(PALETTE_CACHE_FILE, 'rb') as f:
+                    data = marshal.loads(f.read())
+                if data.get("version") == Palette.VERSION:
+                    Palette._store = data["palettes"]
+            except (OSError, ValueError, EOFError, TypeError, AttributeError, KeyError):
+                pass
+        return Palette._store
+    
+    @staticmethod
+    def evict():
+        """Descarta as listas personalizadas além das CUSTOM_LIMIT usadas por último"""
+        store = Palette.store()
+        named = {tuple(colors) for colors in Colors.PALETTES.values()}
+        custom = [colors for colors in store if colors not in named]
+        for colors in custom[:max(0, len(custom) - Palette.CUSTOM_LIMIT)]:
+            del store[colors]
+            Palette._dirty = True
+    
+    @staticmethod
+    def mark_dirty():
+        """Algo novo foi compilado: gravado no próximo save()"""
+        Palette._dirty = True
+    
+    @staticmethod
+    def save():
+        """Grava o cache se algo novo foi compilado (falhas são ignoradas: é só cache)"""
+        import marshal
+        
+        Palette.evict()
+        if not Palette._dirty:
+            return
+        try:
+            THEMES_DIR.mkdir(parents=True, exist_ok=True)
+            Config.write_atomic(PALETTE_CACHE_FILE, marshal.dumps({
+                "version": Palette.VERSION,
+                "palettes": Palette.store(),
+            }))
+            Palette._dirty = False
+        except (OSError, ValueError):
+            pass
+    
+    @staticmethod
+    def compile_all():
+        """Compila todas as paletas de Colors.PALETTES na profundidade atual e grava"""
+        for name in Colors.PALETTES:
+            Palette.get(name).compile()
+        Palette.save()
+    
+    def compile(self):
+        """Rampas e escapes de todas as resoluções padrão"""
+        for length in self.RESOLUTIONS:
+            self.escapes(length)
+        return self
+    
+    def ramp(self, length):
+        """Rampa RGB (mesma divisão do multi_gradient); resoluções padrão ficam no cache"""
+        ramps = self.entry["ramps"]
+        ramp = ramps.get(length)
+        if ramp is None:
+            ramp = Colors.ramp(self.colors, length)
+            if length in self.RESOLUTIONS:
+                ramps[length] = ramp
+                Palette.mark_dirty()
+        return ramp
+    
+    def escapes(self, length):
+        """Escapes de cada posição na profundidade de cor atual"""
+        table = self.entry["escapes"].setdefault(Colors.DEPTH, {})
+        codes = table.get(length)
+        if codes is None:
+            rgb = Colors.rgb
+            codes = [rgb(*color) for color in self.ramp(length)]
+            if length in self.RESOLUTIONS:
+                table[length] = codes
+                Palette.mark_dirty()
+        return codes
+    
+    def paint(self, text, bold=False):
+        """Mesmo resultado de Colors.multi_gradient(text, cores)"""
+        length = Colors.visible_length(text)
+        ramp = self.escapes(length) if length in self.RESOLUTIONS else self.ramp(length)
+        return Colors.paint(text, ramp, bold)
+    
+    def swatch(self, width=10, char="█"):
+        """Amostra da paleta (menus de temas e demo)"""
+        return self.paint(char * width)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RODA DE MATIZES (HSV)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class HueWheel:
+    """Roda de matizes pré-calculada: HSV -> RGB e escapes por consulta a tabela
+    
+    Cada variante de saturação/valor é montada uma vez com STEPS matizes
+    (matiz = i * 360 / STEPS); color_cycle, rainbow e rainbow_scroll só
+    indexam a tabela. Saturação e valor são arredondados em centésimos, o que
+    limita o número de variantes guardadas.
+    """
+    
+    STEPS = 360
+    VARIANT_LIMIT = 64
+    _wheels = {}   # (saturação, valor) -> [rgb]
+    _escapes = {}  # (saturação, valor, profundidade) -> [escape]
+    
+    @staticmethod
+    def hsv_to_rgb(hue, saturation=1.0, value=1.0):
+        """HSV (matiz em graus, saturação e valor 0-1) -> RGB 0-255"""
+        h = hue % 360
+        c = value * saturation
+        x = c * (1 - abs((h / 60) % 2 - 1))
+        m = value - c
+        
+        if h < 60:
+            r, g, b = c, x, 0
+        elif h < 120:
+            r, g, b = x, c, 0
+        elif h < 180:
+            r, g, b = 0, c, x
+        elif h < 240:
+            r, g, b = 0, x, c
+        elif h < 300:
+            r, g, b = x, 0, c
+        else:
+            r, g, b = c, 0, x
+        
+        return int((r + m) * 255), int((g + m) * 255), int((b + m) * 255)
+    
+    @staticmethod
+    def wheel(saturation=1.0, value=1.0):
+        """Tabela RGB de uma variante (montada na primeira utilização)"""
+        key = (round(saturation, 2), round(value, 2))
+        table = HueWheel._wheels.get(key)
+        if table is None:
+            if len(HueWheel._wheels) >= HueWheel.VARIANT_LIMIT:
+                HueWheel._wheels.clear()
+            steps = HueWheel.STEPS
+            table = HueWheel._wheels[key] = [HueWheel.hsv_to_rgb(i * 360 / steps, *key) for i in range(steps)]
+        return table
+    
+    @staticmethod
+    def escapes(saturation=1.0, value=1.0):
+        """Escapes de uma variante na profundidade de cor atual"""
+        key = (round(saturation, 2), round(value, 2), Colors.DEPTH)
+        codes = HueWheel._escapes.get(key)
+        if codes is None:
+            if len(HueWheel._escapes) >= HueWheel.VARIANT_LIMIT:
+                HueWheel._escapes.clear()
+            rgb = Colors.rgb
+            codes = HueWheel._escapes[key] = [rgb(*color) for color in HueWheel.wheel(saturation, value)]
+        return codes
+    
+    @staticmethod
+    def index(hue):
+        """Posição da matiz (graus) na tabela"""
+        return int(hue % 360 * HueWheel.STEPS / 360) % HueWheel.STEPS
+    
+    @staticmethod
+    def rgb(hue, saturation=1.0, value=1.0):
+        return HueWheel.wheel(saturation, value)[HueWheel.index(hue)]
+    
+    @staticmethod
+    def escape(hue, saturation=1.0, value=1.0):
+        return HueWheel.escapes(saturation, value)[HueWheel.index(hue)]
+    
+    @staticmethod
+    def ramp(length, start=0, span=360, saturation=1.0, value=1.0):
+        """Escapes para `length` posições percorrendo `span` graus a partir de `start`"""
+        if length <= 0:
+            return []
+        codes = HueWheel.escapes(saturation, value)
+        steps = HueWheel.STEPS
+        first = start % 360 * steps / 360
+        step = span * steps / 360 / max(length - 1, 1)
+        return [codes[int(first + i * step) % steps] for i in range(length)]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# OTIMIZADOR DE SAÍDA (SGR)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class SGROptimizer:
+    """Remove escapes SGR redundantes acompanhando o estado do terminal
+    
+    Atributos só são emitidos quando um caractere visível precisa deles, as
+    mudanças pendentes saem juntas em uma única sequência CSI, e espaços e
+    quebras de linha só sincronizam o que aparece neles (fundo, sublinhado...).
+    Atributos que o texto nunca definiu são herdados: a saída otimizada tem o
+    mesmo efeito que a original mesmo concatenada a outro texto.
+    """
+    
+    INHERIT = None  # marcador: atributo nunca definido pelo texto (estado desconhecido)
+    
+    BOLD, DIM, ITALIC, UNDERLINE, BLINK, REVERSE, HIDDEN, STRIKE, OVERLINE, FG, BG = range(11)
+    DEFAULTS = (False, False, False, 0, False, False, False, False, False, "39", "49")
+    ALL = tuple(range(11))
+    BLANK = (UNDERLINE, STRIKE, OVERLINE, BG)  # o que aparece em espaços e no erase
+    
+    # parâmetro -> (slot, valor)
+    SIMPLE = {
+        1: (BOLD, True), 2: (DIM, True), 3: (ITALIC, True), 4: (UNDERLINE, 1),
+        5: (BLINK, "5"), 6: (BLINK, "6"), 7: (REVERSE, True), 8: (HIDDEN, True),
+        9: (STRIKE, True), 21: (UNDERLINE, 2), 23: (ITALIC, False), 24: (UNDERLINE, 0),
+        25: (BLINK, False), 27: (REVERSE, False), 28: (HIDDEN, False), 29: (STRIKE, False),
+        39: (FG, "39"), 49: (BG, "49"), 53: (OVERLINE, True), 55: (OVERLINE, False),
+    }
+    
+    # slot -> {valor: parâmetro}
+    CODES = {
+        ITALIC: {True: "3", False: "23"},
+        UNDERLINE: {0: "24", 1: "4", 2: "21"},
+        BLINK: {"5": "5", "6": "6", False: "25"},
+        REVERSE: {True: "7", False: "27"},
+        HIDDEN: {True: "8", False: "28"},
+        STRIKE: {True: "9", False: "29"},
+        OVERLINE: {True: "53", False: "55"},
+    }
+    
+    HOLD_LIMIT = 256  # escape incompleto no fim de um pedaço (modo streaming)
+    _token = None
+    
+    # Transições já calculadas (estado, entrada) -> resultado: a saída colorida repete
+    # poucos estilos, então apply/sync_slots viram uma consulta a dicionário
+    CACHE_LIMIT = 4096
+    _applied = {}
+    _synced = {}
+    
+    def __init__(self, assume_reset=False):
+        initial = list(self.DEFAULTS) if assume_reset else [self.INHERIT] * 11
+        self.desired = list(initial)
+        self.actual = list(initial)
+        self.clean = True
+        self.held = ""
+    
+    @staticmethod
+    def optimize(text, assume_reset=False):
+        """Pós-processador: otimiza uma string já renderizada"""
+        optimizer = SGROptimizer(assume_reset)
+        return optimizer.feed(text) + optimizer.finish()
+    
+    @classmethod
+    def tokenizer(cls):
+        """Regex de sequências de escape (compilada na primeira utilização)"""
+        if cls._token is None:
+            import re
+            cls._token = re.compile(
+                r"\x1b\[([0-9;]*)m"
+                r"|\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)|[@-Z\\^_])"
+            )
+        return cls._token
+    
+    def feed(self, text):
+        """Processa um pedaço de texto e retorna a saída otimizada correspondente"""
+        if self.held:
+            text = self.held + text
+            self.held = ""
+        
+        out = []
+        position = 0
+        for match in self.tokenizer().finditer(text):
+            start = match.start()
+            if start > position:
+                self.text(text[position:start], out)
+            
+            params = match.group(1)
+            if params is None or not self.apply(params):
+                self.escape(match.group(), out)
+            position = match.end()
+        
+        rest = text[position:]
+        escape = rest.find("\x1b")
+        if escape >= 0 and len(rest) - escape < self.HOLD_LIMIT:
+            self.held = rest[escape:]
+            rest = rest[:escape]
+        if rest:
+            self.text(rest, out)
+        
+        return "".join(out)
+    
+    def sync(self):
+        """Emite as mudanças pendentes (ex.: antes de um flush ou de ler do teclado)"""
+        out = []
+        self.sync_slots(self.ALL, out)
+        return "".join(out)
+    
+    def finish(self):
+        """Fim do texto: estado final sincronizado e qualquer escape incompleto"""
+        held, self.held = self.held, ""
+        return self.sync() + held
+    
+    def invalidate(self):
+        """Alguém escreveu no terminal por fora: o estado real passa a ser desconhecido"""
+        self.actual = [self.INHERIT] * 11
+        self.clean = False
+    
+    def text(self, chunk, out):
+        """Texto sem escapes: sincroniza apenas antes do que realmente aparece"""
+        if not self.clean:
+            visible = chunk.lstrip(" \n\r\t")
+            lead = len(chunk) - len(visible)
+            if lead:
+                self.sync_slots(self.BLANK, out)
+                out.append(chunk[:lead])
+                chunk = visible
+            if chunk:
+                self.sync_slots(self.ALL, out)
+        out.append(chunk)
+    
+    def escape(self, sequence, out):
+        """Outros escapes (cursor, erase, título) passam intactos"""
+        if sequence.startswith("\x1b["):
+            # Erase usa a cor de fundo atual
+            self.sync_slots(self.BLANK, out)
+            out.append(sequence)
+            if sequence.endswith("m"):
+                # SGR que não acompanhamos (ex.: "38:2::r:g:b", fontes alternativas)
+                self.desired = [self.INHERIT] * 11
+                self.invalidate()
+        else:
+            out.append(sequence)
+    
+    def apply(self, params):
+        """Aplica os parâmetros de uma sequência SGR ao estado desejado
+        
+        Retorna False se houver parâmetros que não acompanhamos (a sequência
+        então segue intacta e o estado passa a ser desconhecido).
+        """
+        key = (tuple(self.desired), params)
+        result = self._applied.get(key)
+        if result is None:
+            result = self.compute_apply(params)
+            if len(self._applied) >= self.CACHE_LIMIT:
+                self._applied.clear()
+            self._applied[key] = result
+        if result is False:
+            return False
+        self.desired[:] = result
+        self.clean = False
+        return True
+    
+    def compute_apply(self, params):
+        """Estado desejado (tupla) depois de `params`, ou False se não acompanhamos algum"""
+        desired = list(self.desired)
+        values = [int(value) if value else 0 for value in params.split(";")]
+        index = 0
+        while index < len(values):
+            code = values[index]
+            index += 1
+            if code == 0:
+                desired[:] = self.DEFAULTS
+            elif code == 22:
+                desired[self.BOLD] = desired[self.DIM] = False
+            elif code in self.SIMPLE:
+                slot, value = self.SIMPLE[code]
+                desired[slot] = value
+            elif 30 <= code <= 37 or 90 <= code <= 97:
+                desired[self.FG] = str(code)
+            elif 40 <= code <= 47 or 100 <= code <= 107:
+                desired[self.BG] = str(code)
+            elif code in (38, 48):
+                mode = values[index] if index < len(values) else None
+                size = 2 if mode == 5 else 4 if mode == 2 else 0
+                if not size or index + size > len(values):
+                    return False
+                color = ";".join(str(value) for value in [code] + values[index:index + size])
+                desired[self.FG if code == 38 else self.BG] = color
+                index += size
+            else:
+                return False
+        return tuple(desired)
+    
+    def sync_slots(self, slots, out):
+        """Leva o terminal ao estado desejado nos slots indicados, em uma sequência"""
+        key = (slots, tuple(self.desired), tuple(self.actual))
+        result = self._synced.get(key)
+        if result is None:
+            sequence = []
+            actual = list(self.actual)
+            clean = self.compute_sync(slots, self.desired, actual, sequence)
+            result = (sequence[0] if sequence else "", tuple(actual), clean)
+            if len(self._synced) >= self.CACHE_LIMIT:
+                self._synced.clear()
+            self._synced[key] = result
+        
+        sequence, self.actual[:], clean = result
+        if clean:
+            self.clean = True
+        if sequence:
+            out.append(sequence)
+    
+    def compute_sync(self, slots, desired, actual, out):
+        """Calcula a sequência de sync_slots (em out) e atualiza `actual`
+        
+        Retorna True se todos os slots ficaram sincronizados (estado limpo).
+        """
+        changes = [slot for slot in slots if desired[slot] is not self.INHERIT and desired[slot] != actual[slot]]
+        if desired[self.REVERSE] or actual[self.REVERSE] is not False:
+            # Com vídeo reverso a cor de frente aparece até nos espaços
+            changes = [slot for slot in self.ALL if desired[slot] is not self.INHERIT and desired[slot] != actual[slot]]
+            slots = self.ALL
+        
+        if not changes:
+            return slots is self.ALL
+        
+        params = []
+        if self.BOLD in changes or self.DIM in changes:
+            bold = desired[self.BOLD] if desired[self.BOLD] is not self.INHERIT else actual[self.BOLD]
+            dim = desired[self.DIM] if desired[self.DIM] is not self.INHERIT else actual[self.DIM]
+            # 22 desliga os dois: religa o que deve continuar ativo
+            if (bold is False and actual[self.BOLD] is not False) or (dim is False and actual[self.DIM] is not False):
+                params.append("22")
+                actual[self.BOLD] = actual[self.DIM] = False
+            if bold is True and actual[self.BOLD] is not True:
+                params.append("1")
+            if dim is True and actual[self.DIM] is not True:
+                params.append("2")
+            actual[self.BOLD], actual[self.DIM] = bold, dim
+        for slot in changes:
+            if slot in self.CODES:
+                params.append(self.CODES[slot][desired[slot]])
+            elif slot in (self.FG, self.BG):
+                params.append(desired[slot])
+        
+        if slots is self.ALL and self.INHERIT not in desired:
+            # Alternativa: reset completo + apenas os atributos ativos
+            reset = ["0"] + self.active_params(desired)
+            if len(";".join(reset)) < len(";".join(params)):
+                params = reset
+        
+        for slot in changes:
+            actual[slot] = desired[slot]
+        if params and params[0] == "0":
+            actual[:] = desired
+        
+        out.append("\x1b[" + ";".join(params) + "m")
+        return slots is self.ALL
+    
+    def active_params(self, state):
+        """Parâmetros que reproduzem `state` a partir de um terminal resetado"""
+        params = []
+        if state[self.BOLD]:
+            params.append("1")
+        if state[self.DIM]:
+            params.append("2")
+        for slot in (self.ITALIC, self.UNDERLINE, self.BLINK, self.REVERSE, self.HIDDEN, self.STRIKE, self.OVERLINE):
+            if state[slot] != self.DEFAULTS[slot]:
+                params.append(self.CODES[slot][state[slot]])
+        for slot in (self.FG, self.BG):
+            if state[slot] != self.DEFAULTS[slot]:
+                params.append(state[slot])
+        return params
+
+
+class SGRWriter:
+    """Stream de saída que passa tudo pelo SGROptimizer
+    
+    Como context manager substitui sys.stdout:
+        with SGRWriter():
+            print(Colors.rainbow("..."))
+    
+    sync_on_flush=False deixa o reset pendente para a próxima escrita (animações
+    que fazem flush a cada quadro); use True quando houver input() no meio.
+    """
+    
+    def __init__(self, stream=None, assume_reset=False, sync_on_flush=True):
+        self.stream = stream if stream is not None else sys.stdout
+        self.optimizer = SGROptimizer(assume_reset)
+        self.sync_on_flush = sync_on_flush
+        self.previous = None
+    
+    def write(self, text):
+        data = self.optimizer.feed(text)
+        if data:
+            self.stream.write(data)
+        return len(text)
+    
+    def flush(self):
+        if self.sync_on_flush:
+            data = self.optimizer.sync()
+            if data:
+                self.stream.write(data)
+        self.stream.flush()
+    
+    def close(self):
+        data = self.optimizer.finish()
+        if data:
+            self.stream.write(data)
+        self.stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+    
+    def __enter__(self):
+        self.previous = sys.stdout
+        sys.stdout = self
+        return self
+    
+    def __exit__(self, *exc):
+        sys.stdout = self.previous
+        self.close()
+        return False
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# COLORIZADOR DE FLUXO (STDIN)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class StreamColorizer:
+    """Gradiente sobre um fluxo sem fim (pipes, logs de CI, tail -f)
+    
+    O texto chega em blocos e nunca é guardado inteiro, então o gradiente não
+    depende do tamanho total: ou é periódico (repete a cada `period`
+    caracteres) ou por linha (alinhado às colunas, da primeira cor em 0 até a
+    última em `width`). A cor muda a cada `band` caracteres, e cada bloco vira
+    fatias de string unidas em um único join.
+    """
+    
+    CHUNK_SIZE = 64 * 1024
+    PERIOD = 96
+    BAND = 4
+    
+    def __init__(self, colors, per_line=False, period=PERIOD, width=None, band=BAND, bold=False):
+        """colors: cores HEX/RGB do gradiente; None = arco-íris (matizes da HueWheel)"""
+        self.per_line = per_line
+        self.band = max(1, band)
+        self.bold = bold
+        self.position = 0  # coluna (por linha) ou posição no período
+        self.held = ""
+        
+        if per_line:
+            if width is None:
+                try:
+                    width = os.get_terminal_size().columns
+                except OSError:
+                    width = 80
+            steps = -(-max(1, width) // self.band)
+            if colors is None:
+                escapes = HueWheel.ramp(steps, span=Colors.RAINBOW_SPAN)
+            else:
+                escapes = [Colors.rgb(*color) for color in Colors.ramp(colors, steps, closed=True)]
+        else:
+            # Volta à primeira cor no fim do período: o padrão se repete sem salto
+            steps = -(-max(1, period) // self.band)
+            if colors is None:
+                escapes = [HueWheel.escape(i * 360 / steps) for i in range(steps)]
+            else:
+                escapes = [Colors.rgb(*color) for color in Colors.ramp(list(colors) + [colors[0]], steps)]
+        # Faixas vizinhas com o mesmo escape (comum em 256/16 cores) não repetem a sequência
+        self.escapes = escapes[:1] + ["" if code == previous else code
+                                      for previous, code in zip(escapes, escapes[1:])]
+        if per_line:
+            self.prepare_lines()
+    
+    def prepare_lines(self):
+        """Fatias e escapes de uma linha inteira para cada tamanho (além da largura, o resto é uma fatia)"""
+        band, escapes = self.band, self.escapes
+        limit = len(escapes) * band
+        self.line_cuts, self.line_codes = [], []
+        for size in range(limit + 2):
+            cuts = [slice(i, i + band) for i in range(0, min(size, limit), band)]
+            codes = escapes[:len(cuts)]
+            if size > limit:
+                cuts.append(slice(limit, None))
+                codes.append("")
+            # Par final: a quebra de linha, com uma fatia vazia
+            self.line_cuts.append(tuple(cuts) + (slice(0, 0),))
+            self.line_codes.append(tuple(codes) + ("\n",))
+    
+    def start(self):
+        """Saída antes do primeiro bloco"""
+        return Colors.BOLD if self.bold else ""
+    
+    def feed(self, text):
+        """Colore o próximo bloco do fluxo"""
+        if self.held:
+            text = self.held + text
+            self.held = ""
+        
+        # Escapes da entrada (logs já coloridos) seriam cortados pelas fatias: saem do texto
+        if "\x1b" in text:
+            text, self.held = StreamColorizer.split_escapes(text)
+        
+        parts = []
+        if self.per_line:
+            lines = text.split("\n")
+            self.paint_line(lines[0], parts)
+            if len(lines) > 1:
+                parts.append("\n")
+                self.paint_lines(lines[1:], parts)
+        else:
+            self.paint_periodic(text, parts)
+        return "".join(parts)
+    
+    _partial = None
+    
+    @classmethod
+    def partial_escape(cls, tail):
+        """O fim do bloco pode ser o começo de um escape que continua no próximo?"""
+        if cls._partial is None:
+            import re
+            cls._partial = re.compile(r"\x1b(?:\[[0-?]*[ -/]*|\][^\x07\x1b]*)?\Z")
+        return len(tail) < SGROptimizer.HOLD_LIMIT and cls._partial.match(tail) is not None
+    
+    @staticmethod
+    def split_escapes(text):
+        """Remove os escapes do texto. Retorna (texto, escape incompleto no fim)"""
+        text = SGROptimizer.tokenizer().sub("", text)
+        held = ""
+        escape = text.rfind("\x1b")
+        if escape >= 0 and StreamColorizer.partial_escape(text[escape:]):
+            held = text[escape:]
+            text = text[:escape]
+        return text.replace("\x1b", ""), held
+    
+    def finish(self):
+        """Fim do fluxo: restaura as cores do terminal"""
+        self.held = ""
+        return Colors.RESET
+    
+    def paint_line(self, line, parts):
+        """Linha (ou começo de linha) a partir da coluna atual"""
+        band, escapes = self.band, self.escapes
+        column = self.position
+        limit = len(escapes) * band
+        self.position = column + len(line)
+        
+        if column >= limit:
+            # Além da largura: segue com a última cor, já ativa
+            parts.append(line)
+            return
+        
+        # Termina a faixa começada no bloco anterior (a cor já está ativa)
+        offset = column % band
+        if offset:
+            parts.append(line[:band - offset])
+            line = line[band - offset:]
+            column += band - offset
+        
+        inside = limit - column
+        head = line[:inside]
+        slices = [head[i:i + band] for i in range(0, len(head), band)]
+        parts.extend(self.interleave(escapes[column // band:], slices))
+        if len(line) > inside:
+            parts.append(line[inside:])
+    
+    def paint_lines(self, lines, parts):
+        """Linhas a partir da coluna 0 (a última continua no próximo bloco)
+        
+        Cada linha usa as fatias e escapes pré-calculados para o seu tamanho:
+        duas compreensões para o bloco inteiro em vez de uma chamada por linha.
+        """
+        cuts, codes = self.line_cuts, self.line_codes
+        longest = len(cuts) - 1
+        sizes = [len(line) if len(line) < longest else longest for line in lines]
+        slices = [line[cut] for line, size in zip(lines, sizes) for cut in cuts[size]]
+        out = self.interleave([code for size in sizes for code in codes[size]], slices)
+        del out[-2:]  # A última linha ainda não terminou: sem a quebra
+        parts.extend(out)
+        self.position = len(lines[-1])
+    
+    def paint_periodic(self, text, parts):
+        """Bloco no padrão periódico, continuando de onde o anterior parou"""
+        band, escapes = self.band, self.escapes
+        period = len(escapes) * band
+        position = self.position
+        self.position = (position + len(text)) % period
+        
+        offset = position % band
+        if offset:
+            parts.append(text[:band - offset])
+            text = text[band - offset:]
+            position = (position + band - offset) % period
+        
+        slices = [text[i:i + band] for i in range(0, len(text), band)]
+        first = position // band
+        cycles = -(-(first + len(slices)) // len(escapes))
+        parts.extend(self.interleave((escapes * cycles)[first:], slices))
+    
+    @staticmethod
+    def interleave(escapes, slices):
+        """[e0, s0, e1, s1, ...] por atribuição de fatias (sem concatenar strings)"""
+        out = [None] * (2 * len(slices))
+        out[0::2] = escapes[:len(slices)]
+        out[1::2] = slices
+        return out
+    
+    def run(self, fd=None):
+        """Filtra o fd (stdin) até o fim: cada leitura vira uma única escrita"""
+        pipe_stream(self, fd)
+
+
+class Highlighter:
+    """Filtro estilo grc: colore os trechos que casam com regras de regex
+    
+    Todas as regras viram uma única alternação compilada, então cada linha é
+    percorrida uma vez (a primeira regra que casa numa posição vence). Quando
+    toda regra tem um literal obrigatório, um pré-filtro só de literais pula
+    em C as linhas que não podem casar, e nas que sobram a alternação usa só
+    as regras cujos literais apareceram. A saída passa pelo SGROptimizer.
+    
+    Regra: {"pattern": regex, "color": "#HEX" | "paleta" | "paleta:N",
+            "background": ..., "bold": bool, "underline": bool,
+            "ignore_case": bool, "line": bool (colore a linha inteira)}
+    """
+    
+    CHUNK_SIZE = StreamColorizer.CHUNK_SIZE
+    LINE_LIMIT = 64 * 1024  # linha sem \n maior que isso sai sem esperar o resto
+    MIN_LITERAL = 2  # literais menores que isso não filtram nada
+    SUBSET_LIMIT = 256  # alternações parciais compiladas em cache
+    
+    DEFAULT_RULES = [
+        {"pattern": r"\b(?:ERROR|FATAL|CRITICAL|FAIL|FAILED)\b", "color": "blood:4", "bold": True},
+        {"pattern": r"\b(?:WARN|WARNING)\b", "color": "gold:2", "bold": True},
+        {"pattern": r"\bINFO\b", "color": "ocean:2"},
+        {"pattern": r"\b(?:DEBUG|TRACE)\b", "color": "galaxy:4"},
+        {"pattern": r"\b(?:Traceback|Exception|panic)\b", "color": "fire:3", "bold": True},
+        {"pattern": r"https?://[^\s\"'<>]+", "color": "cyberpunk:1", "underline": True},
+        {"pattern": r"\b(?:OK|PASS|PASSED|SUCCESS)\b", "color": "forest:3", "bold": True},
+    ]
+    
+    def __init__(self, rules=None):
+        import re
+        
+        rules = self.DEFAULT_RULES if rules is None else rules
+        if isinstance(rules, dict):
+            rules = rules.get("rules", [])
+        if not rules:
+            raise ValueError("nenhuma regra definida")
+        
+        self.styles = {}
+        self.line_rules = set()
+        self.branches = {}
+        literals = []
+        for index, rule in enumerate(rules):
+            pattern = rule.get("pattern") if isinstance(rule, dict) else None
+            if not pattern:
+                raise ValueError(f"regra {index + 1}: 'pattern' é obrigatório")
+            try:
+                compiled = re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"regra {index + 1}: regex inválida ({e})")
+            # Casar com texto vazio não colore nada e faria toda linha passar pelo filtro
+            if compiled.match("") is not None:
+                raise ValueError(f"regra {index + 1}: o padrão casa com texto vazio")
+            
+            name = f"r{index}"
+            flags = "(?i:" if rule.get("ignore_case") else "(?:"
+            self.branches[name] = f"(?P<{name}>{flags}{pattern}))"
+            self.styles[name] = self.style(rule)
+            if rule.get("line"):
+                self.line_rules.add(name)
+            
+            required = self.required_literals(pattern)
+            if literals is not None and required and min(map(len, required)) >= self.MIN_LITERAL:
+                literals.extend((flags, literal, name) for literal in required)
+            else:
+                literals = None
+        
+        # Regras casam dentro de uma linha: ^ e $ são início e fim de linha
+        self.combined = re.compile("|".join(self.branches.values()), re.MULTILINE)
+        self.subsets = {}
+        if literals:
+            literals.sort(key=lambda item: -len(item[1]))
+            self.prefilter = re.compile("|".join(f"{flags}{re.escape(literal)})" for flags, literal, _ in literals))
+            self.owners = self.literal_owners(literals)
+        else:
+            self.prefilter = self.combined
+            self.owners = None
+        
+        self.optimizer = SGROptimizer(assume_reset=True)
+        self.held = ""
+        self.held_escape = ""
+    
+    @staticmethod
+    def literal_owners(literals):
+        """literal (minúsculo) -> regras que podem casar numa linha onde o pré-filtro o achou
+        
+        O pré-filtro não reporta literais sobrepostos: um literal que começa
+        dentro de outro já achado (contido nele ou continuando depois dele)
+        some, então as regras dele entram junto.
+        """
+        found = {}
+        for _, literal, name in literals:
+            found.setdefault(literal.lower(), set()).add(name)
+        
+        owners = {}
+        for hit in found:
+            names = set()
+            for other, rules in found.items():
+                if other in hit or any(hit[i:] == other[:len(hit) - i] for i in range(1, len(hit))):
+                    names |= rules
+            owners[hit] = frozenset(names)
+        return owners
+    
+    def subset(self, names):
+        """Alternação só com as regras indicadas (mesma ordem de prioridade)"""
+        regex = self.subsets.get(names)
+        if regex is None:
+            import re
+            if len(self.subsets) >= self.SUBSET_LIMIT:
+                self.subsets.clear()
+            pattern = "|".join(branch for name, branch in self.branches.items() if name in names)
+            regex = self.subsets[names] = re.compile(pattern, re.MULTILINE)
+        return regex
+    
+    @staticmethod
+    def resolve_color(spec):
+        """'#HEX', nome de paleta (cor do meio) ou 'paleta:N' -> HEX"""
+        if spec.startswith("#"):
+            return spec
+        name, _, index = spec.partition(":")
+        palette = Colors.PALETTES.get(name.lower())
+        if palette is None:
+            raise ValueError(f"cor desconhecida: {spec}")
+        try:
+            return palette[int(index) if index else len(palette) // 2]
+        except (ValueError, IndexError):
+            raise ValueError(f"índice inválido na paleta: {spec}")
+    
+    @staticmethod
+    def style(rule):
+        """Sequência SGR de uma regra"""
+        codes = []
+        if rule.get("bold"):
+            codes.append(Colors.BOLD)
+        if rule.get("underline"):
+            codes.append(Colors.UNDERLINE)
+        if rule.get("color"):
+            codes.append(Colors.hex(Highlighter.resolve_color(rule["color"])))
+        if rule.get("background"):
+            codes.append(Colors.hex_bg(Highlighter.resolve_color(rule["background"])))
+        return "".join(codes)
+    
+    @staticmethod
+    def required_literals(pattern):
+        """Literais dos quais ao menos um aparece em todo trecho que casa com o padrão
+        
+        Análise conservadora: classes, âncoras, escapes de classe e trechos
+        opcionais não contribuem; grupos com flags, lookarounds e escapes
+        numéricos desistem. Sem garantia, retorna None.
+        """
+        import re
+        quantifier = re.compile(r"\{(\d*)(,?)(\d*)\}")
+        
+        class GiveUp(Exception):
+            pass
+        
+        def alternation(i):
+            options = []
+            while True:
+                best, i = sequence(i)
+                if best is None:
+                    raise GiveUp
+                options.append(best)
+                if i < len(pattern) and pattern[i] == "|":
+                    i += 1
+                    continue
+                return set().union(*options), i
+        
+        def sequence(i):
+            best, run = None, ""
+            
+            def consider(candidate, best):
+                if candidate and (best is None or min(map(len, candidate)) > min(map(len, best))):
+                    return candidate
+                return best
+            
+            while i < len(pattern) and pattern[i] not in "|)":
+                char = pattern[i]
+                literal = group = None
+                if char == "\\":
+                    escaped = pattern[i + 1:i + 2]
+                    if not escaped or escaped in "xuUN0123456789" or (escaped.isalpha() and escaped not in "bBdDsSwWAZ"):
+                        raise GiveUp
+                    if not escaped.isalnum():
+                        literal = escaped
+                    i += 2
+                elif char == "[":
+                    i += 1
+                    if pattern[i:i + 1] == "^":
+                        i += 1
+                    if pattern[i:i + 1] == "]":
+                        i += 1
+                    while pattern[i] != "]":
+                        i += 2 if pattern[i] == "\\" else 1
+                    i += 1
+                elif char == "(":
+                    if pattern.startswith("(?:", i):
+                        i += 3
+                    elif pattern.startswith("(?P<", i):
+                        i = pattern.index(">", i) + 1
+                    elif pattern.startswith("(?", i):
+                        raise GiveUp
+                    else:
+                        i += 1
+                    group, i = alternation(i)
+                    if pattern[i:i + 1] != ")":
+                        raise GiveUp
+                    i += 1
+                elif char in ".^$":
+                    i += 1
+                elif char in "*+?":
+                    raise GiveUp
+                else:
+                    literal = char
+                    i += 1
+                
+                # Quantificador depois do átomo
+                optional = repeated = False
+                match = quantifier.match(pattern, i)
+                if pattern[i:i + 1] in ("*", "?"):
+                    optional = True
+                    i += 1
+                elif pattern[i:i + 1] == "+":
+                    repeated = True
+                    i += 1
+                elif match:
+                    optional = not int(match.group(1) or 0)
+                    repeated = True
+                    i = match.end()
+                if (optional or repeated) and pattern[i:i + 1] in ("?", "+"):
+                    i += 1
+                
+                if literal is not None and not optional:
+                    run += literal
+                    if not repeated:
+                        continue
+                best = consider({run} if run else None, best)
+                run = ""
+                if group and not optional:
+                    best = consider(group, best)
+            
+            return consider({run} if run else None, best), i
+        
+        try:
+            literals, end = alternation(0)
+        except (GiveUp, IndexError, ValueError):
+            return None
+        return literals if end == len(pattern) else None
+    
+    def start(self):
+        """Saída antes do primeiro bloco"""
+        return ""
+    
+    def feed(self, text):
+        """Colore as linhas completas do bloco (a última, incompleta, espera o próximo)"""
+        if self.held_escape:
+            text = self.held_escape + text
+            self.held_escape = ""
+        if "\x1b" in text:
+            text, self.held_escape = StreamColorizer.split_escapes(text)
+        
+        block = self.held + text
+        cut = block.rfind("\n") + 1
+        if not cut and len(block) < self.LINE_LIMIT:
+            self.held = block
+            return ""
+        if not cut:
+            cut = len(block)
+        self.held = block[cut:]
+        return self.optimizer.feed(self.highlight(block, cut))
+    
+    def finish(self):
+        """Fim do fluxo: última linha (sem \n) e estado do terminal restaurado"""
+        block, self.held = self.held, ""
+        self.held_escape = ""
+        return self.optimizer.feed(self.highlight(block, len(block))) + self.optimizer.finish()
+    
+    def highlight(self, block, end):
+        """Colore block[:end]: só as linhas apontadas pelo pré-filtro são analisadas"""
+        out = []
+        append = out.append
+        prefilter, owners = self.prefilter, self.owners
+        styles, line_rules, reset = self.styles, self.line_rules, Colors.RESET
+        position = 0
+        
+        while position < end:
+            hit = prefilter.search(block, position, end)
+            if hit is None:
+                break
+            # position está sempre no começo de uma linha (ou do bloco)
+            line_start = block.rfind("\n", position, hit.start()) + 1 or position
+            line_end = block.find("\n", hit.start(), end)
+            if line_end < 0:
+                line_end = end
+            
+            if owners is None:
+                regex = self.combined
+            else:
+                names = set()
+                for literal in prefilter.finditer(block, hit.start(), line_end):
+                    names.update(owners[literal.group().lower()])
+                regex = self.subset(frozenset(names))
+            
+            matches = [match for match in regex.finditer(block, line_start, line_end) if match.end() > match.start()]
+            append(block[position:line_start])
+            whole_line = line_rules and next((match.lastgroup for match in matches if match.lastgroup in line_rules), None)
+            if whole_line:
+                append(styles[whole_line])
+                append(block[line_start:line_end])
+                append(reset)
+            else:
+                cursor = line_start
+                for match in matches:
+                    append(block[cursor:match.start()])
+                    append(styles[match.lastgroup])
+                    append(match.group())
+                    append(reset)
+                    cursor = match.end()
+                append(block[cursor:line_end])
+            # Avança além do \n: um acerto de largura zero no fim da linha não a repete
+            position = line_end
+            if position < end:
+                append("\n")
+                position += 1
+        
+        append(block[position:end])
+        return "".join(out)
+
+
+def pipe_stream(colorizer, fd=None):
+    """Lê blocos do fd, passa por colorizer.feed e escreve cada resultado de uma vez
+    
+    os.read devolve o que já chegou (até CHUNK_SIZE), então em `tail -f` cada
+    linha aparece na hora; em arquivos e pipes cheios os blocos são grandes.
+    """
+    import codecs
+    
+    fd = sys.stdin.fileno() if fd is None else fd
+    size = getattr(colorizer, "CHUNK_SIZE", StreamColorizer.CHUNK_SIZE)
+    decoder = codecs.getincrementaldecoder("utf-8")("surrogateescape")
+    encode = lambda text: text.encode("utf-8", "surrogateescape")
+    
+    try:
+        start = colorizer.start()
+        if start:
+            write_output(encode(start))
+        
+        while True:
+            data = os.read(fd, size)
+            text = decoder.decode(data, final=not data)
+            if text:
+                write_output(encode(colorizer.feed(text)))
+            if not data:
+                break
+    finally:
+        try:
+            write_output(encode(colorizer.finish()))
+        except OSError:
+            pass
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# AGENDADOR DE QUADROS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class FrameScheduler:
+    """Laço de quadros com prazos monotônicos
+    
+    O quadro n tem prazo início + n / fps (time.monotonic), então o tempo de
+    render e escrita não se acumula e a animação mantém a duração de parede.
+    Atrasado um quadro inteiro ou mais, o agendador pula os quadros perdidos
+    (o índice acompanha o relógio) em vez de tentar alcançá-los.
+    
+        for index in FrameScheduler(fps=20, duration=3):
+            desenhar(index)
+        
+        async for index in FrameScheduler(fps=20, duration=3):
+            desenhar(index)
+    
+    duration: segundos; frames: número de quadros (o último sempre é desenhado).
+    Sem nenhum dos dois, roda até o chamador sair do laço. fps <= 0 desliga o
+    limite: os quadros saem um atrás do outro, sem espera. sleep substitui
+    time.sleep (ex.: Event.wait, para acordar na hora de parar). As estatísticas
+    (frames, dropped, late, elapsed) ficam no objeto e em FrameScheduler.last.
+    """
+    
+    LATE_FRACTION = 0.25  # atraso (fração do intervalo) que conta como quadro atrasado
+    last = None
+    
+    def __init__(self, fps=20, duration=None, frames=None, sleep=None):
+        self.fps = fps
+        self.interval = 1 / fps if fps > 0 else 0
+        self.duration = duration
+        self.total = frames
+        self.sleep = sleep or time.sleep
+        self.frames = 0
+        self.dropped = 0
+        self.late = 0
+        self.elapsed = 0.0
+        self.start = self.end = None
+        self.index = 0
+    
+    def begin(self, now):
+        """Marca o início no relógio do laço (monotonic ou loop.time)"""
+        FrameScheduler.last = self
+        self.start = now
+        self.index = 0
+        if self.duration is not None:
+            self.end = now + self.duration
+        elif self.total is not None and self.interval:
+            self.end = now + self.total * self.interval
+        else:
+            self.end = None
+    
+    def advance(self, now):
+        """Próximo quadro: (índice, segundos até o prazo) ou None ao terminar"""
+        index, limit, end = self.index, self.total, self.end
+        start, interval = self.start, self.interval
+        if limit is not None and index >= limit:
+            return None
+        if not interval:
+            # Sem limite de fps: só a duração encerra
+            if end is not None and now >= end:
+                return None
+            return index, 0
+        deadline = start + index * interval
+        if end is not None and deadline >= end:
+            return None
+        if now < deadline:
+            return index, deadline - now
+        
+        if now - deadline >= interval:
+            # Atrasado: pula para o quadro do relógio
+            current = int((now - start) / interval)
+            if limit is not None:
+                current = min(current, limit - 1)
+            elif end is not None and start + current * interval >= end:
+                return None
+            self.dropped += current - index
+            index = self.index = current
+            deadline = start + index * interval
+        if now - deadline > interval * self.LATE_FRACTION:
+            self.late += 1
+        return index, 0
+    
+    @classmethod
+    def every(cls, delay, **options):
+        """Agendador por intervalo em segundos (delay <= 0: sem espera, como o time.sleep(0) de antes)"""
+        return cls(fps=1 / delay if delay > 0 else 0, **options)
+    
+    def remaining(self, now):
+        """Espera depois do último quadro, para manter a duração"""
+        return self.end - now if self.end is not None and self.end > now else 0
+    
+    def __iter__(self):
+        clock, sleep = time.monotonic, self.sleep
+        self.begin(clock())
+        try:
+            while True:
+                step = self.advance(clock())
+                if step is None:
+                    break
+                index, wait = step
+                if wait:
+                    sleep(wait)
+                yield index
+                self.frames += 1
+                self.index = index + 1
+            
+            wait = self.remaining(clock())
+            if wait:
+                sleep(wait)
+        finally:
+            self.elapsed = clock() - self.start
+    
+    async def __aiter__(self):
+        """Mesmo laço no asyncio: relógio do loop e asyncio.sleep"""
+        import asyncio
+        
+        clock = asyncio.get_running_loop().time
+        self.begin(clock())
+        try:
+            while True:
+                step = self.advance(clock())
+                if step is None:
+                    break
+                index, wait = step
+                await asyncio.sleep(wait)
+                yield index
+                self.frames += 1
+                self.index = index + 1
+            
+            wait = self.remaining(clock())
+            if wait:
+                await asyncio.sleep(wait)
+        finally:
+            self.elapsed = clock() - self.start
+    
+    def stats(self):
+        """Quadros desenhados, pulados e atrasados"""
+        return {
+            "fps": self.fps,
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "late": self.late,
+            "elapsed": self.elapsed,
+        }
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # SISTEMA DE ANIMAÇÕES
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -328,20 +1922,72 @@ class Animations:
     # Animações de loading
     LOADING_STYLES = {
         "bar": lambda p, w: "█" * int(p * w) + "░" * (w - int(p * w)),
-        "gradient": lambda p, w: Colors.gradient("█" * w, "#FF0000", "#00FF00")[:int(p * w)] + "░" * (w - int(p * w)),
+        "gradient": lambda p, w: Animations.gradient_bar(p, w),
         "wave": lambda p, w: "".join(["█" if (i / w + p) % 1 < 0.5 else "░" for i in range(w)]),
     }
     
+    # Escapes do estilo "gradient" por (largura, profundidade): calculados uma vez, não a cada quadro
+    _bar_escapes = {}
+    
     @staticmethod
-    def typing_effect(text, delay=0.03, color=None):
-        """Efeito de digitação"""
+    def gradient_bar(progress, width):
+        """Estilo "gradient": escapes por posição da largura inteira, só as células cheias pintadas"""
+        key = (width, Colors.DEPTH)
+        codes = Animations._bar_escapes.get(key)
+        if codes is None:
+            codes = Animations._bar_escapes[key] = Palette.get(["#FF0000", "#00FF00"]).escapes(width)
+        filled = int(progress * width)
+        return Colors.paint("█" * filled, codes) + "░" * (width - filled)
+    
+    # Renderizadores de quadro (versões síncronas e AsyncAnimations usam os mesmos)
+    
+    @staticmethod
+    def typing_chunks(text, color=None):
+        """Um pedaço de saída por caractere digitado"""
+        if not color:
+            return list(text)
+        code = Colors.hex(color)
+        return [f"{code}{char}{Colors.RESET}" for char in text]
+    
+    @staticmethod
+    def spinner_frames(text="Loading", style="dots", color="#00BFFF"):
+        """Quadros prontos do spinner (sem o \\r)"""
+        code = Colors.hex(color)
+        frames = Animations.SPINNERS.get(style, Animations.SPINNERS["dots"])
+        return [f"{code}{frame}{Colors.RESET} {text}" for frame in frames]
+    
+    @staticmethod
+    def glitch_frame(text, intensity=3, color="#00FF00"):
+        """Um quadro do glitch: caracteres trocados e deslocamento aleatório"""
+        import random
+        
+        glitch_chars = "!@#$%^&*()_+-=[]{}|;':\",./<>?`~"
+        
+        glitched = ""
         for char in text:
-            if color:
-                sys.stdout.write(f"{Colors.hex(color)}{char}{Colors.RESET}")
+            if random.random() < 0.1 * intensity:
+                glitched += random.choice(glitch_chars)
             else:
-                sys.stdout.write(char)
-            sys.stdout.flush()
-            time.sleep(delay)
+                glitched += char
+        
+        offset = random.randint(-intensity, intensity)
+        padding = " " * max(0, offset)
+        
+        return f"{padding}{Colors.hex(color)}{glitched}{Colors.RESET}"
+    
+    @staticmethod
+    def typing_effect(text, delay=0.03, color=None):
+        """Efeito de digitação"""
+        chunks = Animations.typing_chunks(text, color)
+        if delay <= 0:
+            sys.stdout.write("".join(chunks))
+        else:
+            # Quadros pulados não perdem caracteres: saem junto com o próximo
+            written = 0
+            for i in FrameScheduler.every(delay, frames=len(chunks)):
+                sys.stdout.write("".join(chunks[written:i + 1]))
+                sys.stdout.flush()
+                written = i + 1
         print()
     
     @staticmethod
@@ -349,7 +1995,7 @@ class Animations:
         """Efeito de fade in"""
         r, g, b = Colors.hex_to_rgb(color)
         
-        for i in range(steps + 1):
+        for i in FrameScheduler.every(delay, frames=steps + 1):
             factor = i / steps
             current_r = int(r * factor)
             current_g = int(g * factor)
@@ -357,54 +2003,26 @@ class Animations:
             
             sys.stdout.write(f"\r{Colors.rgb(current_r, current_g, current_b)}{text}{Colors.RESET}")
             sys.stdout.flush()
-            time.sleep(delay)
         print()
     
     @staticmethod
-    def matrix_rain(duration=5, width=None):
-        """Efeito Matrix Rain"""
-        if width is None:
-            try:
-                width = os.get_terminal_size().columns
-            except:
-                width = 80
-        
-        chars = "ｱｲｳｴｵｶｷｸｹｺｻｼｽｾｿﾀﾁﾂﾃﾄﾅﾆﾇﾈﾉﾊﾋﾌﾍﾎﾏﾐﾑﾒﾓﾔﾕﾖﾗﾘﾙﾚﾛﾜﾝ0123456789"
-        columns = [0] * width
-        
-        print("\033[2J\033[H", end="")  # Limpa tela
-        
-        start_time = time.time()
-        while time.time() - start_time < duration:
-            line = ""
-            for i in range(width):
-                if random.random() < 0.1:
-                    columns[i] = random.randint(5, 15)
-                
-                if columns[i] > 0:
-                    char = random.choice(chars)
-                    brightness = min(255, columns[i] * 25)
-                    line += f"{Colors.rgb(0, brightness, 0)}{char}"
-                    columns[i] -= 1
-                else:
-                    line += " "
-            
-            print(line + Colors.RESET)
-            time.sleep(0.05)
+    def matrix_rain(duration=5, width=None, fps=20, height=None):
+        """Efeito Matrix Rain em tela cheia (tela alternativa, restaurada ao sair)"""
+        MatrixRain(width, height).run(duration, fps)
+    
+    @staticmethod
+    def spinning(text="Loading", style="dots", color="#00BFFF", fps=10):
+        """Spinner em segundo plano enquanto o trabalho roda: `with` ou decorator"""
+        return Spinner(text, style, color, fps)
     
     @staticmethod
-    def spinner(text="Loading", style="dots", duration=3, color="#00BFFF"):
+    def spinner(text="Loading", style="dots", duration=3, color="#00BFFF", fps=10):
         """Exibe um spinner animado"""
-        frames = Animations.SPINNERS.get(style, Animations.SPINNERS["dots"])
+        frames = Animations.spinner_frames(text, style, color)
         
-        start_time = time.time()
-        i = 0
-        while time.time() - start_time < duration:
-            frame = frames[i % len(frames)]
-            sys.stdout.write(f"\r{Colors.hex(color)}{frame}{Colors.RESET} {text}")
+        for i in FrameScheduler(fps=fps, duration=duration):
+            sys.stdout.write("\r" + frames[i % len(frames)])
             sys.stdout.flush()
-            time.sleep(0.1)
-            i += 1
         
         sys.stdout.write("\r" + " " * (len(text) + 10) + "\r")
         sys.stdout.flush()
@@ -412,11 +2030,14 @@ class Animations:
     @staticmethod
     def progress_animated(total, callback=None, style="bar", width=40, color="#00BFFF"):
         """Barra de progresso animada"""
+        code = Colors.hex(color)
+        render = Animations.LOADING_STYLES.get(style, Animations.LOADING_STYLES["bar"])
         for i in range(total + 1):
             progress = i / total
-            bar = Animations.LOADING_STYLES.get(style, Animations.LOADING_STYLES["bar"])(progress, width)
+            # Estilos que pintam terminam em RESET: a cor da moldura volta para o resto da barra
+            bar = render(progress, width).replace(Colors.RESET, Colors.RESET + code)
             
-            sys.stdout.write(f"\r{Colors.hex(color)}[{bar}]{Colors.RESET} {progress*100:.1f}%")
+            sys.stdout.write(f"\r{code}[{bar}]{Colors.RESET} {progress*100:.1f}%")
             sys.stdout.flush()
             
             if callback:
@@ -426,33 +2047,19 @@ class Animations:
         print()
     
     @staticmethod
-    def glitch_text(text, intensity=3, duration=1, color="#00FF00"):
+    def glitch_text(text, intensity=3, duration=1, color="#00FF00", fps=20):
         """Efeito glitch no texto"""
-        glitch_chars = "!@#$%^&*()_+-=[]{}|;':\",./<>?`~"
-        
-        start_time = time.time()
-        while time.time() - start_time < duration:
-            glitched = ""
-            for char in text:
-                if random.random() < 0.1 * intensity:
-                    glitched += random.choice(glitch_chars)
-                else:
-                    glitched += char
-            
-            offset = random.randint(-intensity, intensity)
-            padding = " " * max(0, offset)
-            
-            sys.stdout.write(f"\r{padding}{Colors.hex(color)}{glitched}{Colors.RESET}")
+        for _ in FrameScheduler(fps=fps, duration=duration):
+            sys.stdout.write("\r" + Animations.glitch_frame(text, intensity, color))
             sys.stdout.flush()
-            time.sleep(0.05)
         
         sys.stdout.write(f"\r{Colors.hex(color)}{text}{Colors.RESET}" + " " * 10)
         print()
     
     @staticmethod
-    def wave_text(text, cycles=3, color="#00BFFF"):
+    def wave_text(text, cycles=3, color="#00BFFF", fps=10):
         """Texto com efeito de onda"""
-        for cycle in range(cycles * len(text)):
+        for cycle in FrameScheduler(fps=fps, frames=cycles * len(text)):
             output = ""
             for i, char in enumerate(text):
                 offset = (cycle + i) % len(text)
@@ -461,46 +2068,602 @@ class Animations:
             
             sys.stdout.write(f"\r{Colors.hex(color)}{output}{Colors.RESET}")
             sys.stdout.flush()
-            time.sleep(0.1)
         print()
     
-    @staticmethod
-    def color_cycle(text, duration=3, speed=0.1):
-        """Ciclo de cores no texto"""
-        start_time = time.time()
-        hue = 0
-        
-        while time.time() - start_time < duration:
-            # HSV para RGB (simplificado)
-            h = hue % 360
-            s = 1.0
-            v = 1.0
-            
-            c = v * s
-            x = c * (1 - abs((h / 60) % 2 - 1))
-            m = v - c
-            
-            if h < 60:
-                r, g, b = c, x, 0
-            elif h < 120:
-                r, g, b = x, c, 0
-            elif h < 180:
-                r, g, b = 0, c, x
-            elif h < 240:
-                r, g, b = 0, x, c
-            elif h < 300:
-                r, g, b = x, 0, c
-            else:
-                r, g, b = c, 0, x
-            
-            r, g, b = int((r + m) * 255), int((g + m) * 255), int((b + m) * 255)
-            
-            sys.stdout.write(f"\r{Colors.rgb(r, g, b)}{text}{Colors.RESET}")
-            sys.stdout.flush()
-            
-            hue += 10
-            time.sleep(speed)
-        print()
+    @staticmethod
+    def color_cycle(text, duration=3, speed=0.1, saturation=1.0, value=1.0):
+        """Ciclo de cores no texto"""
+        codes = HueWheel.escapes(saturation, value)
+        step = HueWheel.index(10)
+        
+        # O matiz segue o índice do quadro: quadros pulados não atrasam o ciclo
+        for i in FrameScheduler.every(speed, duration=duration):
+            sys.stdout.write(f"\r{codes[i * step % HueWheel.STEPS]}{text}{Colors.RESET}")
+            sys.stdout.flush()
+        print()
+    
+    @staticmethod
+    def rainbow_scroll(text, duration=3, speed=0.05, spread=12, step=15, saturation=1.0, value=1.0, bold=False):
+        """Arco-íris correndo pelo texto: cada quadro só consulta a roda de matizes
+        
+        spread: graus entre caracteres vizinhos; step: graus que o padrão anda por quadro.
+        """
+        codes = HueWheel.escapes(saturation, value)
+        steps = HueWheel.STEPS
+        chars = [(HueWheel.index(i * spread), char) for i, char in enumerate(text)]
+        advance = HueWheel.index(step)
+        prefix = Colors.BOLD if bold else ""
+        
+        for i in FrameScheduler.every(speed, duration=duration):
+            shift = -i * advance % steps
+            frame = "".join([codes[(shift + offset) % steps] + char for offset, char in chars])
+            sys.stdout.write(f"\r{prefix}{frame}{Colors.RESET}")
+            sys.stdout.flush()
+        print()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# BLOCO AO VIVO (REDESENHO NO LUGAR)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class LiveBlock:
+    """Linhas redesenhadas no lugar: o cursor sobe até o início do bloco e reescreve
+    
+    Enquanto instalado, sys.stdout passa pelo bloco, com uma trava: qualquer
+    escrita (de qualquer thread) apaga o bloco antes, e o bloco só é
+    redesenhado quando a saída está no começo de uma linha. Usado pelo
+    Spinner, pelo AsyncBoard e pelo MultiProgress.
+    """
+    
+    def __init__(self):
+        self.stream = None
+        self.previous = None
+        self.lock = None
+        self.height = 0          # linhas do bloco na tela
+        self.line_start = True   # a saída de fora terminou em "\n"
+    
+    def install(self):
+        import threading
+        
+        self.lock = threading.Lock()
+        self.previous = self.stream = sys.stdout
+        sys.stdout = self
+        return self
+    
+    def uninstall(self):
+        with self.lock:
+            self.stream.write(self.erase())
+            self.stream.flush()
+        # Só devolve o stdout se ninguém o trocou enquanto o bloco estava ativo
+        if sys.stdout is self:
+            sys.stdout = self.previous
+    
+    def erase(self):
+        """Texto que apaga o bloco e deixa o cursor onde ele começava"""
+        height, self.height = self.height, 0
+        if not height:
+            return ""
+        return (f"\033[{height - 1}A" if height > 1 else "") + "\r\033[J"
+    
+    @staticmethod
+    def fit(line, columns):
+        """Corta a linha em `columns` posições visíveis, mantendo os escapes (cor e RESET)
+        
+        Uma linha que quebrasse no terminal ocuparia mais linhas do que o bloco conta
+        e o cursor subiria de menos no próximo desenho.
+        """
+        if len(line) <= columns // 2:
+            return line  # Cabe mesmo que todo caractere seja largo
+        
+        import unicodedata
+        
+        parts = []
+        room = columns
+        position = 0
+        for match in [*SGROptimizer.tokenizer().finditer(line), None]:
+            end = match.start() if match is not None else len(line)
+            text = line[position:end]
+            if room > 0 and text:
+                kept = 0
+                for char in text:
+                    if unicodedata.combining(char):
+                        size = 0
+                    else:
+                        size = 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+                    if size > room:
+                        room = 0
+                        break
+                    room -= size
+                    kept += 1
+                parts.append(text[:kept])
+            if match is not None:
+                parts.append(match.group())
+                position = match.end()
+        return "".join(parts)
+    
+    def draw(self, lines):
+        """Substitui o bloco por `lines` (False se a saída está no meio de uma linha)"""
+        import shutil
+        
+        # Uma coluna de folga: escrever até a última coluna quebra a linha em alguns terminais
+        columns = max(1, shutil.get_terminal_size().columns - 1)
+        lines = [LiveBlock.fit(line, columns) for line in lines]
+        with self.lock:
+            if not self.line_start:
+                return False
+            height = self.height
+            out = (f"\033[{height - 1}A\r" if height > 1 else "\r") + "\033[K\n".join(lines)
+            if len(lines) < height or not lines:
+                out += "\033[J"
+            else:
+                out += "\033[K"
+            self.height = len(lines)
+            self.stream.write(out)
+            self.stream.flush()
+            return True
+    
+    # Stream: sys.stdout enquanto o bloco está instalado
+    
+    def write(self, text):
+        with self.lock:
+            if self.height:
+                self.stream.write(self.erase())
+            self.stream.write(text)
+            if text:
+                self.line_start = text.endswith("\n")
+        return len(text)
+    
+    def flush(self):
+        with self.lock:
+            self.stream.flush()
+    
+    def __getattr__(self, name):
+        stream = self.__dict__.get("stream")
+        if stream is None:
+            raise AttributeError(name)
+        return getattr(stream, name)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SPINNER EM SEGUNDO PLANO
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class Spinner:
+    """Spinner em uma thread de fundo enquanto o trabalho roda na principal
+    
+        with Animations.spinning("Deploying"):
+            deploy()
+        
+        @Animations.spinning("Compilando")
+        def build():
+            ...
+    
+    O quadro é desenhado num LiveBlock de uma linha: prints do trabalho (de
+    qualquer thread) apagam o spinner antes de escrever e nunca se misturam
+    com ele. Ao sair (inclusive com exceção) a thread para e a linha é limpa.
+    """
+    
+    def __init__(self, text="Loading", style="dots", color="#00BFFF", fps=10):
+        self.options = (text, style, color, fps)
+        self.fps = fps
+        self.frames = Animations.spinner_frames(text, style, color)
+        self.block = None
+        self.thread = None
+        self.stopping = None
+        self.cpu = 0.0  # segundos de CPU da thread do spinner
+    
+    def start(self):
+        import threading
+        
+        self.block = LiveBlock().install()
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="shark-spinner", daemon=True)
+        self.thread.start()
+        return self
+    
+    def stop(self):
+        if self.thread is None:
+            return
+        self.stopping.set()
+        self.thread.join()
+        self.thread = None
+        self.block.uninstall()
+    
+    def run(self):
+        """Laço da thread: um quadro por prazo do FrameScheduler"""
+        frames, draw, stopping = self.frames, self.block.draw, self.stopping
+        count = len(frames)
+        start = time.thread_time()
+        
+        for index in FrameScheduler(fps=self.fps, sleep=stopping.wait):
+            if stopping.is_set():
+                break
+            draw([frames[index % count]])
+        
+        self.cpu = time.thread_time() - start
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+    
+    def __call__(self, func):
+        """Decorator: cada chamada gira o seu próprio spinner"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with Spinner(*self.options):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ANIMAÇÕES ASSÍNCRONAS (ASYNCIO)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class StatusLine:
+    """Uma linha do AsyncBoard: spinner com texto, ou barra quando há total"""
+    
+    def __init__(self, text="", style="dots", color="#00BFFF", total=None, bar_style="default", width=30):
+        self.text = text
+        self.color = color
+        self.total = total
+        self.bar_style = bar_style
+        self.width = width
+        self.count = 0
+        self.frames = Animations.spinner_frames(text, style, color)
+    
+    def render(self, index):
+        if self.total:
+            bar = ProgressBar.render(min(self.count, self.total), self.total, self.width, self.bar_style, self.color)
+            return f"{bar} {self.text} {self.count}/{self.total}"
+        frame = self.frames[index % len(self.frames)]
+        return f"{frame} {self.count}" if self.count else frame
+    
+    def final(self, ok=True):
+        """Linha fixada acima do bloco quando a linha termina"""
+        if self.total and ok:
+            return self.render(0)
+        mark = f"{Colors.GREEN}✓" if ok else f"{Colors.RED}✗"
+        return f"{mark}{Colors.RESET} {self.text}"
+
+
+class AsyncBoard:
+    """Um renderizador para várias linhas de status no asyncio (sem threads)
+    
+    Cada corrotina adiciona a sua StatusLine; uma única task redesenha o bloco
+    inteiro (LiveBlock) a `fps` quadros por segundo e termina quando a última
+    linha sai. Linhas que terminam ficam fixadas acima do bloco.
+    """
+    
+    _shared = None
+    
+    def __init__(self, fps=10):
+        self.fps = fps
+        self.lines = []
+        self.block = None
+        self.task = None
+        self.index = 0
+        self.loop = None
+    
+    @classmethod
+    def shared(cls):
+        """Painel comum do event loop em execução (chamado de dentro de corrotinas)"""
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        board = cls._shared
+        if board is None or board.loop is not loop:
+            board = cls._shared = cls()
+            board.loop = loop
+        return board
+    
+    def add(self, line):
+        import asyncio
+        
+        self.lines.append(line)
+        if self.task is None:
+            self.block = LiveBlock().install()
+            self.task = asyncio.ensure_future(self.run())
+        self.draw()
+        return line
+    
+    def remove(self, line, final=None):
+        self.lines.remove(line)
+        if final is not None:
+            self.block.write(final + "\n")
+        if self.lines:
+            self.draw()
+        else:
+            self.task.cancel()
+            self.task = None
+            self.block.uninstall()
+            self.block = None
+    
+    def draw(self):
+        self.block.draw([line.render(self.index) for line in self.lines])
+    
+    async def run(self):
+        async for index in FrameScheduler(fps=self.fps):
+            self.index = index
+            self.draw()
+
+
+class AsyncSpinning:
+    """`async with` de AsyncAnimations.spinning: uma linha no painel comum"""
+    
+    def __init__(self, text, style, color):
+        self.line = StatusLine(text, style, color)
+        self.board = None
+    
+    async def __aenter__(self):
+        self.board = AsyncBoard.shared()
+        self.board.add(self.line)
+        return self.line
+    
+    async def __aexit__(self, exc_type, exc, traceback):
+        self.board.remove(self.line, self.line.final(exc_type is None))
+        return False
+
+
+class AsyncAnimations:
+    """Versões asyncio das animações: asyncio.sleep e o relógio do loop
+    
+    Usam os mesmos renderizadores de quadro das versões síncronas e o mesmo
+    FrameScheduler (async for). spinning e track compartilham um AsyncBoard,
+    então várias corrotinas informam o seu estado pelo mesmo renderizador.
+    """
+    
+    @staticmethod
+    async def typing_effect(text, delay=0.03, color=None):
+        """Efeito de digitação"""
+        chunks = Animations.typing_chunks(text, color)
+        written = 0
+        async for i in FrameScheduler.every(delay, frames=len(chunks)):
+            sys.stdout.write("".join(chunks[written:i + 1]))
+            sys.stdout.flush()
+            written = i + 1
+        print()
+    
+    @staticmethod
+    async def glitch_text(text, intensity=3, duration=1, color="#00FF00", fps=20):
+        """Efeito glitch no texto"""
+        async for _ in FrameScheduler(fps=fps, duration=duration):
+            sys.stdout.write("\r" + Animations.glitch_frame(text, intensity, color))
+            sys.stdout.flush()
+        
+        sys.stdout.write(f"\r{Colors.hex(color)}{text}{Colors.RESET}" + " " * 10)
+        print()
+    
+    @staticmethod
+    async def spinner(text="Loading", style="dots", duration=3, color="#00BFFF", fps=10):
+        """Spinner por `duration` segundos (aguardável ou em asyncio.create_task)"""
+        frames = Animations.spinner_frames(text, style, color)
+        
+        async for i in FrameScheduler(fps=fps, duration=duration):
+            sys.stdout.write("\r" + frames[i % len(frames)])
+            sys.stdout.flush()
+        
+        sys.stdout.write("\r\033[K")
+        sys.stdout.flush()
+    
+    @staticmethod
+    def spinning(text="Loading", style="dots", color="#00BFFF"):
+        """Spinner no painel comum enquanto o bloco `async with` roda"""
+        return AsyncSpinning(text, style, color)
+    
+    @staticmethod
+    async def track(iterable, total=None, text="", style="default", color="#00BFFF"):
+        """Itera (async ou não) mostrando o progresso no painel comum
+        
+            async for item in AsyncAnimations.track(fetch_all(), total=120, text="downloads"):
+                ...
+        """
+        if total is None and hasattr(iterable, "__len__"):
+            total = len(iterable)
+        board = AsyncBoard.shared()
+        line = board.add(StatusLine(text, color=color, total=total, bar_style=style))
+        ok = False
+        try:
+            if hasattr(iterable, "__aiter__"):
+                async for item in iterable:
+                    yield item
+                    line.count += 1
+            else:
+                for item in iterable:
+                    yield item
+                    line.count += 1
+            ok = True
+        finally:
+            board.remove(line, line.final(ok))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CHUVA MATRIX (TELA CHEIA)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class MatrixRain:
+    """Chuva Matrix em tela cheia: a tela rola e só as células novas são escritas
+    
+    Todas as gotas descem uma linha por quadro, então em vez de mover cada
+    gota o quadro rola a tela uma linha para baixo (ESC M no topo) e o
+    terminal desloca tudo de uma vez. Cada gota entra por cima a partir da
+    cabeça: a primeira célula, a mais clara, vai na frente e o rastro escurece
+    atrás dela (BANDS), sem nada a recolorir na tela. Por quadro saem só as
+    células acesas da linha nova e os caracteres que cintilam, agrupados por
+    nível (um escape de cor por nível) e com o cursor posicionado. As colunas
+    guardam só o que falta da gota e a espera até a próxima, em arrays
+    compactos; a tela fica num anel de linhas (nível e caractere). Os bytes
+    aleatórios de um quadro saem de um único getrandbits.
+    """
+    
+    CHARS = "ｱｲｳｴｵｶｷｸｹｺｻｼｽｾｿﾀﾁﾂﾃﾄﾅﾆﾇﾈﾉﾊﾋﾌﾍﾎﾏﾐﾑﾒﾓﾔﾕﾖﾗﾘﾙﾚﾛﾜﾝ0123456789"
+    # Cores por nível de brilho (1 = fim do rastro, último = cabeça)
+    SHADES = ["#003B00", "#008F11", "#00C832", "#00FF41", "#B4FFB4"]
+    # Distâncias da cabeça em que o nível cai uma faixa
+    BANDS = (1, 3, 7, 11)
+    MIN_LENGTH = 5
+    MAX_LENGTH = 15
+    FLICKER = 6  # em 256: chance por coluna e quadro de um caractere do rastro trocar
+    
+    ENTER = "\033[?1049h\033[?25l"
+    LEAVE = "\033[0m\033[?25h\033[?1049l"
+    SCROLL = "\033[H\033M"  # cursor no topo + índice reverso: a tela desce uma linha
+    
+    def __init__(self, width=None, height=None, seed=None):
+        import random
+        
+        self.random = random.Random(seed)
+        self.fixed = (width, height)
+        self.codes = [""] + [Colors.hex(color) for color in self.SHADES]
+        
+        top = len(self.SHADES)
+        # Nível de cada célula da gota pela distância até a cabeça
+        self.shade = bytes(top - sum(distance >= band for band in self.BANDS)
+                           for distance in range(self.MAX_LENGTH))
+        # Byte aleatório -> 1 se a coluna cintila neste quadro (busca com bytes.find)
+        self.flicker = bytes(int(value < self.FLICKER) for value in range(256))
+        self.resize(*self.measure())
+    
+    def measure(self):
+        """Tamanho da área de desenho (width/height fixos têm prioridade)"""
+        width, height = self.fixed
+        if width is None or height is None:
+            try:
+                size = os.get_terminal_size()
+                columns, lines = size.columns, size.lines
+            except OSError:
+                columns, lines = 80, 24
+            width = width or columns
+            height = height or lines
+        return max(1, width), max(1, height)
+    
+    def pool(self, count):
+        """`count` bytes aleatórios de uma vez"""
+        return self.random.getrandbits(8 * count).to_bytes(count, "little")
+    
+    def resize(self, width, height):
+        """Recria colunas e tela; o próximo quadro limpa o terminal"""
+        from array import array
+        
+        self.width, self.height = width, height
+        # Anel de linhas (0 = topo): nível de brilho (0 = vazio) e caractere de cada célula
+        self.rows = [(bytearray(width), [" "] * width) for _ in range(height)]
+        self.dirty = []
+        
+        pool = self.pool(width)
+        self.lengths = array("B", bytes(width))  # comprimento da gota atual
+        self.left = array("B", bytes(width))     # células da gota que ainda vão entrar
+        self.starts = array("L", [pool[x] % height for x in range(width)])  # quadro da próxima gota
+        self.tick = 0
+        self.clear = True
+    
+    def step(self):
+        """Desce a chuva uma linha: linha nova no topo do anel, marcando as células a escrever"""
+        width, height, rows = self.width, self.height, self.rows
+        lengths, left, starts = self.lengths, self.left, self.starts
+        shade, charset = self.shade, self.CHARS
+        count = len(charset)
+        span = self.MAX_LENGTH - self.MIN_LENGTH + 1
+        tick = self.tick
+        self.tick += 1
+        dirty = self.dirty
+        
+        pool = self.pool(width * 4)
+        spawns, waits, picks, chances = (pool[i * width:(i + 1) * width] for i in range(4))
+        
+        if height > 1:
+            marks = chances.translate(self.flicker)
+            x = marks.find(1)
+            while x >= 0:
+                # Um caractere já na tela troca; a linha y vira a y + 1 com a rolagem
+                y = picks[x] % (height - 1)
+                shown_levels, shown_chars = rows[y]
+                if shown_levels[x]:
+                    shown_chars[x] = charset[(spawns[x] + chances[x]) % count]
+                    dirty.append((y + 1) * width + x)
+                x = marks.find(1, x + 1)
+        
+        levels = bytearray(width)
+        chars = [" "] * width
+        for x in range(width):
+            remaining = left[x]
+            if not remaining:
+                if tick < starts[x]:
+                    continue
+                # Nova gota: comprimento e o quadro da seguinte (depois de uma espera)
+                remaining = lengths[x] = self.MIN_LENGTH + spawns[x] % span
+                starts[x] = tick + remaining + waits[x] % height
+            levels[x] = shade[lengths[x] - remaining]
+            left[x] = remaining - 1
+            chars[x] = charset[picks[x] % count]
+            dirty.append(x)
+        
+        rows.insert(0, (levels, chars))
+        rows.pop()
+    
+    def render(self):
+        """Rola a tela e escreve as células marcadas no passo"""
+        width, rows, codes = self.width, self.rows, self.codes
+        
+        # Agrupadas por nível: um escape de cor por nível e quadro
+        groups = [[] for _ in codes]
+        for index in sorted(self.dirty):
+            y, x = divmod(index, width)
+            groups[rows[y][0][x]].append(index)
+        self.dirty = []
+        
+        out = ["\033[2J"] if self.clear else []
+        write = out.append
+        self.clear = False
+        write(self.SCROLL)
+        top = rows[0][0]
+        cursor = 0  # célula onde o cursor está (-1 = desconhecida); o ESC M o deixa no início
+        
+        for level, indexes in enumerate(groups):
+            if not indexes:
+                continue
+            write(codes[level])
+            for index in indexes:
+                y, x = divmod(index, width)
+                if index != cursor:
+                    gap = index - cursor
+                    if cursor >= 0 and cursor // width == y and gap > 0:
+                        move = "\033[C" if gap == 1 else f"\033[{gap}C"
+                        # Linha nova (vazia depois da rolagem): vão curto sem nada aceso sai como espaços
+                        if gap < len(move) and y == 0 and not any(top[cursor:index]):
+                            move = " " * gap
+                        write(move)
+                    else:
+                        write(f"\033[{y + 1}H" if x == 0 else f"\033[{y + 1};{x + 1}H")
+                write(rows[y][1][x])
+                # Na última coluna o cursor fica parado: o próximo salto é absoluto
+                cursor = index + 1 if (index + 1) % width else -1
+        
+        return "".join(out)
+    
+    def frame(self):
+        """Próximo quadro como texto (passo + render)"""
+        self.step()
+        return self.render()
+    
+    def run(self, duration=5, fps=20):
+        """Anima na tela alternativa e restaura o terminal ao sair (inclusive Ctrl+C)"""
+        out = sys.stdout
+        out.write(self.ENTER)
+        try:
+            for _ in FrameScheduler(fps=fps, duration=duration):
+                size = self.measure()
+                if size != (self.width, self.height):
+                    self.resize(*size)
+                out.write(self.frame())
+                out.flush()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            out.write(self.LEAVE)
+            out.flush()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -659,17 +2822,73 @@ class Banners:
         return all_banners
     
     @staticmethod
-    def render(name, colors=None, bold=False):
-        """Renderiza um banner com cores"""
+    def render(name, colors=None, bold=False, mode="flow"):
+        """Renderiza um banner com cores (mode: ver Colors.GRADIENT_MODES)"""
         all_banners = Banners.get_all_banners()
         banner = all_banners.get(name.upper(), Banners.BUILTIN["SHARK"])
         
         if colors and len(colors) >= 2:
-            return Colors.multi_gradient(banner, colors, bold)
+            return Colors.gradient_2d(banner, colors, mode, bold)
         elif colors and len(colors) == 1:
             return f"{Colors.hex(colors[0])}{banner}{Colors.RESET}"
         else:
             return banner
+    
+    @staticmethod
+    def sources(config):
+        """Arquivos que definem o banner da configuração (builtin, pasta e arquivo custom)"""
+        name = config.get("banner", "SHARK").upper()
+        # Mesma busca do load_custom_banners: nome do arquivo sem diferenciar maiúsculas
+        custom = sorted(file for file in BANNERS_DIR.glob("*.txt") if file.stem.upper() == name)
+        return [__file__, BANNERS_DIR, *custom]
+    
+    @staticmethod
+    def cache_key(config):
+        """Chave do cache do banner: tudo que altera a saída renderizada"""
+        return repr((
+            config.get("banner", "SHARK").upper(),
+            list(config.get("banner_colors") or []),
+            config.get("banner_gradient_mode", "flow"),
+            True,  # bold
+            [file_signature(path) for path in Banners.sources(config)],
+            TERMINAL,
+            Colors.DEPTH,
+        ))
+    
+    @staticmethod
+    def cached_render(config):
+        """Banner da configuração já renderizado em bytes, vindo do cache em disco quando válido"""
+        key = Banners.cache_key(config).encode('utf-8', 'surrogateescape')
+        
+        try:
+            with open(BANNER_CACHE_FILE, 'rb') as f:
+                header, _, payload = f.read().partition(b"\n")
+            if header == key:
+                return payload
+        except OSError:
+            pass
+        
+        payload = (Banners.render_config(config) + "\n").encode('utf-8')
+        
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = BANNER_CACHE_FILE.with_name(f"{BANNER_CACHE_FILE.name}.{os.getpid()}.tmp")
+            tmp_file.write_bytes(key + b"\n" + payload)
+            os.replace(tmp_file, BANNER_CACHE_FILE)
+        except OSError:
+            pass
+        
+        return payload
+    
+    @staticmethod
+    def render_config(config):
+        """Renderiza o banner definido na configuração"""
+        return Banners.render(
+            config.get("banner", "SHARK"),
+            config.get("banner_colors", ["#00BFFF", "#0080FF"]),
+            bold=True,
+            mode=config.get("banner_gradient_mode", "flow"),
+        )
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -682,6 +2901,8 @@ class Security:
     @staticmethod
     def hash_password(password, salt=None):
         """Gera hash seguro da senha"""
+        import hashlib
+        
         if salt is None:
             salt = os.urandom(32).hex()
         
@@ -702,6 +2923,9 @@ class Security:
     @staticmethod
     def save_credentials(password):
         """Salva credenciais de forma segura"""
+        import json
+        from datetime import datetime
+        
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         salt, password_hash = Security.hash_password(password)
         
@@ -711,7 +2935,11 @@ class Security:
             "created": datetime.now().isoformat()
         }
         
-        with open(CREDENTIALS_FILE, 'w', encoding='utf-8') as f:
+        # Só o dono lê o hash (O_CREAT não muda o modo de um arquivo que já existia)
+        fd = os.open(str(CREDENTIALS_FILE), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        if hasattr(os, 'fchmod'):
+            os.fchmod(fd, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
             json.dump(credentials, f)
         
         # Torna o arquivo oculto no Windows
@@ -725,6 +2953,8 @@ class Security:
     @staticmethod
     def load_credentials():
         """Carrega credenciais"""
+        import json
+        
         if not CREDENTIALS_FILE.exists():
             return None
         
@@ -753,9 +2983,123 @@ class Security:
                 pass
         return input(message)
     
+    # ═══════════════════════════════════════════════════════════════════════════
+    # TICKETS DE SESSÃO - evitam PBKDF2 (e leitura de senha) a cada comando
+    # ═══════════════════════════════════════════════════════════════════════════
+    
+    # Saída do prompt enquanto não houver ticket válido
+    LOCKED_PROMPT = "🔒 > "
+    
+    @staticmethod
+    def locked_output(command):
+        """Saída de prompt/banner sem ticket válido (cor resolvida na profundidade atual)"""
+        if command == "prompt":
+            return Security.LOCKED_PROMPT
+        return f"{Colors.hex('#FF6B6B')}🔒 Shark protegido por senha - use: shark unlock{Colors.RESET}\n"
+    
+    @staticmethod
+    def session_id():
+        """Identifica a sessão do terminal (tty + sessão do processo)"""
+        try:
+            tty = os.ttyname(0)
+        except (OSError, AttributeError):
+            tty = ""
+        session = os.getsid(0) if hasattr(os, 'getsid') else os.getppid()
+        return f"{tty}|{session}"
+    
+    @staticmethod
+    def read_key():
+        """Chave dos tickets, só se o diretório de runtime for privado (senão OSError)"""
+        runtime_dir = private_dir(RUNTIME_DIR)
+        if runtime_dir is None:
+            raise PermissionError(f"Diretório de runtime inseguro: {RUNTIME_DIR}")
+        return (runtime_dir / "session.key").read_bytes()
+    
+    @staticmethod
+    def session_key():
+        """Chave secreta dos tickets: aleatória, no diretório de runtime privado"""
+        runtime_dir = private_dir(RUNTIME_DIR, create=True)
+        if runtime_dir is None:
+            raise PermissionError(f"Diretório de runtime inseguro: {RUNTIME_DIR}")
+        
+        key_file = runtime_dir / "session.key"
+        try:
+            return key_file.read_bytes()
+        except OSError:
+            pass
+        
+        key = os.urandom(32)
+        try:
+            fd = os.open(str(key_file), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            return key_file.read_bytes()  # Outro processo criou primeiro
+        with os.fdopen(fd, 'wb') as f:
+            f.write(key)
+        return key
+    
+    @staticmethod
+    def ticket_mac(key, session, expires):
+        """MAC do ticket: amarrado à sessão, à validade e às credenciais atuais"""
+        import hmac
+        import hashlib
+        
+        # Trocar ou remover a senha muda as credenciais e invalida todos os tickets
+        message = f"{session}|{expires}|".encode('utf-8', 'surrogateescape') + CREDENTIALS_FILE.read_bytes()
+        return hmac.new(key, message, hashlib.sha256).hexdigest()
+    
+    @staticmethod
+    def ticket_path(key, session):
+        """Arquivo do ticket da sessão (nome derivado da chave, sem expor o tty)"""
+        import hmac
+        import hashlib
+        
+        name = hmac.new(key, session.encode('utf-8', 'surrogateescape'), hashlib.sha256).hexdigest()[:32]
+        return RUNTIME_DIR / f"ticket-{name}"
+    
+    @staticmethod
+    def issue_ticket(ttl):
+        """Grava um ticket para a sessão atual válido por ttl segundos"""
+        if not ttl or ttl <= 0 or not Security.is_password_set():
+            return None
+        
+        key = Security.session_key()
+        session = Security.session_id()
+        expires = int(time.time() + ttl)
+        path = Security.ticket_path(key, session)
+        
+        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(f"{expires}\n{Security.ticket_mac(key, session, expires)}")
+        return path
+    
+    @staticmethod
+    def has_valid_ticket(session=None):
+        """Verifica o ticket da sessão (HMAC, sem PBKDF2 e sem ler senha)"""
+        import hmac
+        
+        session = Security.session_id() if session is None else session
+        try:
+            key = Security.read_key()
+            expires, mac = Security.ticket_path(key, session).read_text(encoding='utf-8').split("\n", 1)
+            if time.time() >= int(expires):
+                return False
+            return hmac.compare_digest(mac, Security.ticket_mac(key, session, expires))
+        except (OSError, ValueError):
+            return False
+    
+    @staticmethod
+    def revoke_ticket():
+        """Remove o ticket da sessão atual"""
+        try:
+            key = Security.read_key()
+            Security.ticket_path(key, Security.session_id()).unlink()
+            return True
+        except OSError:
+            return False
+    
     @staticmethod
-    def authenticate():
-        """Processo de autenticação"""
+    def authenticate(ttl=None):
+        """Processo de autenticação (com ttl, emite um ticket de sessão ao autenticar)"""
         if not Security.is_password_set():
             return True
         
@@ -763,6 +3107,9 @@ class Security:
         if not credentials:
             return True
         
+        if ttl and Security.has_valid_ticket():
+            return True
+        
         print(f"\n{Colors.hex('#FF6B6B')}🔒 Shark protegido por senha{Colors.RESET}\n")
         
         for attempt in range(3):
@@ -770,6 +3117,10 @@ class Security:
             
             if Security.verify_password(password, credentials["salt"], credentials["hash"]):
                 print(f"\n  {Colors.GREEN}✓ Acesso autorizado!{Colors.RESET}\n")
+                try:
+                    Security.issue_ticket(ttl)
+                except OSError:
+                    pass  # Sem ticket: a senha será pedida de novo no próximo comando
                 return True
             else:
                 print(f"  {Colors.RED}✗ Senha incorreta{Colors.RESET}")
@@ -793,46 +3144,432 @@ class Prompt:
         "simple": "{cwd} > ",
         "hacker": "[{time}] {user}@{host}:{cwd}# ",
         "lambda": "λ {cwd} → ",
-        "git": "⎇ {cwd} ❯ ",
+        "git": "⎇ {git}{cwd} ❯ ",
         "neon": "◈ {cwd} ⟫ ",
         "box": "┌[{user}]─[{cwd}]\n└─$ ",
     }
     
+    # Equivalentes nativos das variaveis, expandidos pelo proprio shell (sem Python)
+    NATIVE_VARIABLES = {
+        "bash": {"user": r"\u", "host": r"\H", "cwd": r"\w", "time": r"\t", "date": r"\D{%Y-%m-%d}"},
+        "zsh": {"user": "%n", "host": "%M", "cwd": "%~", "time": "%*", "date": "%D{%Y-%m-%d}"},
+    }
+    
+    # Provedores de cada variável: só os usados pelo template são executados
+    PROVIDERS = {
+        "user": lambda context: context.get("user") or Prompt.get_user(context),
+        "host": lambda context: Prompt.get_host(context),
+        "cwd": lambda context: Prompt.get_cwd(context),
+        "system": lambda context: SYSTEM,
+        "terminal": lambda context: context.get("terminal") or TERMINAL,
+        "time": lambda context: Prompt.get_time(context, "%H:%M:%S"),
+        "date": lambda context: Prompt.get_time(context, "%Y-%m-%d"),
+        "branch": lambda context: GitInfo.lookup(context)["branch"],
+        "dirty": lambda context: "*" if GitInfo.lookup(context)["dirty"] else "",
+        "git": lambda context: GitInfo.segment(context),
+    }
+    
+    # Variáveis de ambiente do usuário, na ordem do getpass.getuser()
+    USER_ENV = ('LOGNAME', 'USER', 'LNAME', 'USERNAME')
+    
+    # Memória entre renders (processos longos: daemon, menus, renders em lote)
+    _session_cache = {}
+    
     @staticmethod
-    def get_variables():
-        """Retorna variáveis disponíveis para o prompt"""
-        import getpass
-        import socket
-        
-        cwd = os.getcwd()
-        home = str(Path.home())
+    def session_value(name, signature, compute):
+        """Valor estável na sessão: recalculado só quando a assinatura (barata) muda"""
+        cached = Prompt._session_cache.get(name)
+        if cached is None or cached[0] != signature:
+            cached = (signature, compute())
+            Prompt._session_cache[name] = cached
+        return cached[1]
+    
+    @staticmethod
+    def get_user(context):
+        """Usuário atual (getpass só é importado quando ambiente/uid mudam)"""
+        def compute():
+            import getpass
+            return getpass.getuser()
+        
+        env = tuple(os.environ.get(key) for key in Prompt.USER_ENV)
+        uid = os.getuid() if hasattr(os, 'getuid') else None
+        return Prompt.session_value("user", (env, uid), compute)
+    
+    @staticmethod
+    def get_host(context):
+        """Nome da máquina (socket só é importado quando o hostname muda)"""
+        def compute():
+            import socket
+            return socket.gethostname()
+        
+        signature = os.uname().nodename if hasattr(os, 'uname') else os.environ.get('COMPUTERNAME')
+        return Prompt.session_value("host", signature, compute)
+    
+    @staticmethod
+    def get_cwd(context):
+        """Diretório atual com a home abreviada para ~"""
+        cwd = context.get("cwd") or os.getcwd()
+        home = os.path.expanduser("~")
         if cwd.startswith(home):
             cwd = "~" + cwd[len(home):]
-        
-        return {
-            "user": getpass.getuser(),
-            "host": socket.gethostname(),
-            "cwd": cwd,
-            "system": SYSTEM,
-            "terminal": TERMINAL,
-            "time": datetime.now().strftime("%H:%M:%S"),
-            "date": datetime.now().strftime("%Y-%m-%d"),
-        }
+        return cwd
+    
+    @staticmethod
+    def get_time(context, fmt):
+        """Hora/data a partir de um único instante por render"""
+        if "now" not in context:
+            context["now"] = time.localtime()
+        return time.strftime(fmt, context["now"])
+    
+    @staticmethod
+    def get_variables(cwd=None, names=None, client=None):
+        """Retorna variáveis disponíveis para o prompt (apenas as de names, se informado)
+        
+        client: valores de outro processo (user, terminal) que substituem os deste, ex.: no daemon.
+        """
+        context = dict(client or (), cwd=cwd)
+        if names is None:
+            names = Prompt.PROVIDERS
+        return {name: Prompt.PROVIDERS[name](context) for name in names}
     
     @staticmethod
-    def render(template_name="shark", custom_template=None, color=None):
-        """Renderiza o prompt"""
+    def compile_native(shell, template_name="shark", custom_template=None, color=None):
+        """Compila o template para um PS1 (bash) ou PROMPT (zsh) estatico.
+        
+        Retorna a string ja com quoting para o shell, ou None se o template usar
+        algo que o shell nao expande nativamente (cai no prompt dinamico).
+        """
+        import re
+        import string
+        
+        natives = Prompt.NATIVE_VARIABLES.get(shell)
+        if natives is None:
+            return None
+        
         template = custom_template or Prompt.TEMPLATES.get(template_name, Prompt.TEMPLATES["shark"])
-        variables = Prompt.get_variables()
+        static = {"system": SYSTEM}
+        
+        def literal(text, followed=False):
+            # Barras, crases e "$" seguidos de texto (ou de uma variável) seriam expandidos pelo shell
+            if "\\" in text or "`" in text or re.search(r"\$\S", text) or (followed and text.endswith("$")):
+                return None
+            return text.replace("%", "%%") if shell == "zsh" else text.replace("\n", r"\n")
         
+        parts = []
         try:
-            prompt = template.format(**variables)
-        except KeyError:
-            prompt = Prompt.TEMPLATES["shark"].format(**variables)
+            parsed = list(string.Formatter().parse(template))
+        except ValueError:
+            return None
+        
+        for text, field, spec, conversion in parsed:
+            text = literal(text, field is not None)
+            if text is None:
+                return None
+            parts.append(text)
+            
+            if field is None:
+                continue
+            if spec or conversion:
+                return None
+            if field in natives:
+                parts.append(natives[field])
+            elif field in static and literal(static[field]) is not None:
+                parts.append(literal(static[field]))
+            else:
+                return None
+        
+        body = "".join(parts)
+        
+        if shell == "bash":
+            if color:
+                body = rf"\[{Colors.hex(color)}\]{body}\[{Colors.RESET}\]"
+            body = body.replace("\033", r"\e")
+            return "'" + body.replace("'", "'\\''") + "'"
         
         if color:
-            return f"{Colors.hex(color)}{prompt}{Colors.RESET}"
-        return prompt
+            body = f"%{{{Colors.hex(color)}%}}{body}%{{{Colors.RESET}%}}"
+        for char, escaped in (("\\", "\\\\"), ("'", "\\'"), ("\033", r"\e"), ("\n", r"\n")):
+            body = body.replace(char, escaped)
+        return "$'" + body + "'"
+    
+    @staticmethod
+    def render(template_name="shark", custom_template=None, color=None, cwd=None, client=None):
+        """Renderiza o prompt (cwd e client permitem renderizar para outro processo, ex: daemon)"""
+        template = custom_template or Prompt.TEMPLATES.get(template_name, Prompt.TEMPLATES["shark"])
+        
+        try:
+            compiled = PromptTemplate.get(template, color)
+        except ValueError:
+            compiled = PromptTemplate.get(Prompt.TEMPLATES["shark"], color)
+        
+        return compiled.render(cwd, client)
+    
+    @staticmethod
+    def render_snapshot(snapshot, cwd=None):
+        """Renderiza o prompt a partir do snapshot (template e cor já resolvidos)"""
+        derived = snapshot["derived"]
+        return PromptTemplate.get(derived["prompt_template"], derived["prompt_rgb"]).render(cwd)
+    
+    @staticmethod
+    def render_config(config, cwd=None, client=None):
+        """Renderiza o prompt definido na configuração"""
+        return Prompt.render(
+            config.get("prompt_style", "shark"),
+            config.get("custom_prompt"),
+            config.get("prompt_color", "#00BFFF"),
+            cwd=cwd,
+            client=client,
+        )
+
+
+class PromptTemplate:
+    """Template de prompt pré-compilado: segmentos literais + variáveis, com a cor já embutida"""
+    
+    # Templates compilados por (template, cor, profundidade de cor)
+    _cache = {}
+    
+    def __init__(self, template, color=None):
+        """Compila o template. Lança ValueError se for inválido"""
+        import string
+        
+        self.template = template
+        self.color = color
+        # A cor pode vir como HEX ou como tupla RGB já convertida (snapshot da config)
+        if isinstance(color, tuple):
+            self.parts = [Colors.rgb(*color)]
+        else:
+            self.parts = [Colors.hex(color) if color else ""]
+        self.slots = []
+        
+        for literal, field, spec, conversion in string.Formatter().parse(template):
+            if literal:
+                self.parts.append(literal)
+            if field is None:
+                continue
+            if field not in Prompt.PROVIDERS:
+                raise ValueError(f"Variável desconhecida: {{{field}}}")
+            if conversion not in (None, "s", "r", "a"):
+                raise ValueError(f"Conversão inválida em {{{field}}}")
+            if spec:
+                format("", spec)  # Valida o format spec agora, não a cada prompt
+            
+            self.slots.append((len(self.parts), field, spec, conversion))
+            self.parts.append(None)
+        
+        self.parts.append(Colors.RESET if color else "")
+        self.fields = tuple(dict.fromkeys(field for _, field, _, _ in self.slots))
+    
+    @staticmethod
+    def get(template, color=None):
+        """Retorna o template compilado (compila apenas na primeira vez)"""
+        key = (template, color, Colors.DEPTH)
+        compiled = PromptTemplate._cache.get(key)
+        if compiled is None:
+            compiled = PromptTemplate(template, color)
+            PromptTemplate._cache[key] = compiled
+        return compiled
+    
+    @staticmethod
+    def validate(template):
+        """Retorna a mensagem de erro do template ou None se for válido"""
+        try:
+            PromptTemplate.get(template)
+        except ValueError as e:
+            return str(e) or "Template inválido"
+        return None
+    
+    def render(self, cwd=None, client=None):
+        """Renderiza: só os provedores usados rodam e o resultado sai de um único join"""
+        variables = Prompt.get_variables(cwd, self.fields, client)
+        parts = self.parts.copy()
+        
+        for index, field, spec, conversion in self.slots:
+            value = variables[field]
+            if conversion == "r":
+                value = repr(value)
+            elif conversion == "a":
+                value = ascii(value)
+            parts[index] = format(value, spec) if spec else str(value)
+        
+        return "".join(parts)
+
+
+class GitInfo:
+    """Segmento git do prompt: branch lido direto do .git, estado "sujo" via cache"""
+    
+    # Estado sujo: revalidado em background após STATUS_TTL segundos ou quando o index muda
+    STATUS_TTL = 5
+    # Prazo máximo do "git status" em background (monorepos grandes)
+    STATUS_TIMEOUT = 2
+    
+    EMPTY = {"branch": "", "dirty": False}
+    
+    # Processos longos (daemon) atualizam em uma thread em vez de disparar outro processo
+    refresh_in_thread = False
+    
+    @staticmethod
+    def find_repo(cwd):
+        """Procura o repositório subindo a partir de cwd. Retorna (worktree, git_dir) ou None"""
+        path = os.path.abspath(cwd)
+        while True:
+            dot_git = os.path.join(path, ".git")
+            if os.path.isdir(dot_git):
+                return path, dot_git
+            if os.path.isfile(dot_git):
+                # Worktrees e submódulos: arquivo com "gitdir: <caminho>"
+                try:
+                    with open(dot_git, 'r', encoding='utf-8') as f:
+                        content = f.read().strip()
+                except OSError:
+                    return None
+                if content.startswith("gitdir:"):
+                    return path, os.path.join(path, content[7:].strip())
+                return None
+            
+            parent = os.path.dirname(path)
+            if parent == path:
+                return None
+            path = parent
+    
+    @staticmethod
+    def read_branch(git_dir):
+        """Branch atual lendo .git/HEAD (commit abreviado quando em detached HEAD)"""
+        try:
+            with open(os.path.join(git_dir, "HEAD"), 'r', encoding='utf-8') as f:
+                head = f.read().strip()
+        except OSError:
+            return ""
+        
+        if head.startswith("ref:"):
+            ref = head[4:].strip()
+            return ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+        return head[:7]
+    
+    @staticmethod
+    def cache_path(git_dir):
+        """Arquivo de cache do estado sujo deste repositório"""
+        import zlib
+        
+        key = zlib.crc32(os.path.abspath(git_dir).encode('utf-8', 'surrogateescape'))
+        return CACHE_DIR / "git" / f"{key:08x}.status"
+    
+    @staticmethod
+    def index_mtime(git_dir):
+        """mtime do index (muda com add/commit/checkout)"""
+        try:
+            return os.stat(os.path.join(git_dir, "index")).st_mtime_ns
+        except OSError:
+            return None
+    
+    @staticmethod
+    def read_cache(git_dir):
+        """Último estado conhecido: {"index": mtime, "checked": t, "dirty": bool, "pending": t}"""
+        import marshal
+        
+        try:
+            with open(GitInfo.cache_path(git_dir), 'rb') as f:
+                return marshal.loads(f.read())
+        except (OSError, ValueError, EOFError, TypeError):
+            return {}
+    
+    @staticmethod
+    def write_cache(git_dir, entry):
+        """Grava o estado do repositório no cache"""
+        import marshal
+        
+        path = GitInfo.cache_path(git_dir)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            Config.write_atomic(path, marshal.dumps(entry))
+        except (OSError, ValueError):
+            pass
+    
+    @staticmethod
+    def dirty(worktree, git_dir):
+        """Estado sujo instantâneo: devolve o último valor e agenda refresh se estiver velho"""
+        entry = GitInfo.read_cache(git_dir)
+        index = GitInfo.index_mtime(git_dir)
+        now = time.time()
+        
+        fresh = entry.get("index") == index and now - entry.get("checked", 0) < GitInfo.STATUS_TTL
+        pending = now - entry.get("pending", 0) < GitInfo.STATUS_TIMEOUT + 1
+        
+        if not fresh and not pending:
+            entry["pending"] = now
+            GitInfo.write_cache(git_dir, entry)
+            GitInfo.spawn_refresh(worktree, git_dir)
+        
+        return entry.get("dirty", False)
+    
+    @staticmethod
+    def spawn_refresh(worktree, git_dir):
+        """Dispara o "git status" em segundo plano (o prompt nunca espera)"""
+        import subprocess
+        
+        if GitInfo.refresh_in_thread:
+            import threading
+            threading.Thread(target=GitInfo.refresh, args=(worktree, git_dir), daemon=True).start()
+            return
+        
+        # Importa o shark (bytecode em cache) em vez de executar o script, que seria recompilado
+        code = "import sys; sys.path.insert(0, sys.argv[1]); import shark; shark.GitInfo.refresh(*sys.argv[2:4])"
+        try:
+            subprocess.Popen(
+                [sys.executable, "-c", code, os.path.dirname(os.path.abspath(__file__)), worktree, git_dir],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        except OSError:
+            pass
+    
+    @staticmethod
+    def refresh(worktree, git_dir):
+        """Executa "git status" com prazo máximo e atualiza o cache"""
+        import subprocess
+        
+        entry = GitInfo.read_cache(git_dir)
+        index = GitInfo.index_mtime(git_dir)
+        
+        try:
+            result = subprocess.run(
+                ["git", "-C", worktree, "status", "--porcelain", "--untracked-files=no"],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=GitInfo.STATUS_TIMEOUT,
+            )
+            if result.returncode == 0:
+                entry["dirty"] = bool(result.stdout.strip())
+        except (OSError, subprocess.TimeoutExpired):
+            pass  # Mantém o último valor; nova tentativa só depois do STATUS_TTL
+        
+        entry.update({"index": index, "checked": time.time(), "pending": 0})
+        GitInfo.write_cache(git_dir, entry)
+    
+    @staticmethod
+    def lookup(context):
+        """Informações git do diretório do render (calculadas uma vez por render)"""
+        if "git" not in context:
+            repo = GitInfo.find_repo(context.get("cwd") or os.getcwd())
+            if repo is None:
+                context["git"] = GitInfo.EMPTY
+            else:
+                worktree, git_dir = repo
+                context["git"] = {
+                    "branch": GitInfo.read_branch(git_dir),
+                    "dirty": GitInfo.dirty(worktree, git_dir),
+                }
+        return context["git"]
+    
+    @staticmethod
+    def segment(context):
+        """Segmento "{git}": "branch* " dentro de um repositório, vazio fora"""
+        info = GitInfo.lookup(context)
+        if not info["branch"]:
+            return ""
+        return f"{info['branch']}{'*' if info['dirty'] else ''} "
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -857,18 +3594,40 @@ class ProgressBar:
         "gradient": ("█", "▓", "▒", "░"),
     }
     
+    # Frações de célula (1/8 a 7/8) para estilos preenchidos com █
+    PARTIALS = " ▏▎▍▌▋▊▉"
+    
     @staticmethod
-    def render(progress, total, width=40, style="default", color="#00BFFF", show_percent=True):
-        """Renderiza barra de progresso"""
+    def bar(fraction, width=40, style="default"):
+        """Corpo da barra; estilos de bloco cheio avançam em oitavos de célula"""
         chars = ProgressBar.STYLES.get(style, ProgressBar.STYLES["default"])
         fill_char = chars[0]
         empty_char = chars[-1]
+        fraction = min(max(fraction, 0.0), 1.0)
         
-        percentage = progress / total if total > 0 else 0
-        filled = int(width * percentage)
-        empty = width - filled
+        if fill_char != "█":
+            filled = int(width * fraction)
+            return fill_char * filled + empty_char * (width - filled)
         
-        bar = fill_char * filled + empty_char * empty
+        filled, part = divmod(int(width * fraction * 8), 8)
+        if part:
+            return fill_char * filled + ProgressBar.PARTIALS[part] + empty_char * (width - filled - 1)
+        return fill_char * filled + empty_char * (width - filled)
+    
+    @staticmethod
+    def format_time(seconds):
+        """mm:ss ou h:mm:ss (--:-- quando desconhecido)"""
+        if seconds is None or seconds != seconds or seconds == float("inf"):
+            return "--:--"
+        minutes, seconds = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}:{minutes:02}:{seconds:02}" if hours else f"{minutes:02}:{seconds:02}"
+    
+    @staticmethod
+    def render(progress, total, width=40, style="default", color="#00BFFF", show_percent=True):
+        """Renderiza barra de progresso"""
+        percentage = progress / total if total > 0 else 0
+        bar = ProgressBar.bar(percentage, width, style)
         
         if show_percent:
             percent_text = f" {percentage * 100:.1f}%"
@@ -878,6 +3637,240 @@ class ProgressBar:
         return f"{Colors.hex(color)}[{bar}]{percent_text}{Colors.RESET}"
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# PROGRESSO EM PARALELO (THREADS)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class ProgressTask:
+    """Uma barra do MultiProgress
+    
+    advance() não usa trava: cada thread soma na sua própria célula (um dict
+    de id da thread -> [contagem], em que só a dona escreve), e o render soma
+    as células. Milhões de chamadas por thread não disputam nada.
+    """
+    
+    def __init__(self, text, total=None):
+        self.text = text
+        self.total = total
+        self.cells = {}
+        self.finished = False
+        self.pinned = False  # já fixada acima do bloco (só o render mexe)
+    
+    def advance(self, amount=1):
+        try:
+            self.cells[get_ident()][0] += amount
+        except KeyError:
+            self.cells[get_ident()] = [amount]
+    
+    @property
+    def count(self):
+        return sum([cell[0] for cell in list(self.cells.values())])
+    
+    def done(self):
+        """Marca como concluída: o render fixa a linha acima do bloco"""
+        self.finished = True
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.done()
+        return False
+
+
+class MultiProgress:
+    """Várias barras (uma por tarefa, mais o total) para pools de threads
+    
+        with MultiProgress() as progress:
+            def work(item):
+                with progress.add(item.name, total=item.size) as task:
+                    for chunk in item:
+                        task.advance()
+            with ThreadPoolExecutor(32) as pool:
+                list(pool.map(work, items))
+    
+    Uma única thread redesenha o bloco (LiveBlock: o cursor sobe e reescreve)
+    a no máximo `fps` quadros por segundo, então o custo do display não
+    depende de quantas vezes advance() é chamado. Tarefas concluídas ficam
+    fixadas acima do bloco; as que não cabem no terminal viram um resumo.
+    """
+    
+    def __init__(self, fps=10, width=30, style="default", color="#00BFFF", show_total=True, max_lines=None):
+        self.fps = fps
+        self.width = width
+        self.style = style
+        self.color = color
+        self.show_total = show_total
+        self.max_lines = max_lines
+        self.tasks = []
+        self.pinned = 0
+        self.block = None
+        self.thread = None
+        self.stopping = None
+        self.cpu = 0.0  # segundos de CPU da thread de render
+    
+    def add(self, text, total=None):
+        """Nova barra (pode ser chamada de qualquer thread)"""
+        task = ProgressTask(text, total)
+        self.tasks.append(task)  # append é atômico; o render lê uma cópia
+        return task
+    
+    def line(self, text, count, total):
+        if total:
+            bar = ProgressBar.render(min(count, total), total, self.width, self.style, self.color)
+            return f"{bar} {text} {count}/{total}"
+        return f"{Colors.hex(self.color)}{count}{Colors.RESET} {text}"
+    
+    def lines(self):
+        """Linhas fixas novas e o bloco atual"""
+        tasks = list(self.tasks)
+        pinned, live = [], []
+        done_count = grand_total = 0
+        known = True
+        for task in tasks:
+            count = task.count
+            done_count += count
+            if task.total:
+                grand_total += task.total
+            else:
+                known = False
+            text = self.line(task.text, count, task.total)
+            if task.finished:
+                if not task.pinned:
+                    task.pinned = True
+                    self.pinned += 1
+                    pinned.append(text)
+            else:
+                live.append(text)
+        
+        limit = self.max_lines
+        if limit is None:
+            try:
+                limit = os.get_terminal_size().lines - 2
+            except OSError:
+                limit = 24
+        limit = max(1, limit)
+        if len(live) > limit:
+            hidden = len(live) - limit + 1
+            live = live[:limit - 1] + [f"{Colors.DIM}… +{hidden} tarefas{Colors.RESET}"]
+        
+        if self.show_total and tasks:
+            total = grand_total if known else None
+            live.append(self.line(f"Total ({self.pinned}/{len(tasks)} concluídas)", done_count, total))
+        return pinned, live
+    
+    def draw(self):
+        pinned, live = self.lines()
+        if pinned:
+            self.block.write("".join(text + "\n" for text in pinned))
+        self.block.draw(live)
+    
+    def run(self):
+        """Thread de render"""
+        start = time.thread_time()
+        for _ in FrameScheduler(fps=self.fps, sleep=self.stopping.wait):
+            if self.stopping.is_set():
+                break
+            self.draw()
+        self.cpu = time.thread_time() - start
+    
+    def start(self):
+        import threading
+        
+        self.block = LiveBlock().install()
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="shark-progress", daemon=True)
+        self.thread.start()
+        return self
+    
+    def stop(self):
+        """Para o render e deixa o estado final na tela"""
+        if self.thread is None:
+            return
+        self.stopping.set()
+        self.thread.join()
+        self.thread = None
+        
+        pinned, live = self.lines()
+        self.block.write("".join(text + "\n" for text in pinned + live))
+        self.block.uninstall()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PROGRESSO DE ITERÁVEIS (track)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+TRACK_INTERVAL = 0.1   # segundos mínimos entre redesenhos
+TRACK_SMOOTHING = 0.3  # peso da taxa mais recente na média móvel (EWMA)
+
+
+def track(iterable, total=None, text="", style="default", color="#00BFFF", width=30, interval=TRACK_INTERVAL):
+    """Itera `iterable` mostrando uma barra de progresso
+    
+        for item in shark.track(items, text="Processando"):
+            ...
+    
+    A barra (estilos de ProgressBar.STYLES, com oitavos de célula) é
+    redesenhada no máximo a cada `interval` segundos; entre um redesenho e
+    outro cada item custa só a contagem do enumerate e uma leitura do
+    relógio. Taxa e ETA usam média móvel exponencial. Prints dentro do laço
+    saem acima da barra (LiveBlock).
+    """
+    if total is None:
+        try:
+            total = len(iterable)
+        except TypeError:
+            total = None
+    
+    clock = time.monotonic
+    code = Colors.hex(color)
+    format_time = ProgressBar.format_time
+    start = clock()
+    rate = None
+    
+    def line(count, now):
+        speed = rate if rate is not None else count / (now - start) if now > start else 0
+        if total:
+            fraction = min(count / total, 1.0)
+            eta = (total - count) / speed if speed else None
+            return (f"{code}[{ProgressBar.bar(fraction, width, style)}]{Colors.RESET} {fraction * 100:5.1f}% "
+                    f"{text} {count}/{total} {speed:.1f}/s ETA {format_time(eta)}")
+        return f"{code}{count}{Colors.RESET} {text} {speed:.1f}/s {format_time(now - start)}"
+    
+    block = LiveBlock().install()
+    block.draw([line(0, start)])
+    count = last_count = 0
+    last_time = start
+    deadline = start + interval
+    try:
+        for count, item in enumerate(iterable, 1):
+            yield item
+            now = clock()
+            if now >= deadline:
+                instant = (count - last_count) / (now - last_time)
+                rate = instant if rate is None else rate + TRACK_SMOOTHING * (instant - rate)
+                last_count, last_time = count, now
+                block.draw([line(count, now)])
+                deadline = now + interval
+    except GeneratorExit:
+        # Laço interrompido: o item entregue por último não terminou
+        count -= 1
+        raise
+    finally:
+        # Estado final fica na tela, com a taxa média da execução inteira
+        now = clock()
+        rate = count / (now - start) if now > start else None
+        block.write(line(count, now) + "\n")
+        block.uninstall()
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONFIGURAÇÃO
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -898,6 +3891,9 @@ class Config:
         "default_animation_speed": 0.05,
         "terminal_title": "🦈 Shark Terminal",
         "custom_prompt": None,
+        "session_ttl": 900,
+        "color_depth": "auto",
+        "banner_gradient_mode": "flow",
     }
     
     @staticmethod
@@ -906,10 +3902,14 @@ class Config:
         for dir_path in [CONFIG_DIR, THEMES_DIR, BANNERS_DIR, ANIMATIONS_DIR]:
             dir_path.mkdir(parents=True, exist_ok=True)
     
-    @staticmethod
-    def load():
-        """Carrega configuração"""
-        Config.ensure_dirs()
+    # Formato do snapshot binário (incrementar ao mudar a estrutura)
+    SNAPSHOT_VERSION = 1
+    
+    @staticmethod
+    def read_json():
+        """Lê config.json mesclado com o padrão"""
+        import json
+        
         if CONFIG_FILE.exists():
             try:
                 with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
@@ -918,12 +3918,101 @@ class Config:
                 return Config.DEFAULT_CONFIG.copy()
         return Config.DEFAULT_CONFIG.copy()
     
+    @staticmethod
+    def source_signature():
+        """Assinatura do config.json (um único stat) ou None se não existir"""
+        return file_signature(CONFIG_FILE)
+    
+    @staticmethod
+    def build_snapshot(config, source):
+        """Monta o snapshot: configuração + dados derivados já calculados"""
+        def parse_rgb(color):
+            try:
+                return Colors.hex_to_rgb(color)
+            except (ValueError, TypeError, AttributeError):
+                return None
+        
+        template = config.get("custom_prompt") or Prompt.TEMPLATES.get(config.get("prompt_style"), Prompt.TEMPLATES["shark"])
+        if PromptTemplate.validate(template):
+            template = Prompt.TEMPLATES["shark"]
+        
+        return {
+            "version": Config.SNAPSHOT_VERSION,
+            "source": source,
+            "defaults": Config.DEFAULT_CONFIG,
+            "config": config,
+            "derived": {
+                "prompt_template": template,
+                "prompt_rgb": parse_rgb(config.get("prompt_color")) if config.get("prompt_color") else None,
+            },
+        }
+    
+    @staticmethod
+    def write_atomic(path, data):
+        """Grava bytes via arquivo temporário + rename (nunca deixa arquivo pela metade)"""
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    
+    @staticmethod
+    def write_snapshot(snapshot):
+        """Grava o snapshot binário no cache (falhas são ignoradas: é só cache)"""
+        import marshal
+        
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            Config.write_atomic(CONFIG_SNAPSHOT_FILE, marshal.dumps(snapshot))
+        except (OSError, ValueError):
+            pass
+    
+    @staticmethod
+    def snapshot():
+        """Snapshot da configuração, validado por um stat do config.json"""
+        import marshal
+        
+        source = Config.source_signature()
+        if source is None:
+            return Config.build_snapshot(Config.DEFAULT_CONFIG.copy(), None)
+        
+        try:
+            with open(CONFIG_SNAPSHOT_FILE, 'rb') as f:
+                snapshot = marshal.loads(f.read())
+            if (snapshot.get("version") == Config.SNAPSHOT_VERSION
+                    and snapshot.get("source") == source
+                    and snapshot.get("defaults") == Config.DEFAULT_CONFIG):
+                return snapshot
+        except (OSError, ValueError, EOFError, TypeError, AttributeError):
+            pass
+        
+        snapshot = Config.build_snapshot(Config.read_json(), source)
+        Config.write_snapshot(snapshot)
+        return snapshot
+    
+    @staticmethod
+    def load():
+        """Carrega configuração (somente leitura: não cria nada no disco além do cache)"""
+        return dict(Config.snapshot()["config"])
+    
     @staticmethod
     def save(config):
-        """Salva configuração"""
+        """Salva configuração (config.json e snapshot, ambos atomicamente)"""
+        import json
+        
         Config.ensure_dirs()
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        data = json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+        Config.write_atomic(CONFIG_FILE, data)
+        Config.write_snapshot(Config.build_snapshot({**Config.DEFAULT_CONFIG, **config}, Config.source_signature()))
+        
+        # Prompts nativos dos shells so sao recompilados quando a config muda
+        ShellIntegration.refresh_native_prompts(config)
+        
+        # Tema novo: paletas (e as cores do banner) compiladas e gravadas agora
+        try:
+            Palette.get(config.get("banner_colors") or Config.DEFAULT_CONFIG["banner_colors"]).compile()
+        except (ValueError, TypeError):
+            pass
+        Palette.compile_all()
     
     @staticmethod
     def reset():
@@ -931,6 +4020,258 @@ class Config:
         Config.save(Config.DEFAULT_CONFIG.copy())
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# DAEMON DE PROMPT - Responde prompt/banner a partir de estado quente
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class PromptDaemon:
+    """Processo persistente (por usuário) que renderiza prompt/banner via socket Unix"""
+    
+    # Protocolo: o cliente envia "comando\tcwd\tsessão\t<CLIENT_ENV>\tusuário\n" e recebe
+    # os bytes renderizados. Profundidade de cor, {terminal} e {user} vêm do ambiente do
+    # cliente, não do daemon. O campo sessão é ignorado: o daemon a deriva do processo do
+    # cliente (SO_PEERCRED)
+    REQUEST_LIMIT = 4096
+    CLIENT_ENV = ("COLORTERM", "TERM", "TERM_PROGRAM", "TERMUX_VERSION")
+    
+    def __init__(self, socket_path=None):
+        self.socket_path = Path(socket_path or DAEMON_SOCKET)
+        self.config = None
+        self.config_mtime = None
+        self.banner_cache = {}
+    
+    @staticmethod
+    def is_supported():
+        """Verifica se o sistema suporta sockets Unix"""
+        import socket
+        return hasattr(socket, 'AF_UNIX')
+    
+    @staticmethod
+    def request(command, cwd="", session="", socket_path=None, timeout=1.0):
+        """Envia um pedido ao daemon e retorna a resposta em bytes"""
+        import socket
+        
+        socket_path = Path(socket_path or DAEMON_SOCKET)
+        if private_dir(socket_path.parent) is None:
+            raise PermissionError(f"Diretório do socket inseguro: {socket_path.parent}")
+        
+        fields = [command, cwd, session] + [os.environ.get(key, '') for key in PromptDaemon.CLIENT_ENV]
+        fields.append(next((os.environ[key] for key in Prompt.USER_ENV if os.environ.get(key)), ''))
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path))
+            sock.sendall(("\t".join(fields) + "\n").encode('utf-8', 'surrogateescape'))
+            
+            chunks = []
+            while True:
+                data = sock.recv(65536)
+                if not data:
+                    break
+                chunks.append(data)
+        return b"".join(chunks)
+    
+    @staticmethod
+    def is_running(socket_path=None):
+        """Verifica se há um daemon respondendo no socket"""
+        try:
+            return PromptDaemon.request("ping", socket_path=socket_path, timeout=0.5) == b"pong"
+        except (OSError, AttributeError):
+            return False
+    
+    @staticmethod
+    def stop(socket_path=None):
+        """Pede para o daemon encerrar"""
+        try:
+            return PromptDaemon.request("stop", socket_path=socket_path) == b"ok"
+        except (OSError, AttributeError):
+            return False
+    
+    def refresh(self):
+        """Recarrega a configuração apenas se config.json mudou"""
+        try:
+            mtime = CONFIG_FILE.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        if self.config is None or mtime != self.config_mtime:
+            self.config = Config.load()
+            self.config_mtime = mtime
+            self.banner_cache.clear()
+    
+    def render_banner(self):
+        """Banner renderizado, reaproveitado enquanto config e banners não mudarem"""
+        try:
+            sources = tuple(sorted((f.name, f.stat().st_mtime_ns) for f in BANNERS_DIR.glob("*.txt")))
+        except OSError:
+            sources = ()
+        
+        key = (sources, Colors.DEPTH)
+        if key not in self.banner_cache:
+            if any(cached_sources != sources for cached_sources, _ in self.banner_cache):
+                self.banner_cache.clear()
+            self.banner_cache[key] = Banners.render_config(self.config) + "\n"
+        return self.banner_cache[key]
+    
+    @staticmethod
+    def peer_session(conn):
+        """Sessão do processo do cliente (tty + sid), como Security.session_id() calcularia nele
+        
+        Vem das credenciais do socket, nunca do pedido. None se o sistema não as informar.
+        """
+        import socket
+        import struct
+        
+        if not hasattr(socket, 'SO_PEERCRED'):
+            return None
+        
+        creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+        pid, uid, _ = struct.unpack("3i", creds)
+        if uid != os.getuid():
+            return None
+        
+        try:
+            fd = os.open(f"/proc/{pid}/fd/0", os.O_RDONLY | os.O_NOCTTY | os.O_NONBLOCK)
+        except OSError:
+            tty = ""
+        else:
+            try:
+                tty = os.ttyname(fd)
+            except OSError:
+                tty = ""
+            finally:
+                os.close(fd)
+        
+        try:
+            return f"{tty}|{os.getsid(pid)}"
+        except OSError:
+            return None
+    
+    @staticmethod
+    def parse(fields):
+        """Campos do pedido -> (colorterm, term, client); clientes antigos não enviam o ambiente"""
+        if len(fields) < 5:
+            return None, None, None  # Usa o ambiente do próprio daemon
+        environ = dict(zip(PromptDaemon.CLIENT_ENV, fields[3:]))
+        client = {"terminal": detect_terminal({key: value for key, value in environ.items() if value})}
+        if len(fields) > 7 and fields[7]:
+            client["user"] = fields[7]
+        return environ["COLORTERM"], environ["TERM"], client
+    
+    def handle(self, command, cwd, session=None, colorterm=None, term=None, client=None):
+        """Processa um pedido e retorna a resposta (bytes) ou None"""
+        if command == "ping":
+            return b"pong"
+        
+        self.refresh()
+        Colors.set_depth(Colors.resolve_depth(self.config.get("color_depth"), colorterm, term))
+        
+        # Protegido por senha: só responde para sessões com ticket válido
+        if self.config.get("password_protected", False) and command in ("prompt", "banner"):
+            if session is None:
+                return None  # Sessão desconhecida: sem resposta, o cliente confere o ticket sozinho
+            if not Security.has_valid_ticket(session):
+                return Security.locked_output(command).encode('utf-8')
+        
+        if command == "prompt":
+            text = Prompt.render_config(self.config, cwd=cwd or None, client=client)
+        elif command == "banner":
+            text = self.render_banner()
+        else:
+            return None
+        
+        return text.encode('utf-8', 'surrogateescape')
+    
+    def serve(self, detach=False):
+        """Inicia o daemon. Retorna False se já houver outro rodando
+        
+        Lança PermissionError se o diretório do socket não for privado do usuário.
+        """
+        import socket
+        import signal
+        
+        if private_dir(self.socket_path.parent, create=True) is None:
+            raise PermissionError(f"Diretório do socket inseguro: {self.socket_path.parent}")
+        
+        if PromptDaemon.is_running(self.socket_path):
+            return False
+        
+        if self.socket_path.exists():
+            self.socket_path.unlink()  # Socket órfão de um daemon morto
+        
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o077)
+        try:
+            server.bind(str(self.socket_path))
+        finally:
+            os.umask(old_umask)
+        server.listen(16)
+        
+        # O socket já aceita conexões antes do fork: o shell pode pedir o banner logo em seguida
+        if detach:
+            if os.fork() > 0:
+                server.close()
+                return True
+            os.setsid()
+            devnull = os.open(os.devnull, os.O_RDWR)
+            for fd in (0, 1, 2):
+                os.dup2(devnull, fd)
+            os.close(devnull)
+        
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        # Sem processos filhos soltos (SIGCHLD fica no padrão: returncode do git confiável)
+        GitInfo.refresh_in_thread = True
+        self.refresh()
+        
+        # "shark update" troca o arquivo: o daemon reinicia com o código novo
+        script = os.path.abspath(__file__)
+        code = file_signature(script)
+        restart = False
+        
+        try:
+            while True:
+                conn, _ = server.accept()
+                with conn:
+                    try:
+                        conn.settimeout(1.0)
+                        data = b""
+                        while b"\n" not in data and len(data) < PromptDaemon.REQUEST_LIMIT:
+                            chunk = conn.recv(1024)
+                            if not chunk:
+                                break
+                            data += chunk
+                        
+                        fields = data.decode('utf-8', 'surrogateescape').rstrip("\n").split("\t")
+                        command, cwd = (fields + [""])[:2]
+                        session = PromptDaemon.peer_session(conn)
+                        colorterm, term, client = PromptDaemon.parse(fields)
+                        if command == "stop":
+                            conn.sendall(b"ok")
+                            break
+                        
+                        response = self.handle(command, cwd, session, colorterm, term, client)
+                        if response:
+                            conn.sendall(response)
+                    except Exception:
+                        # Um pedido com erro nunca derruba o daemon; o cliente faz fallback
+                        pass
+                
+                if file_signature(script) != code:
+                    restart = True
+                    break
+        finally:
+            server.close()
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+        
+        if restart:
+            # Mesmo processo (já destacado) com o código novo; sem o arquivo, apenas encerra
+            try:
+                os.execv(sys.executable, [sys.executable, script, "serve"])
+            except OSError:
+                pass
+        return True
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # CLASSE PRINCIPAL SHARK
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -939,7 +4280,9 @@ class Shark:
     """🦈 Classe principal do Shark - Personalize TUDO!"""
     
     def __init__(self):
+        Config.ensure_dirs()
         self.config = Config.load()
+        Colors.set_depth(Colors.resolve_depth(self.config.get("color_depth")))
         self.colors = Colors()
         self.banners = Banners()
         self.animations = Animations()
@@ -947,10 +4290,7 @@ class Shark:
     
     def show_banner(self, animated=False):
         """Exibe o banner"""
-        banner_name = self.config.get("banner", "SHARK")
-        colors = self.config.get("banner_colors", ["#00BFFF", "#0080FF"])
-        
-        banner = Banners.render(banner_name, colors, bold=True)
+        banner = Banners.render_config(self.config)
         
         if animated and self.config.get("animations_enabled", True):
             for line in banner.split('\n'):
@@ -979,10 +4319,7 @@ class Shark:
     
     def get_prompt(self):
         """Retorna o prompt customizado"""
-        style = self.config.get("prompt_style", "shark")
-        color = self.config.get("prompt_color", "#00BFFF")
-        custom = self.config.get("custom_prompt")
-        return Prompt.render(style, custom, color)
+        return Prompt.render_config(self.config)
     
     # ═══════════════════════════════════════════════════════════════════════════
     # MENUS INTERATIVOS
@@ -1048,9 +4385,9 @@ class Shark:
         
         print(f"  {Colors.CYAN}Paletas disponíveis:{Colors.RESET}\n")
         
-        for i, (name, palette) in enumerate(Colors.PALETTES.items(), 1):
-            gradient = Colors.multi_gradient("██████████", palette)
-            print(f"  [{i:2}] {name:15} {gradient}")
+        for i, name in enumerate(Colors.PALETTES, 1):
+            print(f"  [{i:2}] {name:15} {Palette.get(name).swatch(10)}")
+        Palette.save()
         
         print(f"\n  [{len(Colors.PALETTES) + 1}] Cor personalizada (HEX)")
         print(f"  [{len(Colors.PALETTES) + 2}] Cor aleatória")
@@ -1098,7 +4435,6 @@ class Shark:
         print(f"\n{Colors.BOLD}  🖼️  Banners{Colors.RESET}\n")
         
         all_banners = Banners.get_all_banners()
-        colors = self.config.get("banner_colors", ["#00BFFF", "#0080FF"])
         
         print(f"  {Colors.CYAN}Banners disponíveis:{Colors.RESET}\n")
         
@@ -1107,6 +4443,7 @@ class Shark:
         
         print(f"\n  [C] Criar banner personalizado")
         print(f"  [T] Gerar banner a partir de texto")
+        print(f"  [G] Modo do gradiente ({self.config.get('banner_gradient_mode', 'flow')})")
         print(f"  [V] Visualizar banner atual")
         print(f"  [0] Voltar\n")
         
@@ -1121,10 +4458,13 @@ class Shark:
         elif choice == "T":
             self.generate_text_banner()
             return
+        elif choice == "G":
+            self.banner_gradient_menu()
+            return
         elif choice == "V":
             self.clear_screen()
             print(f"\n{Colors.BOLD}  Banner atual:{Colors.RESET}\n")
-            print(Banners.render(self.config.get("banner", "SHARK"), colors, bold=True))
+            self.show_banner()
             input("\n  Pressione Enter para continuar...")
             self.banner_menu()
             return
@@ -1142,6 +4482,39 @@ class Shark:
         input("\n  Pressione Enter para continuar...")
         self.interactive_menu()
     
+    def banner_gradient_menu(self):
+        """Escolhe o modo do gradiente 2D do banner, com preview de cada um"""
+        self.clear_screen()
+        print(f"\n{Colors.BOLD}  🌈 Modo do Gradiente{Colors.RESET}\n")
+        
+        name = self.config.get("banner", "SHARK")
+        colors = self.config.get("banner_colors", ["#00BFFF", "#0080FF"])
+        descriptions = {
+            "flow": "contínuo pelo texto (padrão)",
+            "horizontal": "por coluna",
+            "vertical": "por linha",
+            "diagonal": "na diagonal",
+            "radial": "do centro para as bordas",
+        }
+        
+        for i, mode in enumerate(Colors.GRADIENT_MODES, 1):
+            print(f"  [{i}] {mode:12} {Colors.DIM}{descriptions[mode]}{Colors.RESET}")
+            print(Banners.render(name, colors, bold=True, mode=mode))
+        
+        choice = input(f"\n  {Colors.hex('#00FF88')}Escolha (0 para voltar):{Colors.RESET} ").strip()
+        
+        try:
+            idx = int(choice) - 1
+            if 0 <= idx < len(Colors.GRADIENT_MODES):
+                self.config["banner_gradient_mode"] = Colors.GRADIENT_MODES[idx]
+                Config.save(self.config)
+                print(f"\n  {Colors.GREEN}✓ Modo '{Colors.GRADIENT_MODES[idx]}' selecionado!{Colors.RESET}")
+                input("\n  Pressione Enter para continuar...")
+        except ValueError:
+            pass
+        
+        self.banner_menu()
+    
     def create_custom_banner(self):
         """Cria um banner personalizado"""
         self.clear_screen()
@@ -1214,12 +4587,16 @@ class Shark:
             self.interactive_menu()
             return
         elif choice == "C":
-            print(f"\n  {Colors.DIM}Variáveis: {{user}}, {{host}}, {{cwd}}, {{time}}, {{date}}{Colors.RESET}")
+            print(f"\n  {Colors.DIM}Variáveis: {{user}}, {{host}}, {{cwd}}, {{time}}, {{date}}, {{git}}, {{branch}}, {{dirty}}{Colors.RESET}")
             custom = input("  Digite o template: ").strip()
-            if custom:
+            error = PromptTemplate.validate(custom) if custom else None
+            if error:
+                print(f"\n  {Colors.RED}✗ Template inválido: {error}{Colors.RESET}")
+            elif custom:
                 self.config["custom_prompt"] = custom
                 Config.save(self.config)
                 print(f"\n  {Colors.GREEN}✓ Prompt customizado salvo!{Colors.RESET}")
+                print(f"  {Colors.DIM}Preview:{Colors.RESET} {Prompt.render(custom_template=custom, color=self.config.get('prompt_color'))}")
         else:
             try:
                 idx = int(choice) - 1
@@ -1286,6 +4663,7 @@ class Shark:
             ("Glitch", lambda: Animations.glitch_text("SHARK", color=color)),
             ("Ciclo de Cores", lambda: Animations.color_cycle("★ SHARK ★", duration=3)),
             ("Rainbow Text", lambda: print(Colors.rainbow("🌈 SHARK RAINBOW 🌈", bold=True))),
+            ("Rainbow Scroll", lambda: Animations.rainbow_scroll("🌈 SHARK RAINBOW 🌈", duration=3, bold=True)),
             ("Matrix Rain", lambda: Animations.matrix_rain(duration=3)),
             ("Spinners", self.spinner_demo),
         ]
@@ -1360,6 +4738,7 @@ class Shark:
                 Security.save_credentials(new_pass)
                 self.config["password_protected"] = True
                 Config.save(self.config)
+                Security.issue_ticket(self.config.get("session_ttl", 900))
                 print(f"\n  {Colors.GREEN}✓ Senha {'alterada' if has_password else 'definida'}!{Colors.RESET}")
             else:
                 print(f"\n  {Colors.RED}✗ Senhas não coincidem{Colors.RESET}")
@@ -1367,6 +4746,7 @@ class Shark:
             current = Security.prompt_password("  Senha atual: ")
             creds = Security.load_credentials()
             if Security.verify_password(current, creds["salt"], creds["hash"]):
+                Security.revoke_ticket()
                 Security.remove_password()
                 self.config["password_protected"] = False
                 Config.save(self.config)
@@ -1387,7 +4767,8 @@ class Shark:
             print(f"  {Colors.DIM}{key}:{Colors.RESET} {value}")
         
         print(f"\n  {Colors.DIM}Arquivo: {CONFIG_FILE}{Colors.RESET}")
-        print(f"\n  [R] Resetar para padrão")
+        print(f"\n  [P] Profundidade de cor ({self.config.get('color_depth', 'auto')}, em uso: {Colors.DEPTH})")
+        print(f"  [R] Resetar para padrão")
         print(f"  [E] Exportar configuração")
         print(f"  [0] Voltar\n")
         
@@ -1402,7 +4783,19 @@ class Shark:
                 Config.reset()
                 self.config = Config.load()
                 print(f"\n  {Colors.GREEN}✓ Configuração resetada!{Colors.RESET}")
+        elif choice == "P":
+            print(f"\n  Opções: auto, {', '.join(Colors.DEPTHS)}")
+            print(f"  {Colors.DIM}auto detecta pelo COLORTERM/TERM; 256 e 16 aproximam as cores RGB{Colors.RESET}")
+            depth = input("  Profundidade: ").strip().lower()
+            if depth in ("auto",) + Colors.DEPTHS:
+                self.config["color_depth"] = depth
+                Colors.set_depth(Colors.resolve_depth(depth))
+                Config.save(self.config)
+                print(f"\n  {Colors.GREEN}✓ Profundidade de cor: {depth} (em uso: {Colors.DEPTH}){Colors.RESET}")
+            else:
+                print(f"\n  {Colors.RED}Opção inválida{Colors.RESET}")
         elif choice == "E":
+            import json
             print(f"\n{json.dumps(self.config, indent=2, ensure_ascii=False)}")
         
         input("\n  Pressione Enter para continuar...")
@@ -1423,8 +4816,9 @@ class Shark:
         
         # Gradientes
         print(f"\n  {Colors.BOLD}2. Gradientes:{Colors.RESET}")
-        for name, palette in list(Colors.PALETTES.items())[:5]:
-            print(f"     {name:12} {Colors.multi_gradient('████████████████', palette)}")
+        for name in list(Colors.PALETTES)[:5]:
+            print(f"     {name:12} {Palette.get(name).swatch(16)}")
+        Palette.save()
         time.sleep(0.3)
         
         # Barras de progresso
@@ -1715,6 +5109,122 @@ $Host.UI.RawUI.WindowTitle = "Shark Terminal"
         
         return True
     
+    # ═══════════════════════════════════════════════════════════════════════════
+    # CLIENTE DO DAEMON (Bash/Zsh)
+    # ═══════════════════════════════════════════════════════════════════════════
+    
+    @staticmethod
+    def generate_client_script():
+        """Gera o cliente minimo que os shells usam para falar com o daemon"""
+        shark_path = str(ShellIntegration.SHARK_SCRIPT)
+        
+        content = f'''# SHARK - Cliente do daemon de prompt (gerado automaticamente)
+import os
+import sys
+import stat
+import socket
+
+
+def connect():
+    """Conecta ao daemon, so se o diretorio do socket for nosso e privado (0700)"""
+    st = os.lstat({str(DAEMON_SOCKET.parent)!r})
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or stat.S_IMODE(st.st_mode) != 0o700:
+        raise OSError("diretorio do socket inseguro")
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(1.0)
+    sock.connect({str(DAEMON_SOCKET)!r})
+    return sock
+
+
+cmd = sys.argv[1] if len(sys.argv) > 1 else "prompt"
+if cmd == "start":
+    # Daemon ja rodando: basta a conexao, sem importar o shark. Senao sobe um em segundo plano
+    try:
+        connect().close()
+    except OSError:
+        if os.fork() == 0:
+            devnull = os.open(os.devnull, os.O_RDWR)
+            for fd in (0, 1, 2):
+                os.dup2(devnull, fd)
+            try:
+                os.execv(sys.executable, [sys.executable, {shark_path!r}, "serve", "--detach"])
+            finally:
+                os._exit(1)
+    sys.exit(0)
+
+try:
+    # Mesma identificacao de sessao de Security.session_id() (tickets de senha)
+    try:
+        tty = os.ttyname(0)
+    except OSError:
+        tty = ""
+    session = tty + "|" + str(os.getsid(0))
+    
+    # Terminal e usuario deste shell, nao os do daemon
+    fields = [cmd, os.getcwd(), session] + [os.environ.get(key, "") for key in {PromptDaemon.CLIENT_ENV!r}]
+    fields.append(next((os.environ[key] for key in {Prompt.USER_ENV!r} if os.environ.get(key)), ""))
+    
+    sock = connect()
+    sock.sendall(("\\t".join(fields) + "\\n").encode("utf-8", "surrogateescape"))
+    chunks = []
+    while True:
+        data = sock.recv(65536)
+        if not data:
+            break
+        chunks.append(data)
+    if not chunks:
+        raise OSError("resposta vazia")
+except Exception:
+    # Daemon ausente: shark_fast serve do cache; sem ele, importa o shark (bytecode em cache)
+    sys.argv = [{shark_path!r}, cmd]
+    sys.path.insert(0, os.path.dirname(sys.argv[0]))
+    try:
+        import shark_fast
+        shark_fast.main()
+        sys.exit(0)
+    except ImportError:
+        pass
+    try:
+        import shark
+    except ImportError:
+        os.execv(sys.executable, [sys.executable, sys.argv[0], cmd])
+    shark.main()
+    sys.exit(0)
+os.write(1, b"".join(chunks))
+'''
+        
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        CLIENT_SCRIPT.write_text(content, encoding='utf-8')
+        return CLIENT_SCRIPT
+    
+    @staticmethod
+    def write_native_prompt(shell, config=None):
+        """Grava o PS1/PROMPT nativo do shell; sem template compativel usa o prompt dinamico"""
+        config = config or Config.load()
+        native = Prompt.compile_native(
+            shell,
+            config.get("prompt_style", "shark"),
+            config.get("custom_prompt"),
+            config.get("prompt_color", "#00BFFF"),
+        )
+        
+        if shell == "bash":
+            line = f"PS1={native}" if native else "PS1='$(shark_prompt)'"
+        else:
+            line = f"PROMPT={native}" if native else "setopt PROMPT_SUBST\nPROMPT='$(shark_prompt)'"
+        
+        path = NATIVE_PROMPT_FILES[shell]
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# SHARK - Prompt {'nativo' if native else 'dinamico'} (gerado automaticamente)\n{line}\n", encoding='utf-8')
+        return path
+    
+    @staticmethod
+    def refresh_native_prompts(config=None):
+        """Recompila os prompts nativos ja instalados (chamado quando a config muda)"""
+        for shell, path in NATIVE_PROMPT_FILES.items():
+            if path.exists():
+                ShellIntegration.write_native_prompt(shell, config)
+    
     # ═══════════════════════════════════════════════════════════════════════════
     # BASH
     # ═══════════════════════════════════════════════════════════════════════════
@@ -1734,6 +5244,8 @@ $Host.UI.RawUI.WindowTitle = "Shark Terminal"
     def generate_bash_profile():
         """Gera codigo para Bash"""
         shark_path = str(ShellIntegration.SHARK_SCRIPT)
+        client_path = str(ShellIntegration.generate_client_script())
+        prompt_file = str(ShellIntegration.write_native_prompt("bash"))
         
         return f'''
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1746,16 +5258,19 @@ $Host.UI.RawUI.WindowTitle = "Shark Terminal"
 export TERM="xterm-256color"
 export FORCE_COLOR=1
 
-# Funcao para prompt do Shark
+# Daemon de prompt: mantem estado quente (o cliente so o inicia se nao estiver rodando)
+python3 -S "{client_path}" start 2>/dev/null
+
+# Funcao para prompt do Shark (cliente minimo; sem daemon usa shark.py)
 shark_prompt() {{
-    python3 "{shark_path}" prompt 2>/dev/null
+    python3 -S "{client_path}" prompt 2>/dev/null
 }}
 
 # Exibe banner ao iniciar
-python3 "{shark_path}" banner
+python3 -S "{client_path}" banner
 
-# Sobrescreve PS1
-export PS1='$(shark_prompt)'
+# Sobrescreve PS1 (nativo compilado da config; senao via shark_prompt)
+. "{prompt_file}" 2>/dev/null || PS1='$(shark_prompt)'
 
 # Aliases
 alias shark='python3 "{shark_path}"'
@@ -1845,6 +5360,8 @@ shark-rainbow() {{ python3 "{shark_path}" rainbow "$@"; }}
     def generate_zsh_profile():
         """Gera codigo para Zsh"""
         shark_path = str(ShellIntegration.SHARK_SCRIPT)
+        client_path = str(ShellIntegration.generate_client_script())
+        prompt_file = str(ShellIntegration.write_native_prompt("zsh"))
         
         return f'''
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1857,17 +5374,19 @@ shark-rainbow() {{ python3 "{shark_path}" rainbow "$@"; }}
 export TERM="xterm-256color"
 export FORCE_COLOR=1
 
-# Funcao para prompt do Shark
+# Daemon de prompt: mantem estado quente (o cliente so o inicia se nao estiver rodando)
+python3 -S "{client_path}" start 2>/dev/null
+
+# Funcao para prompt do Shark (cliente minimo; sem daemon usa shark.py)
 shark_prompt() {{
-    python3 "{shark_path}" prompt 2>/dev/null
+    python3 -S "{client_path}" prompt 2>/dev/null
 }}
 
 # Exibe banner ao iniciar
-python3 "{shark_path}" banner
+python3 -S "{client_path}" banner
 
-# Sobrescreve PROMPT
-setopt PROMPT_SUBST
-export PROMPT='$(shark_prompt)'
+# Sobrescreve PROMPT (nativo compilado da config; senao via shark_prompt)
+. "{prompt_file}" 2>/dev/null || {{ setopt PROMPT_SUBST; PROMPT='$(shark_prompt)'; }}
 
 # Aliases
 alias shark='python3 "{shark_path}"'
@@ -2084,6 +5603,12 @@ title Shark Terminal
         else:
             results['Bash'] = ShellIntegration.uninstall_bash()
             results['Zsh'] = ShellIntegration.uninstall_zsh()
+            
+            # Cliente do daemon, daemon e prompts nativos
+            PromptDaemon.stop()
+            for path in [CLIENT_SCRIPT, *NATIVE_PROMPT_FILES.values()]:
+                if path.exists():
+                    path.unlink()
         
         return results
     
@@ -2248,17 +5773,232 @@ def run_updater():
     subprocess.run([sys.executable, str(updater_path)])
 
 
+def run_colorize(cmd, args, config):
+    """rainbow/gradient: texto dos argumentos ou, com '-', filtro do stdin"""
+    if cmd == "rainbow":
+        colors = None  # Matizes da HueWheel
+    else:
+        colors = [arg for arg in args if arg.startswith("#")]
+        colors = colors or config.get("banner_colors") or ["#00BFFF", "#0080FF"]
+    
+    words = []
+    per_line = False
+    period = StreamColorizer.PERIOD
+    args = iter(args)
+    for arg in args:
+        if arg == "--lines":
+            per_line = True
+        elif arg == "--period":
+            value = next(args, "")
+            period = int(value) if value.isdigit() else 0
+            if period <= 0:
+                print(f"{Colors.RED}[X] --period precisa de um inteiro positivo (recebido: {value or 'nada'}){Colors.RESET}", file=sys.stderr)
+                print(f"{Colors.DIM}Uso: python shark.py {cmd} - [--lines] [--period N]{Colors.RESET}", file=sys.stderr)
+                sys.exit(1)
+        elif not (cmd == "gradient" and arg.startswith("#")):
+            words.append(arg)
+    
+    if words != ["-"]:
+        text = " ".join(words) if words else "SHARK"
+        if colors is None:
+            print(Colors.rainbow(text))
+            return
+        if len(colors) < 2:
+            colors = colors * 2
+        print(Colors.multi_gradient(text, colors))
+        return
+    
+    colorizer = StreamColorizer(colors, per_line=per_line, period=period)
+    try:
+        colorizer.run()
+    except KeyboardInterrupt:
+        pass
+    except BrokenPipeError:
+        # Leitor fechou o pipe (ex.: | head): encerra sem traceback
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+
+def run_highlight(args):
+    """highlight: filtro de regras de regex sobre o stdin (ou um arquivo)"""
+    import json
+    
+    rules = None
+    files = []
+    args = iter(args)
+    for arg in args:
+        if arg == "--rules":
+            path = next(args, None)
+            try:
+                rules = json.loads(Path(path).read_text(encoding="utf-8"))
+            except (TypeError, OSError, ValueError) as e:
+                print(f"{Colors.RED}[X] Não foi possível ler as regras ({path}): {e}{Colors.RESET}", file=sys.stderr)
+                sys.exit(1)
+        else:
+            files.append(arg)
+    
+    try:
+        highlighter = Highlighter(rules)
+    except ValueError as e:
+        print(f"{Colors.RED}[X] Regras inválidas: {e}{Colors.RESET}", file=sys.stderr)
+        sys.exit(1)
+    
+    try:
+        if files and files[0] != "-":
+            fd = os.open(files[0], os.O_RDONLY)
+            try:
+                pipe_stream(highlighter, fd)
+            finally:
+                os.close(fd)
+        else:
+            pipe_stream(highlighter)
+    except KeyboardInterrupt:
+        pass
+    except BrokenPipeError:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    except OSError as e:
+        print(f"{Colors.RED}[X] {e}{Colors.RESET}", file=sys.stderr)
+        sys.exit(1)
+
+
+def run_daemon(args):
+    """Inicia ou encerra o daemon de prompt"""
+    if not PromptDaemon.is_supported():
+        print(f"{Colors.RED}[X] O daemon requer sockets Unix (Linux, macOS, Termux){Colors.RESET}")
+        return
+    
+    if "--stop" in args:
+        if PromptDaemon.stop():
+            print(f"{Colors.GREEN}[V] Daemon encerrado{Colors.RESET}")
+        else:
+            print(f"{Colors.DIM}[-] Daemon nao estava rodando{Colors.RESET}")
+        return
+    
+    detach = "--detach" in args
+    try:
+        started = PromptDaemon().serve(detach=detach)
+    except PermissionError as e:
+        print(f"{Colors.RED}[X] {e} (precisa ser do usuario atual, modo 0700){Colors.RESET}")
+        sys.exit(1)
+    if not started and not detach:
+        print(f"{Colors.YELLOW}Daemon ja esta rodando em {DAEMON_SOCKET}{Colors.RESET}")
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # FUNCAO PRINCIPAL
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Comandos chamados pelo shell a cada prompt/terminal: sem Shark(), sem criar diretorios
+FAST_COMMANDS = {
+    "prompt": lambda snapshot: Prompt.render_snapshot(snapshot).encode('utf-8', 'surrogateescape'),
+    "banner": lambda snapshot: Banners.cached_render(snapshot["config"]),
+}
+
+
+def fast_entry():
+    """Entrada do cache do shark_fast.py: prompt pré-compilado e banner já renderizado
+    
+    Retorna None quando a configuração exige o caminho completo (senha).
+    """
+    snapshot = Config.snapshot()
+    config = snapshot["config"]
+    Colors.set_depth(Colors.resolve_depth(config.get("color_depth")))
+    if config.get("password_protected", False):
+        return None
+    
+    # Assinaturas lidas antes do render: uma mudança no meio invalida a entrada
+    deps = [(str(path), file_signature(path)) for path in [CONFIG_FILE, *Banners.sources(config)]]
+    
+    derived = snapshot["derived"]
+    try:
+        template = PromptTemplate.get(derived["prompt_template"], derived["prompt_rgb"])
+        parts, slots = template.parts, template.slots
+    except ValueError:
+        parts, slots = None, []
+    
+    return {
+        "deps": deps,
+        "parts": parts,
+        "slots": slots,
+        "values": {"system": SYSTEM, "terminal": TERMINAL},
+        "banner": Banners.cached_render(config),
+    }
+
+
+def write_output(data):
+    """Escreve bytes direto no stdout (uma unica syscall no caso comum)"""
+    sys.stdout.flush()
+    
+    if SYSTEM == 'windows':
+        # O console do Windows precisa da conversao feita pelo io do Python
+        sys.stdout.write(data.decode('utf-8', 'replace'))
+        sys.stdout.flush()
+        return
+    
+    view = memoryview(data)
+    fd = sys.stdout.fileno()
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def run_fast_command(cmd):
+    """Caminho rapido: carrega so o snapshot da configuracao e escreve a saida de uma vez"""
+    snapshot = Config.snapshot()
+    Colors.set_depth(Colors.resolve_depth(snapshot["config"].get("color_depth")))
+    
+    # Nunca pede senha aqui: sem ticket valido, apenas indica que esta bloqueado
+    if snapshot["config"].get("password_protected", False) and not Security.has_valid_ticket():
+        write_output(Security.locked_output(cmd).encode('utf-8'))
+        return
+    
+    write_output(FAST_COMMANDS[cmd](snapshot))
+
+
+def help_text():
+    """Texto de ajuda da linha de comando"""
+    return f"""
+{Colors.CYAN}SHARK - Sistema de Personalizacao TOTAL{Colors.RESET}
+
+{Colors.BOLD}Uso:{Colors.RESET}
+  python shark.py              Abre o menu interativo
+  python shark.py install      INSTALA no terminal (permanente)
+  python shark.py uninstall    Remove do terminal
+  python shark.py status       Verifica instalacao
+  python shark.py update       Atualiza via GitHub
+  python shark.py banner       Exibe o banner
+  python shark.py prompt       Exibe o prompt customizado
+  python shark.py colors       Demo de cores
+  python shark.py matrix       Efeito Matrix Rain
+  python shark.py rainbow [texto]  Texto com arco-iris
+  python shark.py gradient [texto] [#cor ...]  Texto com gradiente
+  python shark.py rainbow -    Colore o stdin (pipe; --lines, --period N)
+  python shark.py gradient - [#cor ...]  Gradiente no stdin (pipe)
+  python shark.py highlight [--rules regras.json] [arquivo]  Realça logs por regex
+  python shark.py typing [texto]   Efeito digitacao
+  python shark.py config       Mostra configuracao
+  python shark.py serve        Daemon de prompt (--detach, --stop)
+  python shark.py unlock       Desbloqueia a sessao (senha)
+  python shark.py lock         Bloqueia a sessao novamente
+
+{Colors.BOLD}Terminal:{Colors.RESET} {TERMINAL}
+{Colors.BOLD}Sistema:{Colors.RESET} {SYSTEM}
+{Colors.BOLD}Config:{Colors.RESET} {CONFIG_FILE}
+"""
+
+
 def main():
     """Funcao principal"""
+    if len(sys.argv) > 1 and sys.argv[1].lower() in FAST_COMMANDS:
+        run_fast_command(sys.argv[1].lower())
+        return
+    
+    import json
+    
     shark = Shark()
+    cmd = sys.argv[1].lower() if len(sys.argv) > 1 else None
     
-    # Verifica autenticação
-    if shark.config.get("password_protected", False):
-        if not Security.authenticate():
+    # Verifica autenticação (o daemon confere os tickets a cada pedido)
+    if shark.config.get("password_protected", False) and cmd not in ("serve", "lock"):
+        if not Security.authenticate(ttl=shark.config.get("session_ttl", 900)):
             sys.exit(1)
     
     # Comandos CLI
@@ -2266,46 +6006,41 @@ def main():
         cmd = sys.argv[1].lower()
         
         commands = {
-            "banner": lambda: shark.show_banner(),
-            "prompt": lambda: print(shark.get_prompt(), end=""),
             "colors": lambda: shark.full_demo(),
             "config": lambda: print(json.dumps(shark.config, indent=2)),
             "matrix": lambda: Animations.matrix_rain(duration=10),
-            "rainbow": lambda: print(Colors.rainbow(" ".join(sys.argv[2:]) if len(sys.argv) > 2 else "SHARK")),
+            "rainbow": lambda: run_colorize("rainbow", sys.argv[2:], shark.config),
+            "gradient": lambda: run_colorize("gradient", sys.argv[2:], shark.config),
+            "highlight": lambda: run_highlight(sys.argv[2:]),
             "typing": lambda: Animations.typing_effect(" ".join(sys.argv[2:]) if len(sys.argv) > 2 else "Hello Shark!"),
             "install": lambda: install_shark(),
             "uninstall": lambda: uninstall_shark(),
             "status": lambda: check_status(),
             "update": lambda: run_updater(),
+            "serve": lambda: run_daemon(sys.argv[2:]),
+            "unlock": lambda: print(f"{Colors.GREEN}✓ Sessao desbloqueada{Colors.RESET}"),
+            "lock": lambda: Security.revoke_ticket(),
         }
         
-        if cmd in commands:
+        if cmd in ("rainbow", "gradient") and "-" in sys.argv[2:]:
+            # Filtro de stdin: escreve direto no fd, em blocos grandes
+            commands[cmd]()
+        elif cmd == "matrix":
+            # MatrixRain já escreve só as células novas
+            commands[cmd]()
+        elif cmd in ("rainbow", "gradient", "typing"):
+            # Saída visual pesada: escapes redundantes removidos no caminho
+            with SGRWriter(sync_on_flush=False):
+                commands[cmd]()
+        elif cmd in commands:
             commands[cmd]()
         elif cmd in ("--help", "-h", "help"):
-            print(f"""
-{Colors.CYAN}SHARK - Sistema de Personalizacao TOTAL{Colors.RESET}
-
-{Colors.BOLD}Uso:{Colors.RESET}
-  python shark.py              Abre o menu interativo
-  python shark.py install      INSTALA no terminal (permanente)
-  python shark.py uninstall    Remove do terminal
-  python shark.py status       Verifica instalacao
-  python shark.py update       Atualiza via GitHub
-  python shark.py banner       Exibe o banner
-  python shark.py prompt       Exibe o prompt customizado
-  python shark.py colors       Demo de cores
-  python shark.py matrix       Efeito Matrix Rain
-  python shark.py rainbow [texto]  Texto com arco-iris
-  python shark.py typing [texto]   Efeito digitacao
-  python shark.py config       Mostra configuracao
-
-{Colors.BOLD}Terminal:{Colors.RESET} {TERMINAL}
-{Colors.BOLD}Sistema:{Colors.RESET} {SYSTEM}
-{Colors.BOLD}Config:{Colors.RESET} {CONFIG_FILE}
-""")
+            print(help_text())
         else:
             print(f"{Colors.RED}Comando não reconhecido. Use --help{Colors.RESET}")
     else:
+        # Sessão interativa: cache de paletas do disco antes do primeiro menu
+        Palette.store()
         shark.interactive_menu()
 
 
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+🦈 SHARK - Caminho rapido do prompt e do banner
+Serve "prompt" e "banner" a partir de um cache gravado pelo shark.py, sem importa-lo.
+Sem cache valido (ou com senha, template com git, Windows) usa o shark.py normalmente.
+
+Uso:
+  python -S shark_fast.py prompt
+  python -S shark_fast.py banner
+"""
+
+import os
+import sys
+import time
+
+# Formato do cache (incrementar ao mudar a estrutura da entrada)
+FAST_VERSION = 1
+
+# Variaveis de ambiente que mudam a saida (terminal e profundidade de cor)
+ENV_KEYS = ("COLORTERM", "TERM", "TERM_PROGRAM", "TERMUX_VERSION")
+
+# Entradas guardadas (uma por combinacao de terminal)
+MAX_ENTRIES = 8
+
+# Mesmos diretorios do shark.py (sem pathlib: o import custa mais que o prompt inteiro)
+HOME = os.path.expanduser("~")
+if os.environ.get('TERMUX_VERSION') is not None:
+    CACHE_DIR = os.path.join(HOME, ".shark", "cache")
+else:
+    CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(HOME, ".cache"), "shark")
+
+FAST_CACHE_FILE = os.path.join(CACHE_DIR, "fast.bin")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CACHE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def signature(path):
+    """(mtime, tamanho) do arquivo ou None se nao existir"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def read_cache():
+    """Cache inteiro (vazio se ausente, invalido ou de outra versao)"""
+    import marshal
+    
+    try:
+        with open(FAST_CACHE_FILE, 'rb') as f:
+            cache = marshal.loads(f.read())
+        if cache.get("version") == FAST_VERSION:
+            return cache
+    except (OSError, ValueError, EOFError, TypeError, AttributeError):
+        pass
+    return {"version": FAST_VERSION, "entries": {}}
+
+
+def lookup(key):
+    """Entrada valida para o ambiente atual (todas as dependencias com a mesma assinatura)"""
+    entry = read_cache()["entries"].get(key)
+    if entry is None:
+        return None
+    for path, expected in entry["deps"]:
+        if signature(path) != expected:
+            return None
+    return entry
+
+
+def store(key, entry):
+    """Grava a entrada (atomicamente; falhas sao ignoradas: e so cache)"""
+    import marshal
+    
+    cache = read_cache()
+    entries = cache["entries"]
+    entries.pop(key, None)
+    while len(entries) >= MAX_ENTRIES:
+        entries.pop(next(iter(entries)))
+    entries[key] = entry
+    
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_file = f"{FAST_CACHE_FILE}.{os.getpid()}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(marshal.dumps(cache))
+        os.replace(tmp_file, FAST_CACHE_FILE)
+    except (OSError, ValueError):
+        pass
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RENDER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def get_user(context):
+    """Usuario atual (mesma regra do getpass: variaveis de ambiente e depois pwd)"""
+    import getpass
+    return getpass.getuser()
+
+
+def get_cwd(context):
+    """Diretorio atual com a home abreviada para ~"""
+    cwd = os.getcwd()
+    if cwd.startswith(HOME):
+        cwd = "~" + cwd[len(HOME):]
+    return cwd
+
+
+def get_time(context, fmt):
+    """Hora/data a partir de um unico instante por render"""
+    if "now" not in context:
+        context["now"] = time.localtime()
+    return time.strftime(fmt, context["now"])
+
+
+# Variaveis que o caminho rapido sabe calcular (git e afins ficam com o shark.py)
+PROVIDERS = {
+    "user": get_user,
+    "host": lambda context: os.uname().nodename,
+    "cwd": get_cwd,
+    "system": lambda context: context["values"]["system"],
+    "terminal": lambda context: context["values"]["terminal"],
+    "time": lambda context: get_time(context, "%H:%M:%S"),
+    "date": lambda context: get_time(context, "%Y-%m-%d"),
+}
+
+
+def render_prompt(entry):
+    """Preenche o template pre-compilado. None se usar variaveis fora de PROVIDERS"""
+    if entry["parts"] is None or any(field not in PROVIDERS for _, field, _, _ in entry["slots"]):
+        return None
+    
+    context = {"values": entry["values"]}
+    parts = list(entry["parts"])
+    for index, field, spec, conversion in entry["slots"]:
+        value = PROVIDERS[field](context)
+        if conversion == "r":
+            value = repr(value)
+        elif conversion == "a":
+            value = ascii(value)
+        parts[index] = format(value, spec) if spec else str(value)
+    
+    return "".join(parts).encode('utf-8', 'surrogateescape')
+
+
+def render(cmd, entry):
+    """Saida do comando a partir da entrada do cache (None = usar o shark.py)"""
+    if cmd == "banner":
+        return entry["banner"]
+    return render_prompt(entry)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FUNCAO PRINCIPAL
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def write_output(data):
+    """Escreve bytes direto no stdout"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(1, view):]
+
+
+def run_full(cmd, key, refresh):
+    """Caminho completo: importa o shark.py (bytecode em cache) e, com refresh, grava a entrada nova"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+    import shark
+    
+    entry = shark.fast_entry() if refresh else None
+    if entry is None:
+        shark.run_fast_command(cmd)
+        return
+    
+    store(key, entry)
+    data = render(cmd, entry)
+    if data is None:
+        shark.run_fast_command(cmd)
+    else:
+        write_output(data)
+
+
+def main():
+    """Funcao principal"""
+    cmd = sys.argv[1].lower() if len(sys.argv) > 1 else "prompt"
+    if cmd not in ("prompt", "banner"):
+        print(f"Uso: {os.path.basename(sys.argv[0])} prompt|banner", file=sys.stderr)
+        sys.exit(2)
+    
+    # Windows: o console precisa da conversao feita pelo shark.py
+    if sys.platform == 'win32':
+        run_full(cmd, None, False)
+        return
+    
+    key = tuple(os.environ.get(name) for name in ENV_KEYS)
+    entry = lookup(key)
+    if entry is not None:
+        data = render(cmd, entry)
+        if data is not None:
+            write_output(data)
+            return
+    
+    # Sem entrada valida grava uma nova; com entrada (template com git) so delega
+    run_full(cmd, key, entry is None)
+
+
+if __name__ == "__main__":
+    main()
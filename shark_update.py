@@ -30,6 +30,7 @@ RELEASES_URL = f"{API_URL}/releases/latest"
 # Arquivos para atualizar
 FILES_TO_UPDATE = [
     "shark.py",
+    "shark_fast.py",
     "shark_update.py",
 ]
 
@@ -0,0 +1,61 @@
+"""
+🦈 SHARK - Testes do rainbow/gradient pela linha de comando
+"""
+
+import os
+import re
+import sys
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SHARK_SCRIPT = ROOT_DIR / "shark.py"
+sys.path.insert(0, str(ROOT_DIR))
+
+import shark  # noqa: E402
+
+
+class ColorizeCliTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        # HOME temporário: o teste nunca toca na configuração real
+        self.env = dict(os.environ, HOME=directory.name, USERPROFILE=directory.name,
+                        XDG_CACHE_HOME=directory.name, XDG_RUNTIME_DIR=directory.name,
+                        COLORTERM="truecolor")
+
+    def run_shark(self, *args, text=b"abc\n"):
+        return subprocess.run(
+            [sys.executable, str(SHARK_SCRIPT), *args],
+            input=text, capture_output=True, timeout=30, env=self.env,
+        )
+
+    def test_rejects_invalid_period(self):
+        for value in ("abc", "0", "-3"):
+            with self.subTest(value=value):
+                result = self.run_shark("rainbow", "-", "--period", value)
+                self.assertEqual(result.returncode, 1)
+                self.assertIn(b"--period", result.stderr)
+                self.assertEqual(result.stdout, b"")
+
+    def test_accepts_positive_period(self):
+        result = self.run_shark("gradient", "-", "--period", "12")
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(re.sub(rb"\x1b\[[0-9;]*m", b"", result.stdout), b"abc\n")
+
+    def test_rainbow_uses_hue_wheel(self):
+        shark.Colors.set_depth("truecolor")
+        result = self.run_shark("rainbow", "hello", "world")
+        self.assertEqual(result.stdout.decode("utf-8"), shark.Colors.rainbow("hello world") + "\n")
+
+        result = self.run_shark("rainbow", "-", "--period", "8", text=b"abcdefgh")
+        wheel = shark.HueWheel
+        expected = [wheel.escape(0), wheel.escape(180)]
+        self.assertEqual(re.findall(r"\x1b\[38;2;[0-9;]+m", result.stdout.decode("utf-8")), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+🦈 SHARK - Testes do filtro highlight (Highlighter)
+"""
+
+import os
+import sys
+import json
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SHARK_SCRIPT = ROOT_DIR / "shark.py"
+sys.path.insert(0, str(ROOT_DIR))
+
+import shark  # noqa: E402
+
+
+def strip(text):
+    """Texto sem as sequências SGR"""
+    import re
+    return re.sub(r"\x1b\[[0-9;]*m", "", text)
+
+
+class HighlighterTest(unittest.TestCase):
+
+    def test_rejects_rules_that_match_empty(self):
+        for pattern in ("b?", "^", "x*", "(?:a|)"):
+            with self.subTest(pattern=pattern):
+                with self.assertRaises(ValueError):
+                    shark.Highlighter([{"pattern": pattern, "color": "#FF0000"}])
+
+    def test_zero_width_hits_do_not_stall(self):
+        # Acertos de largura zero no \n de linhas vazias não podem segurar o laço
+        text = "abc\n\nxyz\n\n\nb"
+        for pattern in (r"\b", r"(?=\n)", "(?=b)"):
+            with self.subTest(pattern=pattern):
+                highlighter = shark.Highlighter([
+                    {"pattern": pattern, "color": "#FF0000"},
+                    {"pattern": "yz", "color": "#00FF00"},
+                ])
+                out = highlighter.feed(text[:7]) + highlighter.feed(text[7:]) + highlighter.finish()
+                self.assertEqual(strip(out), text)
+
+    def test_cli_rejects_empty_matching_rule(self):
+        with tempfile.TemporaryDirectory() as directory:
+            rules = Path(directory) / "rules.json"
+            rules.write_text(json.dumps([{"pattern": "b?", "color": "#FF0000"}]), encoding="utf-8")
+            # HOME temporário: o teste nunca toca na configuração real
+            env = dict(os.environ, HOME=directory, USERPROFILE=directory, XDG_RUNTIME_DIR=directory)
+            result = subprocess.run(
+                [sys.executable, str(SHARK_SCRIPT), "highlight", "--rules", str(rules)],
+                input=b"abc\n\nxyz\n", capture_output=True, timeout=30, env=env,
+            )
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("texto vazio", result.stdout.decode("utf-8") + result.stderr.decode("utf-8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
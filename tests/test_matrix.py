@@ -0,0 +1,89 @@
+"""
+🦈 SHARK - Testes da chuva Matrix: o terminal mostra o mesmo que o anel de linhas
+"""
+
+import re
+import sys
+import unittest
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+import shark  # noqa: E402
+
+TOKEN = re.compile(r"\x1b\[2J|\x1b\[H\x1bM|\x1b\[(\d+)(?:;(\d+))?H|\x1b\[(\d*)C|\x1b\[[0-9;]*m|[^\x1b]")
+
+
+class Screen:
+    """Terminal mínimo: só as sequências que o MatrixRain escreve"""
+
+    def __init__(self, width, height):
+        self.width, self.height = width, height
+        self.clear()
+        self.y = self.x = 0
+        self.sgr = ""
+        self.wrap = False
+
+    def clear(self):
+        self.cells = [[(" ", "")] * self.width for _ in range(self.height)]
+
+    def write(self, output):
+        position = 0
+        for match in TOKEN.finditer(output):
+            if match.start() != position:
+                raise AssertionError(f"sequência desconhecida: {output[position:position + 20]!r}")
+            position = match.end()
+            token = match.group()
+            if token == "\x1b[2J":
+                self.clear()
+            elif token == "\x1b[H\x1bM":
+                self.cells.insert(0, [(" ", "")] * self.width)
+                self.cells.pop()
+                self.y = self.x = 0
+                self.wrap = False
+            elif match.group(1):
+                self.y, self.x = int(match.group(1)) - 1, int(match.group(2) or 1) - 1
+                self.wrap = False
+            elif token.endswith("C"):
+                self.x = min(self.width - 1, self.x + int(match.group(3) or 1))
+                self.wrap = False
+            elif token.endswith("m"):
+                self.sgr = token
+            else:
+                # Escrever com o cursor parado na última coluna quebraria a linha
+                assert not self.wrap, "escrita depois da última coluna"
+                self.cells[self.y][self.x] = (token, self.sgr if token != " " else "")
+                if self.x == self.width - 1:
+                    self.wrap = True
+                else:
+                    self.x += 1
+        self.done = position == len(output)
+
+
+class MatrixRainTest(unittest.TestCase):
+
+    def test_screen_matches_rows(self):
+        shark.Colors.set_depth("truecolor")
+        for width, height in ((80, 24), (7, 3), (1, 1), (30, 2)):
+            with self.subTest(size=(width, height)):
+                rain = shark.MatrixRain(width, height, seed=5)
+                screen = Screen(width, height)
+                for _ in range(200):
+                    screen.write(rain.frame())
+                    self.assertTrue(screen.done)
+                    expected = [[(chars[x], rain.codes[level]) if level else (" ", "")
+                                 for x, level in enumerate(levels)] for levels, chars in rain.rows]
+                    self.assertEqual(screen.cells, expected)
+
+    def test_frame_writes_only_new_cells(self):
+        # Depois da rolagem, só a linha nova e as trocas de caractere: bem menos que redesenhar a tela
+        rain = shark.MatrixRain(80, 24, seed=1)
+        for _ in range(50):
+            rain.frame()
+        size = sum(len(rain.frame().encode("utf-8")) for _ in range(100)) / 100
+        self.assertLess(size, 80 * 24 / 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+🦈 SHARK - Testes do cache de paletas compiladas (palettes.bin)
+"""
+
+import os
+import sys
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SHARK_SCRIPT = ROOT_DIR / "shark.py"
+sys.path.insert(0, str(ROOT_DIR))
+
+import shark  # noqa: E402
+
+
+def custom(index):
+    """Lista de cores que não está em Colors.PALETTES"""
+    return [f"#{index:06X}", "#FFFFFE"]
+
+
+class PaletteStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        themes_dir = Path(directory.name) / "themes"
+        self.cache_file = themes_dir / "palettes.bin"
+        # Cache vazio em um diretório temporário: o teste nunca toca no cache real
+        for name, value in (("THEMES_DIR", themes_dir), ("PALETTE_CACHE_FILE", self.cache_file)):
+            patcher = mock.patch.object(shark, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        for name, value in (("_store", None), ("_dirty", False), ("_instances", {})):
+            patcher = mock.patch.object(shark.Palette, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_custom_lists_are_bounded(self):
+        shark.Palette.compile_all()
+        limit = shark.Palette.CUSTOM_LIMIT
+        for index in range(limit * 3):
+            shark.Palette.get(custom(index)).compile()
+        # Usada de novo: volta para o fim da fila
+        shark.Palette._instances.clear()
+        shark.Palette.get(custom(0))
+        shark.Palette.save()
+        
+        shark.Palette._store = None
+        stored = set(shark.Palette.store())
+        named = {tuple(colors) for colors in shark.Colors.PALETTES.values()}
+        self.assertLessEqual(named, stored)
+        expected = {tuple(custom(index)) for index in range(limit * 3 - limit + 1, limit * 3)} | {tuple(custom(0))}
+        self.assertEqual(stored - named, expected)
+
+    def test_library_use_does_not_write(self):
+        shark.Palette.get(custom(1)).compile()
+        shark.Palette.get("ocean").swatch(16)
+        self.assertFalse(self.cache_file.exists())
+        shark.Palette.save()
+        self.assertTrue(self.cache_file.exists())
+
+    def test_library_process_leaves_no_cache(self):
+        home = self.cache_file.parent.parent
+        env = dict(os.environ, HOME=str(home), USERPROFILE=str(home), XDG_CACHE_HOME=str(home / "cache"))
+        code = "import shark; shark.Animations.gradient_bar(0.5, 32); shark.Palette.get(['#123456', '#654321']).compile()"
+        subprocess.run([sys.executable, "-c", code], cwd=str(ROOT_DIR), env=env, check=True, timeout=30)
+        self.assertEqual(list(home.rglob("palettes.bin")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
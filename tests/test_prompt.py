@@ -0,0 +1,56 @@
+"""
+🦈 SHARK - Testes do prompt nativo (PS1/PROMPT estático)
+"""
+
+import re
+import sys
+import unittest
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+import shark  # noqa: E402
+
+
+class CompileNativeTest(unittest.TestCase):
+
+    def test_plain_dollar_is_kept(self):
+        self.assertEqual(shark.Prompt.compile_native("bash", custom_template="{cwd} $ "), r"'\w $ '")
+        self.assertEqual(shark.Prompt.compile_native("zsh", custom_template="{cwd} $ "), "$'%~ $ '")
+
+    def test_dollar_before_field_falls_back(self):
+        # "$" colado numa variável viraria expansão do shell ($usuario, $Linux)
+        for shell in ("bash", "zsh"):
+            for template in ("{cwd}${user} ", "{cwd}${system}", "${host}"):
+                with self.subTest(shell=shell, template=template):
+                    self.assertIsNone(shark.Prompt.compile_native(shell, custom_template=template))
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+class DaemonClientTest(unittest.TestCase):
+
+    def fields(self, user="alice", **environ):
+        values = [environ.get(key, "") for key in shark.PromptDaemon.CLIENT_ENV]
+        return ["prompt", "/tmp", "1|2"] + values + [user]
+
+    def test_parse_uses_client_environment(self):
+        colorterm, term, client = shark.PromptDaemon.parse(self.fields(TERM="screen", TERM_PROGRAM="vscode"))
+        self.assertEqual((colorterm, term), ("", "screen"))
+        self.assertEqual(client, {"terminal": "vscode", "user": "alice"})
+
+    def test_parse_without_user(self):
+        _, _, client = shark.PromptDaemon.parse(self.fields(user="", TERMUX_VERSION="0.118"))
+        self.assertEqual(client, {"terminal": "termux"})
+
+    def test_old_client_falls_back_to_daemon(self):
+        self.assertEqual(shark.PromptDaemon.parse(["prompt", "/tmp", "1|2"]), (None, None, None))
+
+    def test_prompt_renders_client_values(self):
+        config = {"custom_prompt": "{user}@{terminal} $ ", "prompt_colors": ["#ffffff"]}
+        _, _, client = shark.PromptDaemon.parse(self.fields(user="bob", TERM="screen"))
+        text = shark.Prompt.render_config(config, client=client)
+        self.assertEqual(re.sub(r"\033\[[0-9;]*m", "", text), "bob@screen $ ")
@@ -0,0 +1,42 @@
+"""
+🦈 SHARK - Testes do FrameScheduler com intervalo zero
+"""
+
+import io
+import sys
+import asyncio
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+import shark  # noqa: E402
+
+
+class ZeroDelayTest(unittest.TestCase):
+
+    def test_unthrottled_frames(self):
+        scheduler = shark.FrameScheduler.every(0, frames=5)
+        self.assertEqual(list(scheduler), [0, 1, 2, 3, 4])
+        self.assertEqual(scheduler.dropped, 0)
+
+    def test_unthrottled_duration(self):
+        scheduler = shark.FrameScheduler(fps=0, duration=0.05)
+        self.assertGreater(len(list(scheduler)), 1)
+        self.assertGreaterEqual(scheduler.elapsed, 0.05)
+
+    def test_animations_accept_zero_delay(self):
+        # Antes do agendador, delay/speed = 0 rodava sem dormir
+        output = io.StringIO()
+        with redirect_stdout(output):
+            shark.Animations.fade_in("abc", steps=4, delay=0)
+            shark.Animations.color_cycle("abc", duration=0.02, speed=0)
+            shark.Animations.rainbow_scroll("abc", duration=0.02, speed=0)
+            asyncio.run(shark.AsyncAnimations.typing_effect("abc", delay=0))
+        self.assertIn("abc", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
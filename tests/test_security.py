@@ -0,0 +1,118 @@
+"""
+🦈 SHARK - Testes dos tickets de sessão e do prompt bloqueado
+"""
+
+import os
+import sys
+import json
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SHARK_SCRIPT = ROOT_DIR / "shark.py"
+FAST_SCRIPT = ROOT_DIR / "shark_fast.py"
+sys.path.insert(0, str(ROOT_DIR))
+
+import shark  # noqa: E402
+
+SESSION = "/dev/pts/7|4242"
+
+
+class TicketTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        home = Path(directory.name)
+        # Diretórios temporários: o teste nunca toca na senha nem nos tickets reais
+        for name, value in (("CONFIG_DIR", home / "config"), ("CREDENTIALS_FILE", home / "config" / ".credentials"),
+                            ("RUNTIME_DIR", home / "run" / "shark")):
+            patcher = mock.patch.object(shark, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(shark.Security, "session_id", staticmethod(lambda: SESSION))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        shark.Security.save_credentials("segredo")
+
+    def test_issue_and_verify(self):
+        self.assertFalse(shark.Security.has_valid_ticket())
+        path = shark.Security.issue_ticket(60)
+        self.assertEqual(path.stat().st_mode & 0o777, 0o600)
+        self.assertEqual(shark.RUNTIME_DIR.stat().st_mode & 0o777, 0o700)
+        self.assertTrue(shark.Security.has_valid_ticket())
+        self.assertFalse(shark.Security.has_valid_ticket("/dev/pts/8|4242"))
+
+        self.assertTrue(shark.Security.revoke_ticket())
+        self.assertFalse(shark.Security.has_valid_ticket())
+
+    def test_authenticate_uses_ticket(self):
+        shark.Security.issue_ticket(60)
+        with mock.patch.object(shark.Security, "prompt_password", side_effect=AssertionError("pediu senha")):
+            self.assertTrue(shark.Security.authenticate(ttl=60))
+
+    def test_password_change_invalidates(self):
+        shark.Security.issue_ticket(60)
+        shark.Security.save_credentials("outra")
+        self.assertFalse(shark.Security.has_valid_ticket())
+
+        shark.Security.issue_ticket(60)
+        shark.Security.remove_password()
+        self.assertFalse(shark.Security.has_valid_ticket())
+
+    def test_rejects_tampered_or_expired(self):
+        path = shark.Security.issue_ticket(60)
+        expires, mac = path.read_text(encoding="utf-8").split("\n")
+        forged_mac = ("0" if mac[0] != "0" else "1") + mac[1:]
+
+        key = shark.Security.read_key()
+        past = str(int(expires) - 3600)
+        cases = {
+            "mac": f"{expires}\n{forged_mac}",
+            "validade": f"{int(expires) + 3600}\n{mac}",
+            "expirado": f"{past}\n{shark.Security.ticket_mac(key, SESSION, past)}",
+            "lixo": "abc",
+        }
+        for name, content in cases.items():
+            with self.subTest(case=name):
+                path.write_text(content, encoding="utf-8")
+                self.assertFalse(shark.Security.has_valid_ticket())
+
+
+class LockedPromptTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        home = Path(directory.name)
+        self.env = dict(os.environ, HOME=str(home), USERPROFILE=str(home),
+                        XDG_CACHE_HOME=str(home / ".cache"), XDG_RUNTIME_DIR=str(home / "run"))
+        config_dir = home / ".config" / "shark"
+        config_dir.mkdir(parents=True)
+        (config_dir / "config.json").write_text(json.dumps({"password_protected": True}), encoding="utf-8")
+        with mock.patch.object(shark, "CONFIG_DIR", config_dir), \
+                mock.patch.object(shark, "CREDENTIALS_FILE", config_dir / ".credentials"):
+            shark.Security.save_credentials("segredo")
+
+    def test_prompt_does_not_block(self):
+        # Sem ticket: saída bloqueada na hora, sem ler a senha do stdin
+        for script, flags in ((SHARK_SCRIPT, ()), (FAST_SCRIPT, ("-S",))):
+            for cmd in ("prompt", "banner"):
+                with self.subTest(script=script.name, cmd=cmd):
+                    result = subprocess.run(
+                        [sys.executable, *flags, str(script), cmd], stdin=subprocess.PIPE,
+                        capture_output=True, timeout=30, env=self.env,
+                    )
+                    self.assertEqual(result.returncode, 0)
+                    output = result.stdout.decode("utf-8")
+                    if cmd == "prompt":
+                        self.assertEqual(output, shark.Security.LOCKED_PROMPT)
+                    else:
+                        self.assertIn("shark unlock", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+🦈 SHARK - Testes do SGROptimizer: a saída otimizada pinta as mesmas células
+"""
+
+import io
+import sys
+import random
+import unittest
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+import shark  # noqa: E402
+
+# Pedaços de entrada: texto, espaços, quebras e SGRs (combinados, resets, 256/truecolor)
+PIECES = [
+    "a", "b", "é", " ", "  ", "\n",
+    "\x1b[0m", "\x1b[m", "\x1b[1m", "\x1b[2m", "\x1b[22m", "\x1b[1;31m", "\x1b[3m", "\x1b[23m",
+    "\x1b[4m", "\x1b[21m", "\x1b[24m", "\x1b[5m", "\x1b[25m", "\x1b[7m", "\x1b[27m", "\x1b[9m",
+    "\x1b[29m", "\x1b[53m", "\x1b[55m", "\x1b[32m", "\x1b[92m", "\x1b[39m", "\x1b[44m", "\x1b[49m",
+    "\x1b[38;5;208m", "\x1b[48;5;17m", "\x1b[38;2;1;2;3m", "\x1b[48;2;9;8;7m", "\x1b[39;49m",
+]
+
+DEFAULT = {"bold": False, "dim": False, "italic": False, "underline": 0, "blink": 0, "reverse": False,
+           "hidden": False, "strike": False, "overline": False, "fg": "39", "bg": "49"}
+
+# O que aparece numa célula em branco (com vídeo reverso, a cor de frente também)
+BLANK = ("underline", "strike", "overline", "bg", "reverse")
+
+SIMPLE = {
+    1: ("bold", True), 2: ("dim", True), 3: ("italic", True), 4: ("underline", 1), 5: ("blink", 5),
+    6: ("blink", 6), 7: ("reverse", True), 8: ("hidden", True), 9: ("strike", True), 21: ("underline", 2),
+    23: ("italic", False), 24: ("underline", 0), 25: ("blink", 0), 27: ("reverse", False),
+    28: ("hidden", False), 29: ("strike", False), 39: ("fg", "39"), 49: ("bg", "49"),
+    53: ("overline", True), 55: ("overline", False),
+}
+
+
+def cells(output):
+    """Terminal mínimo: (caractere, atributos visíveis nele) por célula, e o estado final"""
+    state = dict(DEFAULT)
+    result = []
+    position = 0
+    while position < len(output):
+        if output.startswith("\x1b[", position):
+            end = output.index("m", position)
+            values = [int(value) if value else 0 for value in output[position + 2:end].split(";")]
+            index = 0
+            while index < len(values):
+                code = values[index]
+                index += 1
+                if code == 0:
+                    state = dict(DEFAULT)
+                elif code == 22:
+                    state["bold"] = state["dim"] = False
+                elif code in SIMPLE:
+                    key, value = SIMPLE[code]
+                    state[key] = value
+                elif 30 <= code <= 37 or 90 <= code <= 97:
+                    state["fg"] = str(code)
+                elif 40 <= code <= 47 or 100 <= code <= 107:
+                    state["bg"] = str(code)
+                else:
+                    size = 2 if values[index] == 5 else 4
+                    color = ";".join(str(value) for value in values[index - 1:index + size])
+                    state["fg" if code == 38 else "bg"] = color
+                    index += size
+            position = end + 1
+            continue
+
+        char = output[position]
+        position += 1
+        if char == "\n":
+            result.append((char, None))
+        elif char == " ":
+            keys = list(DEFAULT) if state["reverse"] else BLANK
+            result.append((char, {key: state[key] for key in keys}))
+        else:
+            result.append((char, dict(state)))
+    return result, state
+
+
+class SGROptimizerTest(unittest.TestCase):
+
+    def test_batch_and_stream_render_same_cells(self):
+        rnd = random.Random(8)
+        for trial in range(300):
+            text = "".join(rnd.choice(PIECES) for _ in range(rnd.randint(0, 80)))
+            expected = cells(text)
+
+            batch = shark.SGROptimizer.optimize(text)
+
+            stream = io.StringIO()
+            writer = shark.SGRWriter(stream)
+            position = 0
+            while position < len(text):
+                size = rnd.randint(1, 12)
+                writer.write(text[position:position + size])
+                position += size
+            writer.close()
+
+            with self.subTest(trial=trial, text=text):
+                self.assertEqual(cells(batch), expected)
+                self.assertEqual(cells(stream.getvalue()), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
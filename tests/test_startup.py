@@ -0,0 +1,95 @@
+"""
+🦈 SHARK - Testes do caminho rápido (shark_fast.py) e do orçamento de inicialização
+"""
+
+import os
+import sys
+import json
+import time
+import statistics
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SHARK_SCRIPT = ROOT_DIR / "shark.py"
+FAST_SCRIPT = ROOT_DIR / "shark_fast.py"
+
+# Mediana quente do prompt (ms); SHARK_PROMPT_BUDGET_MS ajusta em máquinas lentas
+BUDGET_MS = float(os.environ.get("SHARK_PROMPT_BUDGET_MS", "25"))
+RUNS = 9
+
+
+@unittest.skipIf(sys.platform == "win32", "o caminho rápido delega ao shark.py no Windows")
+class FastPathTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.home = Path(directory.name)
+        # HOME temporário: o teste nunca toca na configuração real
+        self.env = dict(
+            os.environ,
+            HOME=str(self.home),
+            USERPROFILE=str(self.home),
+            XDG_CACHE_HOME=str(self.home / ".cache"),
+            XDG_RUNTIME_DIR=str(self.home / "run"),
+        )
+
+    def run_script(self, script, cmd, *flags):
+        result = subprocess.run(
+            [sys.executable, *flags, str(script), cmd],
+            cwd=str(self.home), env=self.env, stdin=subprocess.DEVNULL,
+            capture_output=True, timeout=30, check=True,
+        )
+        return result.stdout
+
+    def test_output_matches_shark(self):
+        for cmd in ("prompt", "banner"):
+            with self.subTest(cmd=cmd):
+                expected = self.run_script(SHARK_SCRIPT, cmd)
+                # Primeira execução grava o cache, a segunda é servida por ele
+                self.assertEqual(self.run_script(FAST_SCRIPT, cmd, "-S"), expected)
+                self.assertEqual(self.run_script(FAST_SCRIPT, cmd, "-S"), expected)
+
+    def test_config_change_invalidates_cache(self):
+        self.run_script(FAST_SCRIPT, "prompt", "-S")
+        config_dir = self.home / ".config" / "shark"
+        config_dir.mkdir(parents=True)
+        (config_dir / "config.json").write_text(json.dumps({"prompt_style": "simple"}), encoding="utf-8")
+        self.assertEqual(self.run_script(FAST_SCRIPT, "prompt", "-S"), self.run_script(SHARK_SCRIPT, "prompt"))
+
+    def test_custom_banner_change_invalidates_cache(self):
+        banners_dir = self.home / ".config" / "shark" / "banners"
+        banners_dir.mkdir(parents=True)
+        (banners_dir.parent / "config.json").write_text(json.dumps({"banner": "MYBANNER"}), encoding="utf-8")
+        # Nome com maiúsculas: o banner é achado sem diferenciar, o cache também precisa achar
+        banner_file = banners_dir / "MyBanner.txt"
+        banner_file.write_text("AAA\n", encoding="utf-8")
+        self.run_script(FAST_SCRIPT, "banner", "-S")
+        banner_file.write_text("BBBB\n", encoding="utf-8")
+        self.assertEqual(self.run_script(FAST_SCRIPT, "banner", "-S"), self.run_script(SHARK_SCRIPT, "banner"))
+        self.assertIn(b"B", self.run_script(SHARK_SCRIPT, "banner"))
+
+    def test_read_only_outside_cache(self):
+        self.run_script(FAST_SCRIPT, "prompt", "-S")
+        self.run_script(FAST_SCRIPT, "banner", "-S")
+        self.assertEqual(sorted(path.name for path in self.home.iterdir()), [".cache"])
+
+    def test_warm_prompt_budget(self):
+        for _ in range(2):
+            self.run_script(FAST_SCRIPT, "prompt", "-S")
+
+        timings = []
+        for _ in range(RUNS):
+            start = time.perf_counter()
+            self.run_script(FAST_SCRIPT, "prompt", "-S")
+            timings.append((time.perf_counter() - start) * 1000)
+
+        median = statistics.median(timings)
+        self.assertLess(median, BUDGET_MS, f"prompt quente: {median:.1f} ms (orçamento {BUDGET_MS:.0f} ms)")
+
+
+if __name__ == "__main__":
+    unittest.main()